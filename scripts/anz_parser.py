@@ -3,12 +3,22 @@ ANZ Credit Card Statement Parser for FY24-25
 Extracts transactions from ANZ Frequent Flyer Black statements
 """
 
-import fitz
+import argparse
+import heapq
+import os
 import re
-import csv
+import time
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import fitz  # PyMuPDF
 from tax_categories import categorise_transaction, is_foreign_currency, is_high_value
+from text_cache import disable_cache, pdf_page_texts
+from transaction_table import TransactionTable, disable_parquet, save_table
 
 # ANZ statement folder
 STATEMENTS_DIR = Path("5. Bank Statements/FY24-25")
@@ -25,6 +35,60 @@ AMOUNT_PATTERN = re.compile(r'^\$?([\d,]+\.\d{2})\s*$')
 
 # Foreign currency line pattern
 FOREIGN_PATTERN = re.compile(r'([\d.]+)\s+(USD|EUR|GBP|NZD)')
+CURRENCY_CODE = re.compile(r'USD|EUR|GBP|NZD')  # Cheap pre-check for FOREIGN_PATTERN
+
+# Line token kinds: a page tokenizes to a bytes string of these, one byte
+# per non-blank line. FOREIGN is a text line holding a foreign amount.
+DATE, CARD, AMOUNT, TEXT, FOREIGN = b'D', b'C', b'A', b'T', b'F'
+
+# DATE_PATTERN, CARD_PATTERN and AMOUNT_PATTERN as one alternation, so a
+# stripped line is classified with a single fullmatch
+LINE_TOKEN = re.compile(r'(?P<D>\d{2}/\d{2}/\d{4})|(?P<C>\d{4})|\$?(?P<A>[\d,]+\.\d{2})')
+
+# Token sequence of a transaction: processed date, transaction date, card,
+# description (any line), amount, balance. A lookahead, so candidates may
+# overlap and the parser decides where the next one can start.
+TRANSACTION_TOKENS = re.compile(b'(?=' + DATE + DATE + CARD + b'.' + AMOUNT + AMOUNT + b')', re.DOTALL)
+
+# Description lines that are column headers, not transactions
+HEADER_ROWS = {'Transaction Details', 'Amount ($A)', 'Balance'}
+
+# Layout-aware parsing: the transaction table's columns, left to right, and
+# the kind of token each must hold on a transaction row (None = any text)
+COLUMNS = ("date_processed", "date_transaction", "card_used", "description", "amount", "balance")
+COLUMN_KINDS = (DATE, DATE, CARD, None, AMOUNT, AMOUNT)
+
+# Words whose vertical centres are this close (in points) share a row
+ROW_TOLERANCE = 3.0
+
+# Column kinds of the transaction table (see transaction_table.py): parsed
+# fields, then the fields categorise_all_transactions() adds
+ANZ_COLUMNS = {
+    "date_processed": "code",
+    "date_transaction": "code",
+    "card_used": "code",
+    "owner": "code",
+    "description": "code",
+    "amount": "money",
+    "balance": "money",
+    "foreign_currency": "code",
+    "source_file": "code",
+}
+CATEGORY_COLUMNS = {
+    "category": "code",
+    "category_description": "code",
+    "is_deductible": "bool",
+    "is_income": "bool",
+    "work_use_percent": "int",
+    "category_notes": "code",
+    "matched_keyword": "code",
+    "is_foreign": "bool",
+    "is_high_value": "bool",
+    "category_owner": "code",
+}
+
+# strptime formats of the date columns in the exports (typed in Parquet)
+EXPORT_DATE_FORMATS = {"date_transaction": "%d/%m/%Y"}
 
 # Card numbers and their owners (from statement)
 CARD_OWNERS = {
@@ -43,13 +107,45 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%d/%m/%Y")
 
 
+def date_from_token(date_str: str) -> datetime:
+    """parse_date() for a DATE token (DD/MM/YYYY digits) by slicing, without strptime."""
+    if not date_str.isascii():
+        return parse_date(date_str)
+    return datetime(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+
+
 def is_in_fy(date: datetime) -> bool:
     """Check if date is within FY24-25."""
     return FY_START <= date <= FY_END
 
 
-def extract_transactions_from_pdf(pdf_path: Path) -> list[dict]:
-    """Extract all transactions from an ANZ statement PDF.
+def tokenize_page(text: str) -> Tuple[bytes, List[str], List[str]]:
+    """
+    Classify each non-blank line of a page exactly once.
+    
+    Returns (kinds, lines, values): one kind byte per stripped line, the
+    lines, and each line's captured value (the amount digits for AMOUNT,
+    'X.XX CUR' for FOREIGN, the line itself otherwise).
+    """
+    lines = [line for line in map(str.strip, text.split('\n')) if line]
+    kinds = bytearray(TEXT * len(lines))
+    values = lines[:]
+    for i, match in enumerate(map(LINE_TOKEN.fullmatch, lines)):
+        if match:
+            kinds[i] = ord(match.lastgroup)
+            values[i] = match.group(match.lastgroup)
+        elif CURRENCY_CODE.search(lines[i]):
+            foreign = FOREIGN_PATTERN.search(lines[i])
+            if foreign:
+                kinds[i] = ord(FOREIGN)
+                values[i] = f"{foreign.group(1)} {foreign.group(2)}"
+    return bytes(kinds), lines, values
+
+
+def iter_page_transactions(text: str, source_file: str) -> Iterator[dict]:
+    """
+    Yield the FY24-25 transactions on one page, in a single forward pass
+    over its tokens.
     
     ANZ statements have data in columns that extract as separate lines:
     Line 1: Date Processed (DD/MM/YYYY)
@@ -61,174 +157,308 @@ def extract_transactions_from_pdf(pdf_path: Path) -> list[dict]:
     
     Some transactions have continuation lines for foreign currency.
     """
-    transactions = []
-    doc = fitz.open(pdf_path)
+    kinds, lines, values = tokenize_page(text)
+    resume = 0  # First line the next transaction may start on
+    for candidate in TRANSACTION_TOKENS.finditer(kinds):
+        i = candidate.start()
+        if i < resume:
+            continue
+        
+        # Skip header rows
+        description = lines[i + 3]
+        if description in HEADER_ROWS:
+            continue
+        
+        # Skip non-transactions (fees sometimes have different patterns)
+        if 'INCL OVERSEAS' in description:
+            resume = i + 6
+            continue
+        
+        date_transaction = values[i + 1]
+        try:
+            tx_date = date_from_token(date_transaction)
+        except ValueError:
+            continue
+        
+        resume = i + 6  # Move past this transaction
+        
+        # Only include FY24-25 transactions
+        if not is_in_fy(tx_date):
+            continue
+        
+        card_used = values[i + 2]
+        yield {
+            "date_processed": values[i],
+            "date_transaction": date_transaction,
+            "card_used": card_used,
+            "owner": CARD_OWNERS.get(card_used, "Unknown"),
+            "description": description,
+            "amount": parse_amount(values[i + 4]),
+            "balance": parse_amount(values[i + 5]),
+            # Foreign currency on the following line
+            "foreign_currency": values[i + 6] if kinds[i + 6:i + 7] == FOREIGN else None,
+            "source_file": source_file
+        }
+
+
+def iter_transactions_from_pdf(pdf_path: Path) -> Iterator[dict]:
+    """Yield transactions from an ANZ statement PDF lazily, page by page."""
+    for text in pdf_page_texts(pdf_path):
+        yield from iter_page_transactions(text, pdf_path.name)
+
+
+def extract_transactions_from_pdf(pdf_path: Path) -> list[dict]:
+    """Extract all transactions from an ANZ statement PDF."""
+    return list(iter_transactions_from_pdf(pdf_path))
+
+
+def find_columns(words: list) -> Optional[List[float]]:
+    """
+    Left edges of the transaction table's columns, from its header row.
     
-    for page_num in range(len(doc)):
-        text = doc[page_num].get_text()
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
+    The header reads "Date Processed | Date of Transaction | Card Used |
+    Transaction Details | Amount ($A) | Balance", each label stacked over
+    two lines and anchored on "($A)". Returns None if the page has no
+    table header.
+    """
+    anchor = next((w for w in words if w[4] == '($A)'), None)
+    if anchor is None:
+        return None
+    header = sorted((w for w in words if anchor[1] - 14 <= w[1] <= anchor[3]), key=lambda w: w[0])
+    lefts = {}
+    for x0, _, _, _, text, *_ in header:
+        if text == 'Card':
+            lefts['card'] = x0
+        elif text == 'Date' and 'processed' in lefts and 'card' not in lefts and x0 > lefts['processed']:
+            lefts.setdefault('transaction', x0)
+        elif text == 'Transaction' and 'card' in lefts:
+            lefts.setdefault('details', x0)
+        elif text == 'Amount':
+            lefts['amount'] = x0
+        elif text == 'Balance' and 'amount' in lefts:
+            lefts['balance'] = x0
+        lefts.setdefault('processed', x0)
+    names = ('processed', 'transaction', 'card', 'details', 'amount', 'balance')
+    return [lefts[name] for name in names] if all(name in lefts for name in names) else None
+
+
+def layout_rows(words: list) -> Iterator[list]:
+    """Group words into visual rows, top to bottom, each row's words left to right."""
+    by_x = itemgetter(0)
+    row = []
+    row_mid = None
+    for mid, word in sorted(((w[1] + w[3]) / 2, w) for w in words):
+        if row and mid - row_mid > ROW_TOLERANCE:
+            yield sorted(row, key=by_x)
+            row = []
+        if not row:
+            row_mid = mid
+        row.append(word)
+    if row:
+        yield sorted(row, key=by_x)
+
+
+def bucket_row(row: list, lefts: List[float]) -> List[str]:
+    """A row's text per column, placing each word by its horizontal centre."""
+    cells = [[] for _ in lefts]
+    for x0, _, x1, _, text, *_ in row:
+        column = bisect_right(lefts, (x0 + x1) / 2) - 1
+        cells[max(column, 0)].append(text)
+    return [' '.join(cell) for cell in cells]
+
+
+def row_values(cells: List[str]) -> Optional[List[str]]:
+    """Column values of a transaction row (amount digits for AMOUNT), or None if it isn't one."""
+    values = []
+    for cell, kind in zip(cells, COLUMN_KINDS):
+        if kind is None:
+            if not cell:
+                return None
+            values.append(cell)
+            continue
+        match = LINE_TOKEN.fullmatch(cell)
+        if not match or match.lastgroup.encode() != kind:
+            return None
+        values.append(match.group(match.lastgroup))
+    return values
+
+
+def iter_layout_page_transactions(words: list, lefts: List[float], source_file: str) -> Iterator[dict]:
+    """
+    Yield the FY24-25 transactions in a page's words (fitz "words" tuples).
+    
+    Words are sorted into rows once and bucketed into columns by
+    x-position, so a row is a transaction or not on its own; nothing
+    depends on the order text extraction emits the columns in. A row
+    holding a foreign amount right under a transaction is its
+    continuation, as in the line-based parser.
+    """
+    previous = None
+    for row in layout_rows(words):
+        cells = bucket_row(row, lefts)
+        values = row_values(cells)
+        if values is None:
+            if previous is not None:
+                text = ' '.join(cells).strip()
+                foreign = CURRENCY_CODE.search(text) and FOREIGN_PATTERN.search(text)
+                if foreign:
+                    previous["foreign_currency"] = f"{foreign.group(1)} {foreign.group(2)}"
+                yield previous
+                previous = None
+            continue
+        if previous is not None:
+            yield previous
+            previous = None
+        
+        date_processed, date_transaction, card_used, description, amount, balance = values
+        
+        # Skip non-transactions (fees sometimes have different patterns)
+        if 'INCL OVERSEAS' in description:
+            continue
+        try:
+            tx_date = date_from_token(date_transaction)
+        except ValueError:
+            continue
         
-        # State machine to parse transactions
-        i = 0
-        while i < len(lines) - 5:  # Need at least 6 lines for a transaction
-            line = lines[i]
-            
-            # Look for date pattern to start a transaction
-            date_match = DATE_PATTERN.match(line)
-            if not date_match:
-                i += 1
-                continue
-            
-            date_processed = date_match.group(1)
-            
-            # Check next line is also a date (transaction date)
-            if i + 1 >= len(lines):
-                i += 1
-                continue
-            date_tx_match = DATE_PATTERN.match(lines[i + 1])
-            if not date_tx_match:
-                i += 1
-                continue
-            
-            date_transaction = date_tx_match.group(1)
-            
-            # Check for card number
-            if i + 2 >= len(lines):
-                i += 1
-                continue
-            card_match = CARD_PATTERN.match(lines[i + 2])
-            if not card_match:
-                i += 1
-                continue
-            
-            card_used = card_match.group(1)
-            
-            # Description is next
-            if i + 3 >= len(lines):
-                i += 1
-                continue
-            description = lines[i + 3]
-            
-            # Skip header rows
-            if description in ['Transaction Details', 'Amount ($A)', 'Balance']:
-                i += 1
-                continue
-            
-            # Amount
-            if i + 4 >= len(lines):
-                i += 1
-                continue
-            amount_match = AMOUNT_PATTERN.match(lines[i + 4])
-            if not amount_match:
-                i += 1
-                continue
-            
-            amount = parse_amount(amount_match.group(1))
-            
-            # Balance
-            if i + 5 >= len(lines):
-                i += 1
-                continue
-            balance_match = AMOUNT_PATTERN.match(lines[i + 5])
-            if not balance_match:
-                i += 1
-                continue
-            
-            balance = parse_amount(balance_match.group(1))
-            
-            # Skip non-transactions (fees sometimes have different patterns)
-            if 'INCL OVERSEAS' in description:
-                i += 6
-                continue
-            
-            try:
-                tx_date = parse_date(date_transaction)
-            except ValueError:
-                i += 1
-                continue
-            
-            # Only include FY24-25 transactions
-            if not is_in_fy(tx_date):
-                i += 6
-                continue
-            
-            # Determine card owner
-            owner = CARD_OWNERS.get(card_used, "Unknown")
-            
-            tx = {
-                "date_processed": date_processed,
-                "date_transaction": date_transaction,
-                "card_used": card_used,
-                "owner": owner,
-                "description": description,
-                "amount": amount,
-                "balance": balance,
-                "foreign_currency": None,
-                "source_file": pdf_path.name
-            }
-            
-            # Check for foreign currency on following lines
-            if i + 6 < len(lines):
-                fc_match = FOREIGN_PATTERN.search(lines[i + 6])
-                if fc_match:
-                    tx["foreign_currency"] = f"{fc_match.group(1)} {fc_match.group(2)}"
-            
-            transactions.append(tx)
-            i += 6  # Move past this transaction
+        # Only include FY24-25 transactions
+        if not is_in_fy(tx_date):
+            continue
+        
+        previous = {
+            "date_processed": date_processed,
+            "date_transaction": date_transaction,
+            "card_used": card_used,
+            "owner": CARD_OWNERS.get(card_used, "Unknown"),
+            "description": description,
+            "amount": parse_amount(amount),
+            "balance": parse_amount(balance),
+            "foreign_currency": None,
+            "source_file": source_file
+        }
+    if previous is not None:
+        yield previous
+
+
+def iter_layout_transactions_from_pdf(pdf_path: Path) -> Iterator[dict]:
+    """
+    Yield transactions from an ANZ statement PDF using word coordinates.
     
-    doc.close()
-    return transactions
+    Column positions come from each page's table header, or the previous
+    page's when a page has none. Pages are read lazily from the PDF (word
+    boxes are not in the text cache).
+    """
+    lefts = None
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            words = page.get_text("words")
+            lefts = find_columns(words) or lefts
+            if lefts is not None:
+                yield from iter_layout_page_transactions(words, lefts, pdf_path.name)
+
+
+# Transaction extractors by --parser name
+PARSERS = {
+    "line": iter_transactions_from_pdf,
+    "layout": iter_layout_transactions_from_pdf,
+}
+
+
+def transaction_date(tx) -> datetime:
+    """Sort key: the date of the transaction."""
+    return date_from_token(tx["date_transaction"])
 
 
-def process_all_statements() -> list[dict]:
-    """Process all ANZ statements in the folder."""
-    all_transactions = []
+def parse_statement(pdf_file: Path, parser: str = "line") -> Tuple[TransactionTable, float]:
+    """
+    Parse one statement; returns (transactions sorted by date, seconds).
     
-    for pdf_file in sorted(STATEMENTS_DIR.glob("*ANZ*.pdf")):
-        print(f"Processing: {pdf_file.name}")
-        transactions = extract_transactions_from_pdf(pdf_file)
-        all_transactions.extend(transactions)
-        print(f"  Found {len(transactions)} transactions")
+    The sort is stable, so same-day transactions keep statement order.
+    Module-level so statement workers can run it; the table pickles as a
+    few arrays rather than a dict per transaction.
+    """
+    start = time.perf_counter()
+    transactions = TransactionTable.from_rows(ANZ_COLUMNS, sorted(PARSERS[parser](pdf_file), key=transaction_date))
+    return transactions, time.perf_counter() - start
+
+
+def merge_statements(statements: Iterable[TransactionTable]) -> Iterator:
+    """
+    K-way merge of date-sorted statements, dropping overlap duplicates.
     
-    # Remove duplicates (statements overlap by a few days)
+    Statements overlap by a few days, so the same transaction can appear in
+    two. Duplicates share a (date_transaction, description, amount) key and
+    so are adjacent in date order; only the current day's keys are kept.
+    On equal dates the earlier statement comes first, so it wins.
+    """
+    day = None
     seen = set()
-    unique_transactions = []
-    for tx in all_transactions:
+    for tx in heapq.merge(*statements, key=transaction_date):
+        if tx["date_transaction"] != day:
+            day = tx["date_transaction"]
+            seen.clear()
         key = (tx["date_transaction"], tx["description"], tx["amount"])
         if key not in seen:
             seen.add(key)
-            unique_transactions.append(tx)
+            yield tx
+
+
+def process_all_statements(parser: str = "line", workers: int = 1) -> TransactionTable:
+    """
+    Process all ANZ statements in the folder with the named parser (see PARSERS).
+    
+    Statements are independent, so with workers > 1 they are parsed in a
+    process pool. Either way they are merged in transaction date order.
+    """
+    pdf_files = sorted(STATEMENTS_DIR.glob("*ANZ*.pdf"))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_statement, pdf_files, [parser] * len(pdf_files)))
+    else:
+        parsed = [parse_statement(pdf_file, parser) for pdf_file in pdf_files]
+    
+    for pdf_file, (transactions, seconds) in zip(pdf_files, parsed):
+        print(f"Processing: {pdf_file.name}")
+        print(f"  Found {len(transactions)} transactions ({seconds * 1000:.0f} ms)")
+    
+    # Remove duplicates (statements overlap by a few days)
+    unique_transactions = TransactionTable.from_rows(
+        ANZ_COLUMNS, merge_statements(transactions for transactions, _ in parsed))
     
     print(f"\nTotal unique transactions: {len(unique_transactions)}")
     return unique_transactions
 
 
-def categorise_all_transactions(transactions: list[dict]) -> list[dict]:
-    """Add tax category information to all transactions."""
-    for tx in transactions:
-        cat_info = categorise_transaction(tx["description"], tx["amount"])
-        tx["category"] = cat_info["category"]
-        tx["category_description"] = cat_info["description"]
-        tx["is_deductible"] = cat_info["is_deductible"]
-        tx["is_income"] = cat_info.get("is_income", False)
-        tx["work_use_percent"] = cat_info["work_use_percent"]
-        tx["category_notes"] = cat_info["notes"]
-        tx["matched_keyword"] = cat_info["matched_keyword"]
-        tx["is_foreign"] = is_foreign_currency(tx["description"]) or tx["foreign_currency"] is not None
-        tx["is_high_value"] = is_high_value(tx["amount"])
+def categorise_all_transactions(transactions: TransactionTable) -> TransactionTable:
+    """Add tax category information to all transactions, as CATEGORY_COLUMNS."""
+    columns = {name: [] for name in CATEGORY_COLUMNS}
+    for description, amount, foreign_currency, card_owner in zip(
+            transactions.column("description"), transactions.column("amount"),
+            transactions.column("foreign_currency"), transactions.column("owner")):
+        cat_info = categorise_transaction(description, amount)
+        columns["category"].append(cat_info["category"])
+        columns["category_description"].append(cat_info["description"])
+        columns["is_deductible"].append(cat_info["is_deductible"])
+        columns["is_income"].append(cat_info.get("is_income", False))
+        columns["work_use_percent"].append(cat_info["work_use_percent"])
+        columns["category_notes"].append(cat_info["notes"])
+        columns["matched_keyword"].append(cat_info["matched_keyword"])
+        columns["is_foreign"].append(is_foreign_currency(description) or foreign_currency is not None)
+        columns["is_high_value"].append(is_high_value(amount))
         
         # Override owner if category has specific owner
         default_owner = cat_info.get("default_owner", "unknown")
         if default_owner not in ["check_card", "check_description", "shared", "unknown"]:
-            tx["category_owner"] = default_owner
+            columns["category_owner"].append(default_owner)
         else:
-            tx["category_owner"] = tx["owner"]  # Use card owner
+            columns["category_owner"].append(card_owner)  # Use card owner
     
+    for name, kind in CATEGORY_COLUMNS.items():
+        transactions.add_column(name, kind, columns[name])
     return transactions
 
 
-def export_to_csv(transactions: list[dict], filename: str = "all_transactions.csv"):
-    """Export transactions to CSV for review."""
+def export_to_csv(transactions: TransactionTable, filename: str = "all_transactions.csv"):
+    """Export transactions to CSV for review, and to Parquet for the next stages (see save_table())."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / filename
     
@@ -237,41 +467,43 @@ def export_to_csv(transactions: list[dict], filename: str = "all_transactions.cs
         "is_deductible", "work_use_percent", "category_owner", "is_high_value",
         "is_foreign", "foreign_currency", "matched_keyword", "source_file"
     ]
-    
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(transactions)
+    parquet = save_table(transactions, output_path, fieldnames, date_formats=EXPORT_DATE_FORMATS)
     
     print(f"\nExported to: {output_path}")
+    if parquet:
+        print(f"  and {parquet}")
     return output_path
 
 
-def generate_deductible_summary(transactions: list[dict]) -> dict:
-    """Generate summary of deductible transactions."""
-    summary = {
-        "Thomas": {"transactions": [], "total": 0.0, "adjusted_total": 0.0},
-        "Isabelle": {"transactions": [], "total": 0.0, "adjusted_total": 0.0},
-        "Shared": {"transactions": [], "total": 0.0, "adjusted_total": 0.0}
-    }
+def generate_deductible_summary(transactions: TransactionTable) -> dict:
+    """Generate summary of deductible transactions, per owner as a sub-table."""
+    rows = {"Thomas": [], "Isabelle": [], "Shared": []}
     
-    for tx in transactions:
-        if not tx["is_deductible"]:
+    owners = transactions.column("category_owner")
+    card_owners = transactions.column("owner")
+    for i, deductible in enumerate(transactions.column("is_deductible")):
+        if not deductible:
             continue
         
-        owner = tx["category_owner"]
+        owner = owners[i]
         if owner == "shared":
             owner = "Shared"
-        elif owner not in summary:
-            owner = tx["owner"]  # Fall back to card owner
+        elif owner not in rows:
+            owner = card_owners[i]  # Fall back to card owner
         
-        if owner in summary:
-            summary[owner]["transactions"].append(tx)
-            summary[owner]["total"] += tx["amount"]
-            adjusted = tx["amount"] * (tx["work_use_percent"] / 100)
-            summary[owner]["adjusted_total"] += adjusted
+        if owner in rows:
+            rows[owner].append(i)
     
-    return summary
+    amounts = transactions.column("amount")
+    work_use = transactions.column("work_use_percent")
+    return {
+        owner: {
+            "transactions": transactions.take(indices),
+            "total": transactions.sum("amount", indices),
+            "adjusted_total": sum((amounts[i] * (work_use[i] / 100) for i in indices), 0.0),
+        }
+        for owner, indices in rows.items()
+    }
 
 
 def print_summary(summary: dict):
@@ -288,34 +520,46 @@ def print_summary(summary: dict):
         print("-" * 50)
         
         # Group by category
-        by_category = {}
-        for tx in data["transactions"]:
-            cat = tx["category"]
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(tx)
-        
-        for cat, txs in sorted(by_category.items()):
-            cat_total = sum(tx["amount"] for tx in txs)
-            work_pct = txs[0]["work_use_percent"]
+        txs = data["transactions"]
+        amounts = txs.column("amount")
+        for cat, rows in sorted(txs.group("category").items()):
+            cat_total = txs.sum("amount", rows)
+            work_pct = txs[rows[0]]["work_use_percent"]
             adjusted = cat_total * (work_pct / 100)
-            print(f"\n  {cat} ({len(txs)} transactions)")
+            print(f"\n  {cat} ({len(rows)} transactions)")
             print(f"    Total: ${cat_total:.2f} @ {work_pct}% = ${adjusted:.2f}")
-            for tx in sorted(txs, key=lambda x: x["amount"], reverse=True)[:5]:
+            for i in sorted(rows, key=amounts.__getitem__, reverse=True)[:5]:
+                tx = txs[i]
                 print(f"      {tx['date_transaction']} ${tx['amount']:.2f} - {tx['description'][:40]}")
-            if len(txs) > 5:
-                print(f"      ... and {len(txs) - 5} more")
+            if len(rows) > 5:
+                print(f"      ... and {len(rows) - 5} more")
         
         print(f"\n  TOTAL: ${data['total']:.2f} (Adjusted: ${data['adjusted_total']:.2f})")
 
 
 def main():
     """Main processing pipeline."""
+    parser = argparse.ArgumentParser(description='ANZ credit card statement parser for FY24-25')
+    parser.add_argument('--no-cache', action='store_true', help='Re-extract all text, ignoring the text cache')
+    parser.add_argument('--parser', choices=sorted(PARSERS), default='line',
+                        help='line: cached page text in reading order; layout: word coordinates '
+                             '(default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for parsing statements (0 = one per CPU, default: 1)')
+    parser.add_argument('--no-parquet', action='store_true',
+                        help='Write CSV exports only, without the Parquet copies (as if pyarrow were missing)')
+    args = parser.parse_args()
+    if args.no_cache:
+        disable_cache()
+    if args.no_parquet:
+        disable_parquet()
+    
     print("ANZ Credit Card Statement Parser")
     print("=" * 50)
     
     # 1. Extract all transactions
-    transactions = process_all_statements()
+    workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+    transactions = process_all_statements(args.parser, workers)
     
     # 2. Categorise transactions
     transactions = categorise_all_transactions(transactions)
@@ -324,7 +568,7 @@ def main():
     export_to_csv(transactions)
     
     # 4. Export deductibles only
-    deductible_txs = [tx for tx in transactions if tx["is_deductible"]]
+    deductible_txs = transactions.where(transactions.column("is_deductible"))
     export_to_csv(deductible_txs, "deductible_transactions.csv")
     print(f"Deductible transactions: {len(deductible_txs)}")
     
@@ -333,12 +577,15 @@ def main():
     print_summary(summary)
     
     # 6. High-value items for review
-    high_value = [tx for tx in transactions if tx["is_high_value"] and tx["category"] == "unclassified"]
+    high_value = transactions.where(
+        high and category == "unclassified"
+        for high, category in zip(transactions.column("is_high_value"), transactions.column("category"))
+    )
     if high_value:
         print("\n" + "=" * 70)
         print("HIGH-VALUE UNCLASSIFIED (MANUAL REVIEW NEEDED)")
         print("=" * 70)
-        for tx in sorted(high_value, key=lambda x: x["amount"], reverse=True):
+        for tx in high_value.sort("amount", reverse=True):
             print(f"  {tx['date_transaction']} ${tx['amount']:.2f} - {tx['description']}")
     
     return transactions
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Integer-cents arithmetic core for exact tax figures.
+
+Money is held as int cents and rates as int parts per 10,000 (basis points),
+so every product is exact and rounding happens once, half-up to the cent,
+exactly like Decimal.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP).
+Plain int arithmetic is several times faster than Decimal in bulk runs.
+
+Used by au_tax.calculate_summary_exact() and verify_calculations.py.
+
+    to_cents('86255.70')        -> 8625570
+    from_cents(8625570)         -> Decimal('86255.70')
+    rate_to_bp(0.115)           -> 1150
+    apply_rate(94500, 6500)     -> 61425   ($945.00 x 65% = $614.25)
+    apply_ratio(66065, 20, 130) -> 10164   ($660.65 x 20/130 = $101.64)
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Union
+
+Amount = Union[int, float, str, Decimal]
+
+BP_PER_UNIT = 10_000  # Rates are held as parts per 10,000
+
+_CENT = Decimal('0.01')
+
+
+def to_cents(value: Amount) -> int:
+    """Convert a dollar amount to int cents, rounding half-up to the cent."""
+    if isinstance(value, int):
+        return value * 100
+    if not isinstance(value, Decimal):
+        # str(float) is the shortest repr, so 0.1 converts as '0.1', not its binary value
+        value = str(value).strip()
+        # Fast path for plain 'dddd.cc' text, the common case in bulk input
+        whole, _, frac = value.partition('.')
+        digits = whole.lstrip('+-')
+        if len(frac) <= 2 and digits.isdigit() and (frac.isdigit() or not frac) and len(whole) - len(digits) <= 1:
+            cents = int(digits) * 100 + int(frac.ljust(2, '0'))
+            return -cents if whole[0] == '-' else cents
+        value = Decimal(value)
+    return int(value.quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Int cents as a 2-decimal-place Decimal (e.g. 8625570 -> 86255.70)."""
+    return Decimal(cents).scaleb(-2)
+
+
+def rate_to_bp(rate: Amount) -> int:
+    """Convert a rate (e.g. 0.0125) to parts per 10,000; it must be exact."""
+    bp = (rate if isinstance(rate, Decimal) else Decimal(str(rate))) * BP_PER_UNIT
+    if bp != bp.to_integral_value():
+        raise ValueError(f"Rate {rate} is not a whole number of basis points")
+    return int(bp)
+
+
+def _div_half_up(numerator: int, denominator: int) -> int:
+    """numerator / denominator rounded half away from zero (denominator > 0)."""
+    if numerator >= 0:
+        return (2 * numerator + denominator) // (2 * denominator)
+    return -((-2 * numerator + denominator) // (2 * denominator))
+
+
+def apply_rate(cents: int, bp: int) -> int:
+    """cents x bp / 10,000, rounded half-up to the cent."""
+    return _div_half_up(cents * bp, BP_PER_UNIT)
+
+
+def apply_ratio(cents: int, numerator: int, denominator: int) -> int:
+    """cents x numerator / denominator, rounded half-up to the cent."""
+    if denominator <= 0:
+        raise ValueError("Denominator must be positive")
+    return _div_half_up(cents * numerator, denominator)
+
+
+def ratio_to_places(numerator: int, denominator: int, places: int) -> Decimal:
+    """numerator / denominator as a Decimal rounded half-up to `places` places."""
+    if denominator <= 0:
+        raise ValueError("Denominator must be positive")
+    return Decimal(_div_half_up(numerator * 10 ** places, denominator)).scaleb(-places)
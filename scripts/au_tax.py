@@ -14,103 +14,203 @@ Usage:
     au_tax.py help-loan <income>        # Calculate HELP loan repayment
     au_tax.py ccs <combined_income>     # Check CCS threshold status
     au_tax.py summary <income> [options]# Full tax summary
+    au_tax.py batch [file] [--format]   # Stream CSV/JSONL rows through summary
+    au_tax.py marginal <income> [options]  # Marginal rate, next breakpoint,
+                                        # income for a target tax
 
-All rates are for FY2024-25 (1 July 2024 - 30 June 2025).
+Global options --cache-size N and --stats (before the command) enable the
+calculator result cache and report its hit rate.
+
+Every command except ccs accepts --fy <year> (e.g. --fy 2024-25) to select
+the rate tables in au_tax_rates.json.
+
+Batch API (requires numpy):
+    calculate_income_tax_batch(incomes)  # Structured array, one row per income
+    calculate_summary_batch(incomes, ...)# Columnar TaxSummaryBatch
+    calculate_summary_table(df)          # Same, from a pandas/Arrow table
+
+Breakpoint solver:
+    build_tax_curve(...)                 # Piecewise-linear total tax (TaxCurve)
+
+Exact (integer-cents, half-up) summary:
+    calculate_summary_exact(income, ...) # TaxSummary of Decimals, exact to the cent
+
+Result cache (off by default):
+    enable_cache(maxsize) / disable_cache() / cache_clear() / cache_info()
+
+Rates default to FY2024-25 (1 July 2024 - 30 June 2025).
 Source: Australian Taxation Office (ATO)
 """
 
 import argparse
+import csv
+import inspect
+import json
+import math
 import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
 from decimal import Decimal, ROUND_HALF_UP
-from typing import NamedTuple, Optional
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
+from au_cents import Amount, apply_rate, from_cents, rate_to_bp, ratio_to_places, to_cents
 
-# =============================================================================
-# FY2024-25 TAX BRACKETS
-# Source: https://www.ato.gov.au/tax-rates-and-codes/tax-rates-australian-residents
-# =============================================================================
-TAX_BRACKETS_2024_25 = [
-    # (threshold, base_tax, rate_per_dollar_over_threshold)
-    (0, 0, 0.00),           # $0 - $18,200: Nil
-    (18_200, 0, 0.16),      # $18,201 - $45,000: 16c per $1 over $18,200
-    (45_000, 4_288, 0.30),  # $45,001 - $135,000: $4,288 + 30c per $1 over $45,000
-    (135_000, 31_288, 0.37),# $135,001 - $190,000: $31,288 + 37c per $1 over $135,000
-    (190_000, 51_638, 0.45),# $190,001+: $51,638 + 45c per $1 over $190,000
-]
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the batch (array) API
+    np = None
 
-# =============================================================================
-# MEDICARE LEVY - 2% (with low-income reduction thresholds)
-# Source: https://www.ato.gov.au/individuals-and-families/medicare-and-private-health-insurance/medicare-levy
-# =============================================================================
-MEDICARE_LEVY_RATE = 0.02
-
-# Medicare levy reduction thresholds FY2024-25
-# Below lower threshold: no levy
-# Between lower and upper: reduced levy (10% of excess over lower)
-# Above upper threshold: full 2%
-MEDICARE_REDUCTION_THRESHOLDS = {
-    'standard': {'lower': 27_222, 'upper': 34_027},
-    'sapto': {'lower': 43_020, 'upper': 53_775},  # Seniors and Pensioners Tax Offset
-}
 
 # =============================================================================
-# MEDICARE LEVY SURCHARGE (MLS) - FY2024-25
-# Source: https://www.ato.gov.au/individuals-and-families/medicare-and-private-health-insurance/medicare-levy-surcharge
-# Applies if no private hospital cover
+# RATE TABLE REGISTRY
+# Rates for each financial year live in au_tax_rates.json (with ATO source
+# links). They are loaded once at import and compiled into sorted threshold
+# tuples so every lookup is a single bisect.
 # =============================================================================
-MLS_THRESHOLDS_SINGLE_2024_25 = [
-    # (threshold, rate)
-    (97_000, 0.00),     # Base tier: $97,000 or less - 0%
-    (113_000, 0.01),    # Tier 1: $97,001 - $113,000 - 1%
-    (151_000, 0.0125),  # Tier 2: $113,001 - $151,000 - 1.25%
-    (float('inf'), 0.015),  # Tier 3: $151,001+ - 1.5%
-]
-
-MLS_THRESHOLDS_FAMILY_2024_25 = [
-    # (threshold, rate)
-    (194_000, 0.00),    # Base tier: $194,000 or less - 0%
-    (226_000, 0.01),    # Tier 1: $194,001 - $226,000 - 1%
-    (302_000, 0.0125),  # Tier 2: $226,001 - $302,000 - 1.25%
-    (float('inf'), 0.015),  # Tier 3: $302,001+ - 1.5%
-]
-
-# Family threshold increases by $1,500 for each MLS dependent child after first
-MLS_FAMILY_CHILD_INCREMENT = 1_500
+RATE_TABLES_PATH = Path(__file__).with_name('au_tax_rates.json')
+DEFAULT_FY = '2024-25'
+
+
+class TierTable(NamedTuple):
+    """
+    Compiled tier table: tier i covers (thresholds[i - 1], thresholds[i]].
+    
+    Within a tier the amount is a closed form, income * rates[i], so a
+    lookup is one bisect over a flat array('d') with no per-call allocation.
+    The last threshold is inf, so every income falls in some tier.
+    """
+    thresholds: array
+    rates: array
+    
+    def tier(self, income: float) -> int:
+        """Index of the tier containing income."""
+        return bisect_left(self.thresholds, income)
+    
+    def shifted(self, increment: float) -> 'TierTable':
+        """Copy with every threshold raised by increment (rates shared)."""
+        return TierTable(array('d', [t + increment for t in self.thresholds]), self.rates)
+
+
+class RateTable(NamedTuple):
+    """Compiled rate tables for one financial year."""
+    fy: str
+    # Income tax: bracket i covers (tax_thresholds[i], tax_thresholds[i + 1]]
+    tax_thresholds: Tuple[float, ...]
+    tax_bases: Tuple[float, ...]
+    tax_rates: Tuple[float, ...]
+    tax_descriptions: Tuple[str, ...]
+    # Medicare levy
+    medicare_rate: float
+    medicare_reduction_rate: float
+    medicare_thresholds: Dict[str, Dict[str, float]]
+    # Medicare levy surcharge
+    mls_single: TierTable
+    mls_family: TierTable
+    mls_child_increment: float
+    # HELP repayment
+    help: TierTable
+    # Division 293
+    div293_threshold: float
+    div293_rate: float
+
+
+def _describe_bracket(threshold: float, base: float, rate: float, upper: Optional[float]) -> str:
+    """Human-readable bracket text, e.g. '$45,001 - $135,000: $4,288 + 30c per $1 over $45,000'."""
+    if rate == 0:
+        return f"${threshold:,} - ${upper:,}: Nil"
+    span = f"${threshold + 1:,} - ${upper:,}" if upper is not None else f"${threshold + 1:,}+"
+    base_text = f"${base:,} + " if base else ""
+    return f"{span}: {base_text}{rate * 100:g}c per $1 over ${threshold:,}"
+
+
+def _compile_tiers(rows: List[list], name: str) -> TierTable:
+    """Compile [threshold, rate] rows (null = no upper limit) into a TierTable."""
+    thresholds = array('d', [float('inf') if t is None else t for t, _ in rows])
+    if list(thresholds) != sorted(thresholds) or thresholds[-1] != float('inf'):
+        raise ValueError(f"{name} thresholds must ascend and end with an open (null) tier")
+    return TierTable(thresholds, array('d', [r for _, r in rows]))
+
+
+def _compile_rate_table(fy: str, raw: dict) -> RateTable:
+    """Compile one financial year's raw JSON tables into a RateTable."""
+    brackets = raw['tax_brackets']['rows']
+    tax_thresholds = tuple(t for t, _, _ in brackets)
+    if list(tax_thresholds) != sorted(tax_thresholds):
+        raise ValueError(f"FY{fy} tax bracket thresholds must be in ascending order")
+    uppers = tax_thresholds[1:] + (None,)
+    
+    mls = raw['mls']
+    
+    return RateTable(
+        fy=fy,
+        tax_thresholds=tax_thresholds,
+        tax_bases=tuple(b for _, b, _ in brackets),
+        tax_rates=tuple(r for _, _, r in brackets),
+        tax_descriptions=tuple(
+            _describe_bracket(t, b, r, u) for (t, b, r), u in zip(brackets, uppers)
+        ),
+        medicare_rate=raw['medicare']['rate'],
+        medicare_reduction_rate=raw['medicare']['reduction_rate'],
+        medicare_thresholds=raw['medicare']['reduction_thresholds'],
+        mls_single=_compile_tiers(mls['single'], f"FY{fy} MLS single"),
+        mls_family=_compile_tiers(mls['family'], f"FY{fy} MLS family"),
+        mls_child_increment=mls['family_child_increment'],
+        help=_compile_tiers(raw['help']['rows'], f"FY{fy} HELP"),
+        div293_threshold=raw['div293']['threshold'],
+        div293_rate=raw['div293']['rate'],
+    )
+
+
+def load_rate_tables(path: Path = RATE_TABLES_PATH) -> Dict[str, RateTable]:
+    """Load and compile every financial year in a rate table file."""
+    with open(path) as f:
+        raw_tables = json.load(f)
+    return {fy: _compile_rate_table(fy, raw) for fy, raw in raw_tables.items()}
+
+
+RATE_TABLES = load_rate_tables()
+
+
+def get_rate_table(fy: str = DEFAULT_FY) -> RateTable:
+    """Return the compiled rate tables for a financial year (e.g. '2024-25')."""
+    try:
+        return RATE_TABLES[fy]
+    except KeyError:
+        available = ', '.join(sorted(RATE_TABLES))
+        raise ValueError(f"No rate tables for FY{fy} (available: {available})") from None
+
+
+@lru_cache(maxsize=64)
+def _family_mls_tiers(fy: str, dependent_children: int) -> TierTable:
+    """Family MLS tiers raised for each dependent child after the first (cached)."""
+    table = get_rate_table(fy)
+    if dependent_children <= 1:
+        return table.mls_family
+    return table.mls_family.shifted((dependent_children - 1) * table.mls_child_increment)
 
-# =============================================================================
-# DIVISION 293 - Additional super tax for high income earners
-# Source: https://www.ato.gov.au/individuals-and-families/super-for-individuals-and-families/super/growing-and-keeping-track-of-your-super/caps-limits-and-tax-on-super-contributions/division-293-tax-on-concessional-contributions
-# =============================================================================
-DIV293_THRESHOLD = 250_000  # Income + super contributions threshold
-DIV293_RATE = 0.15  # Additional 15% tax on super contributions above threshold
 
 # =============================================================================
-# HELP/HECS LOAN REPAYMENT THRESHOLDS - FY2024-25
-# Source: https://www.ato.gov.au/Rates/HELP,-TSL-and-SFSS-repayment-thresholds-and-rates/
-# Note: FY2024-25 uses percentage of TOTAL repayment income (not marginal)
+# FY2024-25 TABLES AS MODULE CONSTANTS
+# Kept for existing callers; derived from the registry above.
 # =============================================================================
-HELP_THRESHOLDS_2024_25 = [
-    # (upper_threshold, rate_as_percentage_of_total_income)
-    (54_435, 0.00),
-    (62_850, 0.01),
-    (66_620, 0.02),
-    (70_618, 0.025),
-    (74_855, 0.03),
-    (79_346, 0.035),
-    (84_107, 0.04),
-    (89_154, 0.045),
-    (94_503, 0.05),
-    (100_174, 0.055),
-    (106_185, 0.06),
-    (112_556, 0.065),
-    (119_309, 0.07),
-    (126_467, 0.075),
-    (134_056, 0.08),
-    (142_100, 0.085),
-    (150_626, 0.09),
-    (159_663, 0.095),
-    (float('inf'), 0.10),
-]
+_FY2024_25 = get_rate_table('2024-25')
+
+TAX_BRACKETS_2024_25 = list(zip(_FY2024_25.tax_thresholds, _FY2024_25.tax_bases, _FY2024_25.tax_rates))
+
+MEDICARE_LEVY_RATE = _FY2024_25.medicare_rate
+MEDICARE_REDUCTION_THRESHOLDS = _FY2024_25.medicare_thresholds
+
+MLS_THRESHOLDS_SINGLE_2024_25 = list(zip(*_FY2024_25.mls_single))
+MLS_THRESHOLDS_FAMILY_2024_25 = list(zip(*_FY2024_25.mls_family))
+MLS_FAMILY_CHILD_INCREMENT = _FY2024_25.mls_child_increment
+
+DIV293_THRESHOLD = _FY2024_25.div293_threshold
+DIV293_RATE = _FY2024_25.div293_rate
+
+HELP_THRESHOLDS_2024_25 = list(zip(*_FY2024_25.help))
 
 # =============================================================================
 # CCS (Child Care Subsidy) THRESHOLDS - FY2024-25
@@ -123,6 +223,124 @@ CCS_THRESHOLDS = {
 }
 
 
+# =============================================================================
+# CALCULATOR CACHE
+# Opt-in memoisation of the scalar calculators. Off by default; call
+# enable_cache() to keep a bounded LRU of results per calculator, keyed on
+# the full argument list (defaults filled in, so f(x) and f(x, fy=DEFAULT_FY)
+# share an entry). Results are immutable NamedTuples, so hits return the
+# cached object itself.
+# =============================================================================
+DEFAULT_CACHE_SIZE = 4096
+
+_cache_maxsize = 0  # 0 = caching disabled
+
+
+class CacheInfo(NamedTuple):
+    """Hit/miss counters for one cached calculator."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Memo:
+    """LRU results for one calculator."""
+    __slots__ = ('params', 'defaults', 'entries', 'hits', 'misses')
+    
+    def __init__(self, fn):
+        signature = inspect.signature(fn)
+        self.params = tuple(signature.parameters)
+        self.defaults = tuple(p.default for p in signature.parameters.values())
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def key(self, args: tuple, kwargs: dict) -> Optional[tuple]:
+        """Positional argument tuple with defaults filled in (None if unknown kwargs)."""
+        n = len(args)
+        if not kwargs:
+            return args + self.defaults[n:]
+        rest = tuple(kwargs.get(name, default)
+                     for name, default in zip(self.params[n:], self.defaults[n:]))
+        if len(kwargs) != sum(name in kwargs for name in self.params[n:]):
+            return None
+        return args + rest
+    
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+
+_MEMOS: Dict[str, _Memo] = {}
+
+
+def _cached(fn):
+    """Route a pure calculator through its LRU when caching is enabled."""
+    memo = _MEMOS[fn.__name__] = _Memo(fn)
+    entries = memo.entries
+    
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _cache_maxsize:
+            return fn(*args, **kwargs)
+        key = memo.key(args, kwargs)
+        if key is None:
+            # Let the calculator raise its own TypeError
+            return fn(*args, **kwargs)
+        try:
+            result = entries[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable argument: compute without caching
+            return fn(*args, **kwargs)
+        else:
+            entries.move_to_end(key)
+            memo.hits += 1
+            return result
+        result = fn(*args, **kwargs)
+        memo.misses += 1
+        entries[key] = result
+        if len(entries) > _cache_maxsize:
+            entries.popitem(last=False)
+        return result
+    
+    return wrapper
+
+
+def enable_cache(maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+    """Turn on calculator caching with up to maxsize results per calculator."""
+    global _cache_maxsize
+    if maxsize < 0:
+        raise ValueError("Cache size cannot be negative")
+    _cache_maxsize = maxsize
+    for memo in _MEMOS.values():
+        while len(memo.entries) > maxsize:
+            memo.entries.popitem(last=False)
+
+
+def disable_cache() -> None:
+    """Turn off calculator caching and drop all cached results."""
+    global _cache_maxsize
+    _cache_maxsize = 0
+    cache_clear()
+
+
+def cache_clear() -> None:
+    """Drop all cached results and reset the hit/miss counters."""
+    for memo in _MEMOS.values():
+        memo.clear()
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """Hit/miss counters per cached calculator, by function name."""
+    return {
+        name: CacheInfo(memo.hits, memo.misses, _cache_maxsize, len(memo.entries))
+        for name, memo in _MEMOS.items()
+    }
+
+
 # =============================================================================
 # CALCULATION FUNCTIONS
 # =============================================================================
@@ -136,12 +354,14 @@ class TaxResult(NamedTuple):
     bracket_description: str
 
 
-def calculate_income_tax(taxable_income: float) -> TaxResult:
+@_cached
+def calculate_income_tax(taxable_income: float, fy: str = DEFAULT_FY) -> TaxResult:
     """
-    Calculate income tax for FY2024-25.
+    Calculate income tax for a financial year (default FY2024-25).
     
     Args:
         taxable_income: Taxable income in AUD
+        fy: Financial year, e.g. '2024-25'
         
     Returns:
         TaxResult with tax details
@@ -149,42 +369,130 @@ def calculate_income_tax(taxable_income: float) -> TaxResult:
     if taxable_income < 0:
         raise ValueError("Taxable income cannot be negative")
     
-    if taxable_income <= 18_200:
+    table = get_rate_table(fy)
+    
+    # Bracket i covers (threshold[i], threshold[i + 1]]
+    i = max(bisect_left(table.tax_thresholds, taxable_income) - 1, 0)
+    threshold = table.tax_thresholds[i]
+    rate = table.tax_rates[i]
+    
+    if rate == 0:
+        # Tax-free threshold
         return TaxResult(
             taxable_income=taxable_income,
             tax_payable=0,
             marginal_rate=0,
             effective_rate=0,
-            bracket_description="$0 - $18,200: Nil"
+            bracket_description=table.tax_descriptions[i]
         )
     
-    # Find applicable bracket
-    brackets = TAX_BRACKETS_2024_25
-    for i in range(len(brackets) - 1, -1, -1):
-        threshold, base_tax, rate = brackets[i]
-        if taxable_income > threshold:
-            tax = base_tax + (taxable_income - threshold) * rate
-            effective_rate = tax / taxable_income if taxable_income > 0 else 0
-            
-            # Determine bracket description
-            if threshold == 18_200:
-                desc = "$18,201 - $45,000: 16c per $1 over $18,200"
-            elif threshold == 45_000:
-                desc = "$45,001 - $135,000: $4,288 + 30c per $1 over $45,000"
-            elif threshold == 135_000:
-                desc = "$135,001 - $190,000: $31,288 + 37c per $1 over $135,000"
-            else:
-                desc = "$190,001+: $51,638 + 45c per $1 over $190,000"
-            
-            return TaxResult(
-                taxable_income=taxable_income,
-                tax_payable=round(tax, 2),
-                marginal_rate=rate,
-                effective_rate=round(effective_rate, 4),
-                bracket_description=desc
-            )
-    
-    return TaxResult(taxable_income, 0, 0, 0, "Unknown bracket")
+    tax = table.tax_bases[i] + (taxable_income - threshold) * rate
+    effective_rate = tax / taxable_income if taxable_income > 0 else 0
+    
+    return TaxResult(
+        taxable_income=taxable_income,
+        tax_payable=round(tax, 2),
+        marginal_rate=rate,
+        effective_rate=round(effective_rate, 4),
+        bracket_description=table.tax_descriptions[i]
+    )
+
+
+# =============================================================================
+# BATCH (VECTORISED) CALCULATION
+# Requires numpy. Results match the scalar functions exactly.
+# =============================================================================
+
+# Ambiguity band around a .5 boundary in which np.round may disagree with
+# Python's correctly-rounded round(); those elements are decided exactly.
+_ROUND_TIE_TOLERANCE = 1e-3
+_VELTKAMP_SPLITTER = 134_217_729.0  # 2**27 + 1
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for the batch API (pip install numpy)")
+
+
+def _round_like_python(values: "np.ndarray", ndigits: int) -> "np.ndarray":
+    """
+    Round an array exactly as the builtin round() rounds each float.
+    
+    np.round scales by 10**ndigits in floating point, which can land on the
+    wrong side of a half-cent. Near those boundaries the exact product
+    x * 10**ndigits is rebuilt from a Veltkamp split (both halves multiply
+    exactly) and compared with k + 0.5, ties going to even like round().
+    """
+    scale = 10.0 ** ndigits
+    magnitude = np.abs(values)
+    scaled = magnitude * scale
+    floor = np.floor(scaled)
+    rounded = np.rint(scaled)
+    
+    near_tie = np.abs(scaled - floor - 0.5) < _ROUND_TIE_TOLERANCE
+    if near_tie.any():
+        x = magnitude[near_tie]
+        k = floor[near_tie]
+        c = _VELTKAMP_SPLITTER * x
+        hi = c - (c - x)
+        lo = x - hi
+        # hi * scale and lo * scale are exact; the subtraction is exact by Sterbenz
+        excess = (hi * scale - (k + 0.5)) + lo * scale
+        k_is_odd = np.fmod(k, 2.0) == 1.0
+        round_up = (excess > 0) | ((excess == 0) & k_is_odd)
+        rounded[near_tie] = k + round_up
+    
+    return np.copysign(rounded / scale, values)
+
+
+TAX_RESULT_DTYPE = None if np is None else np.dtype([
+    ('taxable_income', np.float64),
+    ('tax_payable', np.float64),
+    ('marginal_rate', np.float64),
+    ('effective_rate', np.float64),
+])
+
+
+def calculate_income_tax_batch(incomes, fy: str = DEFAULT_FY) -> "np.ndarray":
+    """
+    Calculate income tax over an array of taxable incomes.
+    
+    Uses np.searchsorted on the bracket thresholds instead of a Python loop.
+    Each element is identical to the corresponding calculate_income_tax()
+    field (bracket_description is not included).
+    
+    Args:
+        incomes: Array-like of taxable incomes in AUD
+        fy: Financial year, e.g. '2024-25'
+        
+    Returns:
+        Structured array with TAX_RESULT_DTYPE fields
+    """
+    _require_numpy()
+    incomes = np.asarray(incomes, dtype=np.float64)
+    if (incomes < 0).any():
+        raise ValueError("Taxable income cannot be negative")
+    
+    table = get_rate_table(fy)
+    thresholds = np.array(table.tax_thresholds, dtype=np.float64)
+    bases = np.array(table.tax_bases, dtype=np.float64)
+    rates = np.array(table.tax_rates, dtype=np.float64)
+    
+    # Bracket i covers (threshold[i], threshold[i + 1]]
+    idx = np.searchsorted(thresholds, incomes, side='left') - 1
+    np.clip(idx, 0, len(thresholds) - 1, out=idx)
+    
+    rate = rates[idx]
+    tax = bases[idx] + (incomes - thresholds[idx]) * rate
+    positive = incomes > 0
+    effective = np.divide(tax, incomes, out=np.zeros_like(tax), where=positive)
+    
+    result = np.empty(incomes.shape, dtype=TAX_RESULT_DTYPE)
+    result['taxable_income'] = incomes
+    result['tax_payable'] = _round_like_python(tax, 2)
+    result['marginal_rate'] = rate
+    result['effective_rate'] = _round_like_python(effective, 4)
+    return result
 
 
 class MedicareResult(NamedTuple):
@@ -196,16 +504,19 @@ class MedicareResult(NamedTuple):
     notes: str
 
 
+@_cached
 def calculate_medicare_levy(
     taxable_income: float,
-    sapto_eligible: bool = False
+    sapto_eligible: bool = False,
+    fy: str = DEFAULT_FY
 ) -> MedicareResult:
     """
-    Calculate Medicare levy for FY2024-25.
+    Calculate Medicare levy for a financial year (default FY2024-25).
     
     Args:
         taxable_income: Taxable income in AUD
         sapto_eligible: True if eligible for Seniors and Pensioners Tax Offset
+        fy: Financial year, e.g. '2024-25'
         
     Returns:
         MedicareResult with levy details
@@ -213,7 +524,8 @@ def calculate_medicare_levy(
     if taxable_income < 0:
         raise ValueError("Taxable income cannot be negative")
     
-    thresholds = MEDICARE_REDUCTION_THRESHOLDS['sapto' if sapto_eligible else 'standard']
+    table = get_rate_table(fy)
+    thresholds = table.medicare_thresholds['sapto' if sapto_eligible else 'standard']
     lower = thresholds['lower']
     upper = thresholds['upper']
     
@@ -228,7 +540,7 @@ def calculate_medicare_levy(
     
     if taxable_income <= upper:
         # Reduced levy: 10% of excess over lower threshold
-        levy = (taxable_income - lower) * 0.10
+        levy = (taxable_income - lower) * table.medicare_reduction_rate
         effective_rate = levy / taxable_income if taxable_income > 0 else 0
         return MedicareResult(
             taxable_income=taxable_income,
@@ -238,14 +550,14 @@ def calculate_medicare_levy(
             notes=f"Reduced levy (income between ${lower:,.0f} and ${upper:,.0f})"
         )
     
-    # Full 2% levy
-    levy = taxable_income * MEDICARE_LEVY_RATE
+    # Full levy
+    levy = taxable_income * table.medicare_rate
     return MedicareResult(
         taxable_income=taxable_income,
         medicare_levy=round(levy, 2),
-        levy_rate=MEDICARE_LEVY_RATE,
+        levy_rate=table.medicare_rate,
         reduction_applied=False,
-        notes="Full Medicare levy (2%)"
+        notes=f"Full Medicare levy ({table.medicare_rate * 100:g}%)"
     )
 
 
@@ -258,14 +570,16 @@ class MLSResult(NamedTuple):
     has_hospital_cover: bool
 
 
+@_cached
 def calculate_mls(
     income_for_mls: float,
     family: bool = False,
     dependent_children: int = 0,
-    has_hospital_cover: bool = False
+    has_hospital_cover: bool = False,
+    fy: str = DEFAULT_FY
 ) -> MLSResult:
     """
-    Calculate Medicare levy surcharge for FY2024-25.
+    Calculate Medicare levy surcharge for a financial year (default FY2024-25).
     
     Args:
         income_for_mls: Income for MLS purposes (taxable income + fringe benefits + 
@@ -273,6 +587,7 @@ def calculate_mls(
         family: True if married/de facto
         dependent_children: Number of MLS dependent children (for threshold increase)
         has_hospital_cover: True if appropriate private hospital cover held
+        fy: Financial year, e.g. '2024-25'
         
     Returns:
         MLSResult with surcharge details
@@ -289,38 +604,20 @@ def calculate_mls(
             has_hospital_cover=True
         )
     
-    thresholds = MLS_THRESHOLDS_FAMILY_2024_25 if family else MLS_THRESHOLDS_SINGLE_2024_25
-    
-    # Adjust family thresholds for additional children after first
-    if family and dependent_children > 1:
-        extra_children = dependent_children - 1
-        increment = extra_children * MLS_FAMILY_CHILD_INCREMENT
-        thresholds = [(t + increment if t != float('inf') else t, r) for t, r in thresholds]
-    
-    # Find applicable tier
-    prev_threshold = 0
-    for i, (threshold, rate) in enumerate(thresholds):
-        if income_for_mls <= threshold:
-            if rate == 0:
-                tier_name = "Base tier (no MLS)"
-            elif rate == 0.01:
-                tier_name = "Tier 1"
-            elif rate == 0.0125:
-                tier_name = "Tier 2"
-            else:
-                tier_name = "Tier 3"
-            
-            mls = income_for_mls * rate
-            return MLSResult(
-                income_for_mls=income_for_mls,
-                mls_amount=round(mls, 2),
-                mls_rate=rate,
-                tier=tier_name,
-                has_hospital_cover=False
-            )
-        prev_threshold = threshold
-    
-    return MLSResult(income_for_mls, 0, 0, "Unknown", False)
+    # Family thresholds rise for each additional child after the first
+    thresholds, rates = _family_mls_tiers(fy, dependent_children) if family else get_rate_table(fy).mls_single
+    tier = bisect_left(thresholds, income_for_mls)
+    rate = rates[tier]
+    tier_name = f"Tier {tier}" if tier else "Base tier (no MLS)"
+    
+    mls = income_for_mls * rate
+    return MLSResult(
+        income_for_mls=income_for_mls,
+        mls_amount=round(mls, 2),
+        mls_rate=rate,
+        tier=tier_name,
+        has_hospital_cover=False
+    )
 
 
 class Div293Result(NamedTuple):
@@ -333,14 +630,16 @@ class Div293Result(NamedTuple):
     notes: str
 
 
+@_cached
 def calculate_div293(
     taxable_income: float,
     concessional_contributions: float,
     reportable_fringe_benefits: float = 0,
-    net_investment_loss: float = 0
+    net_investment_loss: float = 0,
+    fy: str = DEFAULT_FY
 ) -> Div293Result:
     """
-    Calculate Division 293 tax for FY2024-25.
+    Calculate Division 293 tax for a financial year (default FY2024-25).
     
     Division 293 applies additional 15% tax on concessional super contributions
     for individuals with income + super > $250,000.
@@ -350,33 +649,37 @@ def calculate_div293(
         concessional_contributions: Employer + salary sacrifice + personal deductible super
         reportable_fringe_benefits: Reportable fringe benefits total
         net_investment_loss: Net financial investment loss + net rental property loss
+        fy: Financial year, e.g. '2024-25'
         
     Returns:
         Div293Result with tax details
     """
+    table = get_rate_table(fy)
+    threshold = table.div293_threshold
+    
     # Division 293 income = taxable income + super contributions + fringe benefits
     # (Note: investment losses are added back)
     div293_income = taxable_income + reportable_fringe_benefits + net_investment_loss
     total_with_super = div293_income + concessional_contributions
     
-    if total_with_super <= DIV293_THRESHOLD:
+    if total_with_super <= threshold:
         return Div293Result(
             div293_income=div293_income,
             concessional_contributions=concessional_contributions,
             div293_applies=False,
             div293_tax=0,
             taxable_contributions=0,
-            notes=f"Income + super (${total_with_super:,.2f}) below ${DIV293_THRESHOLD:,} threshold"
+            notes=f"Income + super (${total_with_super:,.2f}) below ${threshold:,} threshold"
         )
     
     # Amount over threshold
-    excess = total_with_super - DIV293_THRESHOLD
+    excess = total_with_super - threshold
     
     # Taxable contributions = lesser of (excess over threshold, total contributions)
     taxable_contributions = min(excess, concessional_contributions)
     
     # Div 293 tax = 15% of taxable contributions
-    div293_tax = taxable_contributions * DIV293_RATE
+    div293_tax = taxable_contributions * table.div293_rate
     
     return Div293Result(
         div293_income=div293_income,
@@ -384,7 +687,7 @@ def calculate_div293(
         div293_applies=True,
         div293_tax=round(div293_tax, 2),
         taxable_contributions=taxable_contributions,
-        notes=f"${taxable_contributions:,.2f} of super taxed at additional 15%"
+        notes=f"${taxable_contributions:,.2f} of super taxed at additional {table.div293_rate * 100:g}%"
     )
 
 
@@ -396,9 +699,11 @@ class HELPResult(NamedTuple):
     notes: str
 
 
-def calculate_help_repayment(repayment_income: float) -> HELPResult:
+@_cached
+def calculate_help_repayment(repayment_income: float, fy: str = DEFAULT_FY) -> HELPResult:
     """
-    Calculate HELP/HECS loan compulsory repayment for FY2024-25.
+    Calculate HELP/HECS loan compulsory repayment for a financial year
+    (default FY2024-25).
     
     Note: FY2024-25 uses percentage of TOTAL repayment income (not marginal rates).
     From FY2025-26, marginal rates will be used.
@@ -407,6 +712,7 @@ def calculate_help_repayment(repayment_income: float) -> HELPResult:
         repayment_income: Repayment income (taxable income + fringe benefits + 
                          net investment loss + reportable super contributions + 
                          exempt foreign employment income)
+        fy: Financial year, e.g. '2024-25'
         
     Returns:
         HELPResult with repayment details
@@ -414,26 +720,14 @@ def calculate_help_repayment(repayment_income: float) -> HELPResult:
     if repayment_income < 0:
         raise ValueError("Repayment income cannot be negative")
     
-    # Find applicable threshold and rate
-    prev_threshold = 0
-    for threshold, rate in HELP_THRESHOLDS_2024_25:
-        if repayment_income <= threshold:
-            repayment = repayment_income * rate
-            return HELPResult(
-                repayment_income=repayment_income,
-                repayment_rate=rate,
-                repayment_amount=round(repayment, 2),
-                notes=f"{rate*100:.1f}% of total repayment income" if rate > 0 else "Below repayment threshold"
-            )
-        prev_threshold = threshold
-    
-    # Highest tier: 10%
-    repayment = repayment_income * 0.10
+    thresholds, rates = get_rate_table(fy).help
+    rate = rates[bisect_left(thresholds, repayment_income)]
+    repayment = repayment_income * rate
     return HELPResult(
         repayment_income=repayment_income,
-        repayment_rate=0.10,
+        repayment_rate=rate,
         repayment_amount=round(repayment, 2),
-        notes="10% of total repayment income"
+        notes=f"{rate*100:.1f}% of total repayment income" if rate > 0 else "Below repayment threshold"
     )
 
 
@@ -445,6 +739,7 @@ class CCSResult(NamedTuple):
     notes: str
 
 
+@_cached
 def check_ccs_threshold(combined_income: float, children_in_care: int = 1) -> CCSResult:
     """
     Check CCS (Child Care Subsidy) threshold status.
@@ -502,6 +797,7 @@ class TaxSummary(NamedTuple):
     effective_rate: float
 
 
+@_cached
 def calculate_summary(
     taxable_income: float,
     reportable_fringe_benefits: float = 0,
@@ -511,10 +807,11 @@ def calculate_summary(
     has_help_debt: bool = False,
     sapto_eligible: bool = False,
     family: bool = False,
-    dependent_children: int = 0
+    dependent_children: int = 0,
+    fy: str = DEFAULT_FY
 ) -> TaxSummary:
     """
-    Calculate complete tax summary for FY2024-25.
+    Calculate complete tax summary for a financial year (default FY2024-25).
     
     Args:
         taxable_income: Taxable income
@@ -526,34 +823,35 @@ def calculate_summary(
         sapto_eligible: Eligible for Seniors and Pensioners Tax Offset
         family: Has spouse/de facto (affects MLS thresholds)
         dependent_children: Number of MLS dependent children
+        fy: Financial year, e.g. '2024-25'
         
     Returns:
         TaxSummary with all tax components
     """
     # Income tax
-    tax_result = calculate_income_tax(taxable_income)
+    tax_result = calculate_income_tax(taxable_income, fy)
     income_tax = tax_result.tax_payable
     
     # Medicare levy
-    medicare_result = calculate_medicare_levy(taxable_income, sapto_eligible)
+    medicare_result = calculate_medicare_levy(taxable_income, sapto_eligible, fy)
     medicare_levy = medicare_result.medicare_levy
     
     # Medicare levy surcharge
     mls_income = taxable_income + reportable_fringe_benefits + net_investment_loss
-    mls_result = calculate_mls(mls_income, family, dependent_children, has_hospital_cover)
+    mls_result = calculate_mls(mls_income, family, dependent_children, has_hospital_cover, fy)
     mls = mls_result.mls_amount
     
     # HELP repayment
     help_repayment = 0
     if has_help_debt:
         repayment_income = taxable_income + reportable_fringe_benefits + net_investment_loss
-        help_result = calculate_help_repayment(repayment_income)
+        help_result = calculate_help_repayment(repayment_income, fy)
         help_repayment = help_result.repayment_amount
     
     # Division 293
     div293_result = calculate_div293(
         taxable_income, concessional_super, 
-        reportable_fringe_benefits, net_investment_loss
+        reportable_fringe_benefits, net_investment_loss, fy
     )
     div293_tax = div293_result.div293_tax
     
@@ -575,6 +873,496 @@ def calculate_summary(
     )
 
 
+# =============================================================================
+# EXACT (INTEGER-CENTS) CALCULATION
+# Same rules as calculate_summary(), evaluated in int cents and basis points
+# (see au_cents). Every component is rounded half-up to the cent, matching a
+# Decimal ROUND_HALF_UP calculation exactly; the float path instead uses
+# round() on binary floats and can differ by a cent on half-cent ties.
+# =============================================================================
+
+class CentsTable(NamedTuple):
+    """A RateTable converted to int cents (thresholds, bases) and basis points (rates)."""
+    fy: str
+    tax_thresholds: Tuple[int, ...]
+    tax_bases: Tuple[int, ...]      # Tax payable at each threshold, in cents
+    tax_rates: Tuple[int, ...]
+    medicare_bp: int
+    medicare_reduction_bp: int
+    medicare_thresholds: Dict[str, Tuple[int, int]]  # kind -> (lower, upper)
+    mls_single: Tuple[Tuple[float, ...], Tuple[int, ...]]  # Open top tier stays inf
+    mls_family: Tuple[Tuple[float, ...], Tuple[int, ...]]
+    mls_child_increment: int
+    help: Tuple[Tuple[float, ...], Tuple[int, ...]]
+    div293_threshold: int
+    div293_bp: int
+
+
+def _tiers_to_cents(tiers: TierTable) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    thresholds = tuple(t if t == float('inf') else to_cents(t) for t in tiers.thresholds)
+    return thresholds, tuple(rate_to_bp(r) for r in tiers.rates)
+
+
+@lru_cache(maxsize=None)
+def get_cents_table(fy: str = DEFAULT_FY) -> CentsTable:
+    """Integer-cents version of get_rate_table(fy) (cached)."""
+    table = get_rate_table(fy)
+    tax_thresholds = tuple(to_cents(t) for t in table.tax_thresholds)
+    tax_rates = tuple(rate_to_bp(r) for r in table.tax_rates)
+    tax_bases = tuple(to_cents(b) for b in table.tax_bases)
+    
+    # Each published base must equal the tax accrued over the brackets below it
+    for i in range(1, len(tax_bases)):
+        accrued = tax_bases[i - 1] + apply_rate(tax_thresholds[i] - tax_thresholds[i - 1], tax_rates[i - 1])
+        if accrued != tax_bases[i]:
+            raise ValueError(f"FY{fy} tax base at ${table.tax_thresholds[i]:,} does not match "
+                             f"the brackets below it")
+    
+    return CentsTable(
+        fy=fy,
+        tax_thresholds=tax_thresholds,
+        tax_bases=tax_bases,
+        tax_rates=tax_rates,
+        medicare_bp=rate_to_bp(table.medicare_rate),
+        medicare_reduction_bp=rate_to_bp(table.medicare_reduction_rate),
+        medicare_thresholds={
+            kind: (to_cents(t['lower']), to_cents(t['upper']))
+            for kind, t in table.medicare_thresholds.items()
+        },
+        mls_single=_tiers_to_cents(table.mls_single),
+        mls_family=_tiers_to_cents(table.mls_family),
+        mls_child_increment=to_cents(table.mls_child_increment),
+        help=_tiers_to_cents(table.help),
+        div293_threshold=to_cents(table.div293_threshold),
+        div293_bp=rate_to_bp(table.div293_rate),
+    )
+
+
+def summary_cents(
+    taxable_income: int,
+    reportable_fringe_benefits: int = 0,
+    net_investment_loss: int = 0,
+    concessional_super: int = 0,
+    has_hospital_cover: bool = True,
+    has_help_debt: bool = False,
+    sapto_eligible: bool = False,
+    family: bool = False,
+    dependent_children: int = 0,
+    fy: str = DEFAULT_FY
+) -> Tuple[int, int, int, int, int, int]:
+    """
+    Integer core of calculate_summary_exact(): all amounts in int cents.
+    
+    Returns:
+        (income_tax, medicare_levy, mls, help_repayment, div293_tax, total_tax)
+    """
+    if taxable_income < 0:
+        raise ValueError("Taxable income cannot be negative")
+    table = get_cents_table(fy)
+    
+    # Income tax
+    i = max(bisect_left(table.tax_thresholds, taxable_income) - 1, 0)
+    rate = table.tax_rates[i]
+    income_tax = table.tax_bases[i] + apply_rate(taxable_income - table.tax_thresholds[i], rate) if rate else 0
+    
+    # Medicare levy
+    lower, upper = table.medicare_thresholds['sapto' if sapto_eligible else 'standard']
+    if taxable_income <= lower:
+        medicare_levy = 0
+    elif taxable_income <= upper:
+        medicare_levy = apply_rate(taxable_income - lower, table.medicare_reduction_bp)
+    else:
+        medicare_levy = apply_rate(taxable_income, table.medicare_bp)
+    
+    # Medicare levy surcharge
+    mls_income = taxable_income + reportable_fringe_benefits + net_investment_loss
+    if mls_income < 0:
+        raise ValueError("Income cannot be negative")
+    mls = 0
+    if not has_hospital_cover:
+        thresholds, rates = table.mls_family if family else table.mls_single
+        if family and dependent_children > 1:
+            mls_income_shifted = mls_income - (dependent_children - 1) * table.mls_child_increment
+        else:
+            mls_income_shifted = mls_income
+        mls = apply_rate(mls_income, rates[bisect_left(thresholds, mls_income_shifted)])
+    
+    # HELP repayment
+    help_repayment = 0
+    if has_help_debt:
+        thresholds, rates = table.help
+        help_repayment = apply_rate(mls_income, rates[bisect_left(thresholds, mls_income)])
+    
+    # Division 293
+    div293_tax = 0
+    total_with_super = mls_income + concessional_super
+    if total_with_super > table.div293_threshold:
+        taxable_contributions = min(total_with_super - table.div293_threshold, concessional_super)
+        div293_tax = apply_rate(taxable_contributions, table.div293_bp)
+    
+    total_tax = income_tax + medicare_levy + mls + help_repayment + div293_tax
+    return income_tax, medicare_levy, mls, help_repayment, div293_tax, total_tax
+
+
+def calculate_summary_exact(
+    taxable_income: Amount,
+    reportable_fringe_benefits: Amount = 0,
+    net_investment_loss: Amount = 0,
+    concessional_super: Amount = 0,
+    has_hospital_cover: bool = True,
+    has_help_debt: bool = False,
+    sapto_eligible: bool = False,
+    family: bool = False,
+    dependent_children: int = 0,
+    fy: str = DEFAULT_FY
+) -> TaxSummary:
+    """
+    Calculate a complete tax summary exactly, to the cent.
+    
+    Takes the same arguments as calculate_summary(); amounts may be Decimal,
+    str, int or float and are rounded half-up to the cent on entry. Money
+    fields of the result are 2-place Decimals and effective_rate is a
+    4-place Decimal, equal to a Decimal ROUND_HALF_UP calculation.
+    """
+    income = to_cents(taxable_income)
+    income_tax, medicare_levy, mls, help_repayment, div293_tax, total_tax = summary_cents(
+        income, to_cents(reportable_fringe_benefits), to_cents(net_investment_loss),
+        to_cents(concessional_super), has_hospital_cover, has_help_debt,
+        sapto_eligible, family, dependent_children, fy
+    )
+    return TaxSummary(
+        taxable_income=from_cents(income),
+        income_tax=from_cents(income_tax),
+        medicare_levy=from_cents(medicare_levy),
+        medicare_levy_surcharge=from_cents(mls),
+        help_repayment=from_cents(help_repayment),
+        div293_tax=from_cents(div293_tax),
+        total_tax=from_cents(total_tax),
+        net_income=from_cents(income - total_tax),
+        effective_rate=ratio_to_places(total_tax, income, 4) if income > 0 else Decimal('0.0000')
+    )
+
+
+class TaxSummaryBatch(NamedTuple):
+    """Columnar tax summary: TaxSummary fields, one numpy array per field."""
+    taxable_income: "np.ndarray"
+    income_tax: "np.ndarray"
+    medicare_levy: "np.ndarray"
+    medicare_levy_surcharge: "np.ndarray"
+    help_repayment: "np.ndarray"
+    div293_tax: "np.ndarray"
+    total_tax: "np.ndarray"
+    net_income: "np.ndarray"
+    effective_rate: "np.ndarray"
+
+
+def calculate_summary_batch(
+    taxable_income,
+    reportable_fringe_benefits=0,
+    net_investment_loss=0,
+    concessional_super=0,
+    has_hospital_cover=True,
+    has_help_debt=False,
+    sapto_eligible=False,
+    family=False,
+    dependent_children=0,
+    fy: str = DEFAULT_FY
+) -> TaxSummaryBatch:
+    """
+    Calculate complete tax summaries over arrays of people.
+    
+    Takes the same arguments as calculate_summary(), each either an array or
+    a scalar broadcast across all rows, and evaluates every component with
+    masked numpy operations in one pass. Each row equals calculate_summary()
+    for the same inputs.
+    
+    Returns:
+        TaxSummaryBatch with one array per TaxSummary field
+    """
+    _require_numpy()
+    income, fringe, inv_loss, super_cc, cover, help_debt, sapto, fam, children = np.broadcast_arrays(
+        np.asarray(taxable_income, dtype=np.float64),
+        np.asarray(reportable_fringe_benefits, dtype=np.float64),
+        np.asarray(net_investment_loss, dtype=np.float64),
+        np.asarray(concessional_super, dtype=np.float64),
+        np.asarray(has_hospital_cover, dtype=bool),
+        np.asarray(has_help_debt, dtype=bool),
+        np.asarray(sapto_eligible, dtype=bool),
+        np.asarray(family, dtype=bool),
+        np.asarray(dependent_children, dtype=np.int64),
+    )
+    
+    table = get_rate_table(fy)
+    
+    # Income tax (validates taxable income)
+    income_tax = calculate_income_tax_batch(income, fy)['tax_payable']
+    
+    # Medicare levy
+    standard = table.medicare_thresholds['standard']
+    senior = table.medicare_thresholds['sapto']
+    lower = np.where(sapto, float(senior['lower']), float(standard['lower']))
+    upper = np.where(sapto, float(senior['upper']), float(standard['upper']))
+    medicare_levy = np.where(
+        income <= lower, 0.0,
+        np.where(income <= upper, (income - lower) * table.medicare_reduction_rate,
+                 income * table.medicare_rate)
+    )
+    medicare_levy = _round_like_python(medicare_levy, 2)
+    
+    # Medicare levy surcharge: tier = number of finite thresholds below income
+    mls_income = income + fringe + inv_loss
+    if (mls_income < 0).any():
+        raise ValueError("Income cannot be negative")
+    increment = np.where(fam & (children > 1), (children - 1) * table.mls_child_increment, 0)
+    tier = np.zeros(income.shape, dtype=np.intp)
+    for single_t, family_t in zip(table.mls_single.thresholds[:-1], table.mls_family.thresholds[:-1]):
+        threshold = np.where(fam, family_t + increment, single_t)
+        tier += mls_income > threshold
+    single_rates = np.array(table.mls_single.rates)
+    family_rates = np.array(table.mls_family.rates)
+    mls_rate = np.where(fam, family_rates[tier], single_rates[tier])
+    mls = np.where(cover, 0.0, _round_like_python(mls_income * mls_rate, 2))
+    
+    # HELP repayment: first tier whose upper threshold covers the income
+    help_uppers = np.array(table.help.thresholds)
+    help_rates = np.array(table.help.rates)
+    help_tier = np.searchsorted(help_uppers, mls_income, side='left')
+    help_repayment = np.where(help_debt, _round_like_python(mls_income * help_rates[help_tier], 2), 0.0)
+    
+    # Division 293
+    total_with_super = mls_income + super_cc
+    taxable_contributions = np.minimum(total_with_super - table.div293_threshold, super_cc)
+    div293_tax = np.where(
+        total_with_super > table.div293_threshold,
+        _round_like_python(taxable_contributions * table.div293_rate, 2), 0.0
+    )
+    
+    # Totals
+    total_tax = income_tax + medicare_levy + mls + help_repayment + div293_tax
+    net_income = income - total_tax
+    effective_rate = np.divide(total_tax, income, out=np.zeros_like(total_tax), where=income > 0)
+    
+    return TaxSummaryBatch(
+        taxable_income=income,
+        income_tax=income_tax,
+        medicare_levy=medicare_levy,
+        medicare_levy_surcharge=mls,
+        help_repayment=help_repayment,
+        div293_tax=div293_tax,
+        total_tax=_round_like_python(total_tax, 2),
+        net_income=_round_like_python(net_income, 2),
+        effective_rate=_round_like_python(effective_rate, 4)
+    )
+
+
+_SUMMARY_COLUMNS = (
+    'taxable_income', 'reportable_fringe_benefits', 'net_investment_loss',
+    'concessional_super', 'has_hospital_cover', 'has_help_debt',
+    'sapto_eligible', 'family', 'dependent_children',
+)
+
+
+def calculate_summary_table(table, fy: str = DEFAULT_FY) -> TaxSummaryBatch:
+    """
+    Run calculate_summary_batch() over a pandas DataFrame or pyarrow Table.
+    
+    Columns are matched by calculate_summary() parameter name; only
+    taxable_income is required, missing columns take their defaults.
+    """
+    _require_numpy()
+    names = getattr(table, 'column_names', None) or list(table.keys())
+    kwargs = {name: np.asarray(table[name]) for name in _SUMMARY_COLUMNS if name in names}
+    return calculate_summary_batch(**kwargs, fy=fy)
+
+
+# =============================================================================
+# BREAKPOINT SOLVER
+# For a fixed household profile, total tax (income tax + Medicare + MLS +
+# HELP + Div 293) is piecewise linear in taxable income. Every component
+# changes formula only at a rate-table threshold, so the whole curve is
+# compiled once into a breakpoint list and queried with bisect.
+# =============================================================================
+
+class TaxCurve(NamedTuple):
+    """
+    Total tax as a piecewise-linear function of taxable income.
+    
+    Segment i covers (breakpoints[i - 1], breakpoints[i]] (the first starts
+    at 0, the last is open), where total tax = intercepts[i] + slopes[i] * x.
+    MLS and HELP apply their rate to the whole income, so the curve can jump
+    up at a breakpoint: jumps[i] is the step just above breakpoints[i].
+    
+    Values are before per-component cent rounding, so they can differ from
+    calculate_summary().total_tax by a few cents. The MLS and HELP
+    breakpoints are placed where calculate_summary()'s own float sum of the
+    incomes crosses each threshold, so both pick the same tier at every
+    income, breakpoints included.
+    """
+    breakpoints: array
+    slopes: array
+    intercepts: array
+    jumps: array
+    upper_tax: array  # Total tax at the top of each bounded segment
+    
+    def segment(self, taxable_income: float) -> int:
+        """Index of the segment containing taxable_income."""
+        return bisect_left(self.breakpoints, taxable_income)
+    
+    def total_tax(self, taxable_income: float) -> float:
+        """Total tax at taxable_income."""
+        i = bisect_left(self.breakpoints, taxable_income)
+        return self.intercepts[i] + self.slopes[i] * taxable_income
+    
+    def marginal_rate(self, taxable_income: float) -> float:
+        """Effective marginal rate (all components) on the segment containing taxable_income."""
+        return self.slopes[bisect_left(self.breakpoints, taxable_income)]
+    
+    def next_breakpoint(self, taxable_income: float) -> Optional[Tuple[float, float]]:
+        """(income, jump) of the first breakpoint at or above taxable_income, or None."""
+        i = bisect_left(self.breakpoints, taxable_income)
+        if i == len(self.breakpoints):
+            return None
+        return self.breakpoints[i], self.jumps[i]
+    
+    def income_for_tax(self, total_tax: float) -> float:
+        """
+        Lowest taxable income at which total tax reaches total_tax.
+        
+        If a jump carries tax past the target, the breakpoint where the jump
+        happens is returned (any income above it reaches the target).
+        """
+        i = bisect_left(self.upper_tax, total_tax)
+        lower = self.breakpoints[i - 1] if i else 0.0
+        slope = self.slopes[i]
+        if slope == 0:
+            if self.intercepts[i] < total_tax:
+                raise ValueError(f"Total tax never reaches {total_tax:,.2f}")
+            return lower
+        return max((total_tax - self.intercepts[i]) / slope, lower)
+
+
+def _tier_boundary(threshold: float, reportable_fringe_benefits: float, net_investment_loss: float) -> float:
+    """
+    Highest taxable income whose MLS/HELP income, summed as calculate_summary()
+    sums it, is still at or below threshold (so still in the lower tier).
+    """
+    x = threshold - reportable_fringe_benefits - net_investment_loss
+    while x + reportable_fringe_benefits + net_investment_loss > threshold:
+        x = math.nextafter(x, -math.inf)
+    while math.nextafter(x, math.inf) + reportable_fringe_benefits + net_investment_loss <= threshold:
+        x = math.nextafter(x, math.inf)
+    return x
+
+
+def _tax_line(
+    table: RateTable,
+    taxable_income: float,
+    other_income: float,
+    concessional_super: float,
+    sapto_eligible: bool,
+    income_tiers: List[TierTable]
+) -> Tuple[float, float]:
+    """
+    (slope, intercept) of total tax on the segment containing taxable_income.
+    
+    income_tiers are the MLS/HELP tier tables that apply, with thresholds
+    already moved onto the taxable-income axis.
+    """
+    slope = intercept = 0.0
+    
+    # Income tax: base + (x - threshold) * rate
+    i = max(bisect_left(table.tax_thresholds, taxable_income) - 1, 0)
+    rate = table.tax_rates[i]
+    if rate:
+        slope += rate
+        intercept += table.tax_bases[i] - table.tax_thresholds[i] * rate
+    
+    # Medicare levy: nil, then shade-in, then full rate
+    thresholds = table.medicare_thresholds['sapto' if sapto_eligible else 'standard']
+    if taxable_income > thresholds['upper']:
+        slope += table.medicare_rate
+    elif taxable_income > thresholds['lower']:
+        slope += table.medicare_reduction_rate
+        intercept -= thresholds['lower'] * table.medicare_reduction_rate
+    
+    # MLS and HELP: a flat rate on the whole of x + other_income
+    for tiers in income_tiers:
+        rate = tiers.rates[tiers.tier(taxable_income)]
+        slope += rate
+        intercept += other_income * rate
+    
+    # Division 293: rate * min(x + other_income + super - threshold, super)
+    excess = taxable_income + other_income + concessional_super - table.div293_threshold
+    if excess > 0:
+        if excess < concessional_super:
+            slope += table.div293_rate
+            intercept += (other_income + concessional_super - table.div293_threshold) * table.div293_rate
+        else:
+            intercept += concessional_super * table.div293_rate
+    
+    return slope, intercept
+
+
+@lru_cache(maxsize=256)
+def build_tax_curve(
+    reportable_fringe_benefits: float = 0,
+    net_investment_loss: float = 0,
+    concessional_super: float = 0,
+    has_hospital_cover: bool = True,
+    has_help_debt: bool = False,
+    sapto_eligible: bool = False,
+    family: bool = False,
+    dependent_children: int = 0,
+    fy: str = DEFAULT_FY
+) -> TaxCurve:
+    """
+    Compile the total-tax curve for one household profile (cached).
+    
+    Takes the calculate_summary() arguments other than taxable_income, which
+    becomes the curve's variable. Queries on the result are O(log n) in the
+    number of breakpoints (a few dozen).
+    """
+    table = get_rate_table(fy)
+    other_income = reportable_fringe_benefits + net_investment_loss
+    mls_tiers = _family_mls_tiers(fy, dependent_children) if family else table.mls_single
+    
+    # MLS and HELP tiers, moved onto the taxable-income axis
+    income_tiers = []
+    for applies, tiers in ((not has_hospital_cover, mls_tiers), (has_help_debt, table.help)):
+        if applies:
+            bounds = [_tier_boundary(t, reportable_fringe_benefits, net_investment_loss)
+                      for t in tiers.thresholds[:-1]]
+            income_tiers.append(TierTable(array('d', bounds + [float('inf')]), tiers.rates))
+    
+    # Every threshold, moved onto the taxable-income axis
+    points = set(table.tax_thresholds[1:])
+    points.update(table.medicare_thresholds['sapto' if sapto_eligible else 'standard'].values())
+    for tiers in income_tiers:
+        points.update(tiers.thresholds[:-1])
+    if concessional_super > 0:
+        start = table.div293_threshold - other_income - concessional_super
+        points.update((start, start + concessional_super))
+    breakpoints = array('d', sorted(p for p in points if p > 0))
+    
+    # Each segment's line, read off at an interior point
+    slopes, intercepts = array('d'), array('d')
+    lowers = [0.0] + list(breakpoints)
+    uppers = list(breakpoints) + [lowers[-1] + 2.0]
+    for lower, upper in zip(lowers, uppers):
+        slope, intercept = _tax_line(
+            table, (lower + upper) / 2, other_income, concessional_super,
+            sapto_eligible, income_tiers
+        )
+        slopes.append(slope)
+        intercepts.append(intercept)
+    
+    upper_tax = array('d', [intercepts[i] + slopes[i] * b for i, b in enumerate(breakpoints)])
+    jumps = array('d', [
+        intercepts[i + 1] + slopes[i + 1] * b - upper_tax[i] for i, b in enumerate(breakpoints)
+    ])
+    return TaxCurve(breakpoints, slopes, intercepts, jumps, upper_tax)
+
+
 # =============================================================================
 # CLI INTERFACE
 # =============================================================================
@@ -593,10 +1381,10 @@ def format_percentage(rate: float) -> str:
 
 def cmd_tax(args: argparse.Namespace) -> None:
     """Handle 'tax' command."""
-    result = calculate_income_tax(args.income)
+    result = calculate_income_tax(args.income, args.fy)
     
     print(f"\n{'='*60}")
-    print("INCOME TAX CALCULATION - FY2024-25")
+    print(f"INCOME TAX CALCULATION - FY{args.fy}")
     print(f"{'='*60}")
     print(f"Taxable Income:    {format_currency(result.taxable_income)}")
     print(f"Income Tax:        {format_currency(result.tax_payable)}")
@@ -608,10 +1396,10 @@ def cmd_tax(args: argparse.Namespace) -> None:
 
 def cmd_medicare(args: argparse.Namespace) -> None:
     """Handle 'medicare' command."""
-    result = calculate_medicare_levy(args.income, args.sapto)
+    result = calculate_medicare_levy(args.income, args.sapto, args.fy)
     
     print(f"\n{'='*60}")
-    print("MEDICARE LEVY CALCULATION - FY2024-25")
+    print(f"MEDICARE LEVY CALCULATION - FY{args.fy}")
     print(f"{'='*60}")
     print(f"Taxable Income:    {format_currency(result.taxable_income)}")
     print(f"Medicare Levy:     {format_currency(result.medicare_levy)}")
@@ -626,11 +1414,12 @@ def cmd_mls(args: argparse.Namespace) -> None:
         args.income, 
         args.family, 
         args.children if hasattr(args, 'children') else 0,
-        args.has_cover
+        args.has_cover,
+        args.fy
     )
     
     print(f"\n{'='*60}")
-    print("MEDICARE LEVY SURCHARGE - FY2024-25")
+    print(f"MEDICARE LEVY SURCHARGE - FY{args.fy}")
     print(f"{'='*60}")
     print(f"Income for MLS:    {format_currency(result.income_for_mls)}")
     print(f"Hospital Cover:    {'Yes' if result.has_hospital_cover else 'No'}")
@@ -647,31 +1436,33 @@ def cmd_div293(args: argparse.Namespace) -> None:
         args.income,
         args.super_contributions,
         args.fringe_benefits if hasattr(args, 'fringe_benefits') else 0,
-        args.investment_loss if hasattr(args, 'investment_loss') else 0
+        args.investment_loss if hasattr(args, 'investment_loss') else 0,
+        args.fy
     )
+    table = get_rate_table(args.fy)
     
     print(f"\n{'='*60}")
-    print("DIVISION 293 TAX - FY2024-25")
+    print(f"DIVISION 293 TAX - FY{args.fy}")
     print(f"{'='*60}")
     print(f"Taxable Income:         {format_currency(args.income)}")
     print(f"Concessional Super:     {format_currency(result.concessional_contributions)}")
     print(f"Div 293 Income:         {format_currency(result.div293_income)}")
     print(f"Total (Income + Super): {format_currency(result.div293_income + result.concessional_contributions)}")
-    print(f"Threshold:              {format_currency(DIV293_THRESHOLD)}")
+    print(f"Threshold:              {format_currency(table.div293_threshold)}")
     print(f"Div 293 Applies:        {'Yes' if result.div293_applies else 'No'}")
     if result.div293_applies:
         print(f"Taxable Contributions:  {format_currency(result.taxable_contributions)}")
-        print(f"Div 293 Tax (15%):      {format_currency(result.div293_tax)}")
+        print(f"Div 293 Tax ({table.div293_rate * 100:g}%):      {format_currency(result.div293_tax)}")
     print(f"Notes:                  {result.notes}")
     print(f"{'='*60}\n")
 
 
 def cmd_help_loan(args: argparse.Namespace) -> None:
     """Handle 'help-loan' command."""
-    result = calculate_help_repayment(args.income)
+    result = calculate_help_repayment(args.income, args.fy)
     
     print(f"\n{'='*60}")
-    print("HELP/HECS LOAN REPAYMENT - FY2024-25")
+    print(f"HELP/HECS LOAN REPAYMENT - FY{args.fy}")
     print(f"{'='*60}")
     print(f"Repayment Income:  {format_currency(result.repayment_income)}")
     print(f"Repayment Rate:    {format_percentage(result.repayment_rate)}")
@@ -706,11 +1497,12 @@ def cmd_summary(args: argparse.Namespace) -> None:
         has_help_debt=args.help_debt if hasattr(args, 'help_debt') else False,
         sapto_eligible=args.sapto if hasattr(args, 'sapto') else False,
         family=args.family if hasattr(args, 'family') else False,
-        dependent_children=args.children if hasattr(args, 'children') else 0
+        dependent_children=args.children if hasattr(args, 'children') else 0,
+        fy=args.fy
     )
     
     print(f"\n{'='*60}")
-    print("TAX SUMMARY - FY2024-25")
+    print(f"TAX SUMMARY - FY{args.fy}")
     print(f"{'='*60}")
     print(f"Taxable Income:              {format_currency(result.taxable_income):>15}")
     print(f"{'─'*60}")
@@ -729,6 +1521,153 @@ def cmd_summary(args: argparse.Namespace) -> None:
     print(f"{'='*60}\n")
 
 
+def cmd_marginal(args: argparse.Namespace) -> None:
+    """Handle 'marginal' command."""
+    curve = build_tax_curve(
+        reportable_fringe_benefits=args.fringe_benefits,
+        net_investment_loss=args.investment_loss,
+        concessional_super=args.super_contributions,
+        has_hospital_cover=not args.no_hospital_cover,
+        has_help_debt=args.help_debt,
+        sapto_eligible=args.sapto,
+        family=args.family,
+        dependent_children=args.children,
+        fy=args.fy
+    )
+    
+    print(f"\n{'='*60}")
+    print(f"MARGINAL RATE - FY{args.fy}")
+    print(f"{'='*60}")
+    print(f"Taxable Income:    {format_currency(args.income)}")
+    print(f"Total Tax:         {format_currency(curve.total_tax(args.income))}")
+    print(f"Marginal Rate:     {format_percentage(curve.marginal_rate(args.income))}")
+    nxt = curve.next_breakpoint(args.income)
+    if nxt:
+        income, jump = nxt
+        print(f"Next Breakpoint:   {format_currency(income)}")
+        if jump > 0.005:
+            print(f"Step Above It:     {format_currency(jump)}")
+    else:
+        print("Next Breakpoint:   None (top rate)")
+    if args.target_tax is not None:
+        print(f"Income for Tax of {format_currency(args.target_tax)}: "
+              f"{format_currency(curve.income_for_tax(args.target_tax))}")
+    print(f"{'='*60}\n")
+
+
+_TRUE_STRINGS = {'1', 'true', 't', 'yes', 'y'}
+_FALSE_STRINGS = {'', '0', 'false', 'f', 'no', 'n'}
+
+
+def _parse_flag(value) -> bool:
+    """Parse a CSV/JSON boolean ('yes', 'true', 1, ...)."""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_STRINGS:
+        return True
+    if text in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Not a true/false value: {value!r}")
+
+
+def _finite_float(text: str) -> float:
+    """float() that rejects inf and nan, which cannot be written back as JSON."""
+    value = float(text)
+    if not math.isfinite(value):
+        raise ValueError(f"Not a finite number: {text}")
+    return value
+
+
+def _reject_constant(name: str):
+    """json.loads parse_constant hook: NaN and Infinity are not valid JSON numbers."""
+    raise ValueError(f"Not a finite number: {name}")
+
+
+def _parse_record(line: str) -> dict:
+    """One JSONL batch line as a record; raises ValueError if it is not a finite-valued object."""
+    record = json.loads(line, parse_float=_finite_float, parse_constant=_reject_constant)
+    if not isinstance(record, dict):
+        raise ValueError(f"Expected a JSON object, got {type(record).__name__}")
+    return record
+
+
+def _summary_kwargs(record: dict, fy: str) -> dict:
+    """Map a batch record (keyed by calculate_summary parameter names) to kwargs."""
+    if record.get('taxable_income') in (None, ''):
+        raise ValueError("taxable_income is required")
+    kwargs = {'fy': record.get('fy') or fy}
+    for name in _SUMMARY_COLUMNS:
+        value = record.get(name)
+        if value is None or value == '':
+            continue
+        if name in ('has_hospital_cover', 'has_help_debt', 'sapto_eligible', 'family'):
+            kwargs[name] = _parse_flag(value)
+        elif name == 'dependent_children':
+            kwargs[name] = int(value)
+        else:
+            kwargs[name] = _finite_float(value)
+    return kwargs
+
+
+def cmd_batch(args: argparse.Namespace) -> int:
+    """Handle 'batch' command: stream CSV/JSONL records through calculate_summary."""
+    fmt = args.format
+    if fmt is None:
+        fmt = 'jsonl' if args.input.lower().endswith(('.jsonl', '.json')) else 'csv'
+    
+    source = sys.stdin if args.input == '-' else open(args.input, newline='')
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    errors = 0
+    try:
+        if fmt == 'csv':
+            reader = csv.DictReader(source)
+            fields = list(reader.fieldnames or [])
+            fields += [f for f in TaxSummary._fields if f not in fields]
+            writer = csv.DictWriter(sink, fieldnames=fields, extrasaction='ignore')
+            writer.writeheader()
+            records = reader
+            parse = None
+            write = writer.writerow
+        else:
+            # Lines are parsed per row, so one bad line is skipped like any bad record
+            records = (line for line in source if line.strip())
+            parse = _parse_record
+            write = lambda row: sink.write(json.dumps(row) + "\n")
+        
+        # Row numbers count data rows from 1 (excluding any CSV header)
+        for row_number, record in enumerate(records, 1):
+            try:
+                if parse:
+                    record = parse(record)
+                summary = calculate_summary(**_summary_kwargs(record, args.fy))
+            except (json.JSONDecodeError, TypeError, ValueError, OverflowError) as e:
+                errors += 1
+                print(f"Row {row_number}: {e}", file=sys.stderr)
+                continue
+            write({**record, **summary._asdict()})
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    
+    if errors:
+        print(f"{errors} row(s) skipped", file=sys.stderr)
+        return 1
+    return 0
+
+
+def print_cache_stats() -> None:
+    """Print cache_info() as a table on stderr."""
+    print(f"\n{'Calculator':<26} {'Hits':>10} {'Misses':>10} {'Hit rate':>9} {'Size':>7}", file=sys.stderr)
+    print("-" * 66, file=sys.stderr)
+    for name, info in cache_info().items():
+        calls = info.hits + info.misses
+        hit_rate = format_percentage(info.hits / calls) if calls else "-"
+        print(f"{name:<26} {info.hits:>10,} {info.misses:>10,} {hit_rate:>9} {info.currsize:>7,}", file=sys.stderr)
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -736,22 +1675,33 @@ def main() -> int:
         epilog="All rates are from the Australian Taxation Office (ATO) for FY2024-25."
     )
     
+    parser.add_argument('--cache-size', type=int,
+                        help='Cache up to N results per calculator (default: off)')
+    parser.add_argument('--stats', action='store_true',
+                        help='Print calculator cache hit/miss statistics to stderr '
+                             f'(enables a {DEFAULT_CACHE_SIZE}-entry cache unless --cache-size is given)')
+    
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
+    # --fy is shared by every command that reads the rate tables
+    fy_parser = argparse.ArgumentParser(add_help=False)
+    fy_parser.add_argument('--fy', default=DEFAULT_FY, choices=sorted(RATE_TABLES),
+                           help=f'Financial year (default: {DEFAULT_FY})')
+    
     # tax command
-    tax_parser = subparsers.add_parser('tax', help='Calculate income tax')
+    tax_parser = subparsers.add_parser('tax', help='Calculate income tax', parents=[fy_parser])
     tax_parser.add_argument('income', type=float, help='Taxable income in AUD')
     tax_parser.set_defaults(func=cmd_tax)
     
     # medicare command
-    medicare_parser = subparsers.add_parser('medicare', help='Calculate Medicare levy')
+    medicare_parser = subparsers.add_parser('medicare', help='Calculate Medicare levy', parents=[fy_parser])
     medicare_parser.add_argument('income', type=float, help='Taxable income in AUD')
     medicare_parser.add_argument('--sapto', action='store_true', 
                                  help='Eligible for Seniors and Pensioners Tax Offset')
     medicare_parser.set_defaults(func=cmd_medicare)
     
     # mls command
-    mls_parser = subparsers.add_parser('mls', help='Calculate Medicare levy surcharge')
+    mls_parser = subparsers.add_parser('mls', help='Calculate Medicare levy surcharge', parents=[fy_parser])
     mls_parser.add_argument('income', type=float, 
                            help='Income for MLS purposes (taxable + FBT + investment loss + super)')
     mls_parser.add_argument('--family', action='store_true', help='Family/couple status')
@@ -762,7 +1712,7 @@ def main() -> int:
     mls_parser.set_defaults(func=cmd_mls)
     
     # div293 command
-    div293_parser = subparsers.add_parser('div293', help='Calculate Division 293 super tax')
+    div293_parser = subparsers.add_parser('div293', help='Calculate Division 293 super tax', parents=[fy_parser])
     div293_parser.add_argument('income', type=float, help='Taxable income in AUD')
     div293_parser.add_argument('super_contributions', type=float, 
                               help='Concessional super contributions')
@@ -773,7 +1723,7 @@ def main() -> int:
     div293_parser.set_defaults(func=cmd_div293)
     
     # help-loan command
-    help_parser = subparsers.add_parser('help-loan', help='Calculate HELP/HECS repayment')
+    help_parser = subparsers.add_parser('help-loan', help='Calculate HELP/HECS repayment', parents=[fy_parser])
     help_parser.add_argument('income', type=float, 
                             help='Repayment income (taxable + FBT + investment loss + super)')
     help_parser.set_defaults(func=cmd_help_loan)
@@ -785,42 +1735,75 @@ def main() -> int:
                            help='Number of children in approved child care')
     ccs_parser.set_defaults(func=cmd_ccs)
     
+    # Household options shared by summary and marginal
+    household_parser = argparse.ArgumentParser(add_help=False)
+    household_parser.add_argument('income', type=float, help='Taxable income in AUD')
+    household_parser.add_argument('--fringe-benefits', type=float, default=0,
+                                  help='Reportable fringe benefits')
+    household_parser.add_argument('--investment-loss', type=float, default=0,
+                                  help='Net investment loss')
+    household_parser.add_argument('--super-contributions', type=float, default=0,
+                                  help='Concessional super contributions')
+    household_parser.add_argument('--no-hospital-cover', action='store_true',
+                                  help='No private hospital cover (adds MLS)')
+    household_parser.add_argument('--help-debt', action='store_true',
+                                  help='Has HELP/HECS debt')
+    household_parser.add_argument('--sapto', action='store_true',
+                                  help='Eligible for SAPTO')
+    household_parser.add_argument('--family', action='store_true',
+                                  help='Family status for MLS')
+    household_parser.add_argument('--children', type=int, default=0,
+                                  help='MLS dependent children')
+    
     # summary command
-    summary_parser = subparsers.add_parser('summary', help='Full tax summary')
-    summary_parser.add_argument('income', type=float, help='Taxable income in AUD')
-    summary_parser.add_argument('--fringe-benefits', type=float, default=0,
-                               help='Reportable fringe benefits')
-    summary_parser.add_argument('--investment-loss', type=float, default=0,
-                               help='Net investment loss')
-    summary_parser.add_argument('--super-contributions', type=float, default=0,
-                               help='Concessional super contributions')
-    summary_parser.add_argument('--no-hospital-cover', action='store_true',
-                               help='No private hospital cover (adds MLS)')
-    summary_parser.add_argument('--help-debt', action='store_true',
-                               help='Has HELP/HECS debt')
-    summary_parser.add_argument('--sapto', action='store_true',
-                               help='Eligible for SAPTO')
-    summary_parser.add_argument('--family', action='store_true',
-                               help='Family status for MLS')
-    summary_parser.add_argument('--children', type=int, default=0,
-                               help='MLS dependent children')
+    summary_parser = subparsers.add_parser('summary', help='Full tax summary',
+                                           parents=[fy_parser, household_parser])
     summary_parser.set_defaults(func=cmd_summary)
     
+    # marginal command
+    marginal_parser = subparsers.add_parser(
+        'marginal', parents=[fy_parser, household_parser],
+        help='Marginal rate and breakpoints of total tax'
+    )
+    marginal_parser.add_argument('--target-tax', type=float,
+                                 help='Also solve for the income where total tax reaches this amount')
+    marginal_parser.set_defaults(func=cmd_marginal)
+    
+    # batch command
+    batch_parser = subparsers.add_parser(
+        'batch', parents=[fy_parser],
+        help='Stream CSV/JSONL rows through the full tax summary'
+    )
+    batch_parser.add_argument('input', nargs='?', default='-',
+                              help='Input file, or - for stdin (default)')
+    batch_parser.add_argument('--format', choices=['csv', 'jsonl'],
+                              help='Record format (default: from extension, else csv)')
+    batch_parser.add_argument('--output', '-o', default='-',
+                              help='Output file, or - for stdout (default)')
+    batch_parser.set_defaults(func=cmd_batch)
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return 1
     
+    if args.cache_size is not None:
+        enable_cache(args.cache_size)
+    elif args.stats:
+        enable_cache()
+    
     try:
-        args.func(args)
-        return 0
+        return args.func(args) or 0
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
+    finally:
+        if args.stats:
+            print_cache_stats()
 
 
 if __name__ == '__main__':
@@ -5,14 +5,23 @@ Extracts transactions from PDF statements
 
 import fitz
 import re
-import csv
 from pathlib import Path
 from datetime import datetime
+from transaction_table import TransactionTable, save_table
+
+# Column kinds of the transaction table (see transaction_table.py)
+BANK_AUSTRALIA_COLUMNS = {
+    'date': 'code',
+    'description': 'code',
+    'amount': 'money',
+    'account': 'code',
+    'source': 'code',
+}
 
 def parse_bank_australia_statement(pdf_path):
-    """Parse a Bank Australia eStatement PDF and extract transactions."""
+    """Parse a Bank Australia eStatement PDF and extract transactions (a TransactionTable)."""
     pdf = fitz.open(pdf_path)
-    transactions = []
+    transactions = TransactionTable(BANK_AUSTRALIA_COLUMNS)
     
     # Extract statement date from filename (e.g., "eStatement - Jul 2024.pdf")
     filename = Path(pdf_path).name
@@ -166,7 +175,7 @@ def parse_bank_australia_statement(pdf_path):
 def parse_all_statements(folder_path):
     """Parse all Bank Australia statements in a folder."""
     folder = Path(folder_path)
-    all_transactions = []
+    all_transactions = TransactionTable(BANK_AUSTRALIA_COLUMNS)
     
     for pdf_file in sorted(folder.glob('eStatement - *.pdf')):
         print(f"Processing: {pdf_file.name}")
@@ -194,10 +203,10 @@ def main():
     print(f"\nTotal transactions extracted: {len(transactions)}")
     
     # Filter to FY24-25 only (1 Jul 2024 - 30 Jun 2025)
-    fy_transactions = [
-        t for t in transactions
-        if '2024-07-01' <= t['date'] <= '2025-06-30'
-    ]
+    fy_transactions = transactions.where(
+        '2024-07-01' <= date <= '2025-06-30'
+        for date in transactions.column('date')
+    )
     
     print(f"FY24-25 transactions: {len(fy_transactions)}")
     
@@ -205,16 +214,17 @@ def main():
     output_folder.mkdir(parents=True, exist_ok=True)
     output_file = output_folder / 'bank_australia_transactions.csv'
     
-    with open(output_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['date', 'description', 'amount', 'account', 'source'])
-        writer.writeheader()
-        writer.writerows(sorted(fy_transactions, key=lambda x: x['date']))
+    parquet = save_table(fy_transactions.sort('date'), output_file, list(BANK_AUSTRALIA_COLUMNS),
+                         date_formats={'date': '%Y-%m-%d'})
     
     print(f"\nSaved to: {output_file}")
+    if parquet:
+        print(f"  and {parquet}")
     
     # Print summary
-    debits = sum(t['amount'] for t in fy_transactions if t['amount'] < 0)
-    credits = sum(t['amount'] for t in fy_transactions if t['amount'] > 0)
+    amounts = fy_transactions.column('amount')
+    debits = sum(amount for amount in amounts if amount < 0)
+    credits = sum(amount for amount in amounts if amount > 0)
     
     print(f"\nSummary:")
     print(f"  Total debits (expenses): ${abs(debits):,.2f}")
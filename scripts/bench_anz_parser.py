@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the ANZ statement parsers.
+
+Parses the ANZ statements under 5. Bank Statements/FY24-25 with both
+parsers in anz_parser.py:
+    line     page text in reading order, one-pass token scan
+    layout   word coordinates bucketed into the table's columns
+Each is timed end to end from the PDF (text cache off) and on
+pre-extracted input (page text or word boxes), and the transactions are
+compared. The layout parser is also run on words in shuffled order, to
+check it does not depend on the order extraction emits them in.
+
+Usage:
+    python scripts/bench_anz_parser.py                # 5 passes
+    python scripts/bench_anz_parser.py --repeat 20
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from anz_parser import (
+    STATEMENTS_DIR, find_columns, iter_layout_page_transactions, iter_layout_transactions_from_pdf,
+    iter_page_transactions, iter_transactions_from_pdf,
+)
+from text_cache import disable_cache, extract_pdf_text
+
+
+def layout_from_words(pages: list, name: str) -> list:
+    """iter_layout_transactions_from_pdf() over pre-extracted word lists."""
+    transactions = []
+    lefts = None
+    for words in pages:
+        lefts = find_columns(words) or lefts
+        if lefts is not None:
+            transactions.extend(iter_layout_page_transactions(words, lefts, name))
+    return transactions
+
+
+def time_path(fn, inputs: list, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [fn(item) for item in inputs]
+    return (time.perf_counter() - start) / repeat, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark line-based vs layout-aware ANZ parsing')
+    parser.add_argument('--repeat', type=int, default=5, help='Passes over the statements')
+    args = parser.parse_args()
+
+    root_path = Path(__file__).parent.parent
+    pdfs = sorted((root_path / STATEMENTS_DIR).glob("*ANZ*.pdf"))
+    if not pdfs:
+        print(f"No ANZ statements in {root_path / STATEMENTS_DIR}")
+        return
+    disable_cache()
+
+    texts = [(pdf.name, extract_pdf_text(pdf)) for pdf in pdfs]
+    words = []
+    for pdf in pdfs:
+        with fitz.open(pdf) as doc:
+            words.append((pdf.name, [page.get_text("words") for page in doc]))
+    page_count = sum(len(pages) for _, pages in texts)
+
+    rows = [
+        ("line, from PDF", *time_path(lambda pdf: list(iter_transactions_from_pdf(pdf)), pdfs, args.repeat)),
+        ("layout, from PDF", *time_path(lambda pdf: list(iter_layout_transactions_from_pdf(pdf)), pdfs, args.repeat)),
+        ("line, parse only", *time_path(
+            lambda item: [tx for text in item[1] for tx in iter_page_transactions(text, item[0])], texts, args.repeat)),
+        ("layout, parse only", *time_path(lambda item: layout_from_words(item[1], item[0]), words, args.repeat)),
+    ]
+
+    line_txs = rows[0][2]
+    layout_txs = rows[1][2]
+    matching = sum(a == b for a, b in zip(line_txs, layout_txs))
+    shuffled = [(name, [random.sample(page, len(page)) for page in pages]) for name, pages in words]
+    order_free = [layout_from_words(pages, name) for name, pages in shuffled] == layout_txs
+
+    print(f"Statements: {len(pdfs)} ({page_count} pages)")
+    print(f"Transactions: line {sum(map(len, line_txs))}, layout {sum(map(len, layout_txs))}; "
+          f"identical in {matching}/{len(pdfs)} statements")
+    print(f"Layout parser unchanged with words shuffled: {'yes' if order_free else 'NO'}")
+    print(f"\n{'Path':<20} {'Seconds':>9} {'ms/page':>9}")
+    print("-" * 40)
+    for name, seconds, _ in rows:
+        print(f"{name:<20} {seconds:>9.3f} {seconds * 1000 / page_count:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the exact integer-cents summary path.
+
+Times the full tax summary three ways over the same synthetic households:
+    float    calculate_summary()          (binary floats, round())
+    decimal  decimal_summary() below      (Decimal, ROUND_HALF_UP, as in
+                                           verify_calculations.py)
+    cents    summary_cents()              (int cents, au_cents)
+and checks that the cents path equals the Decimal path on every row, and
+counts rows where the float path is a cent out.
+
+Usage:
+    python scripts/bench_au_cents.py                # 200,000 households
+    python scripts/bench_au_cents.py --rows 1e6
+"""
+
+import argparse
+import random
+import time
+from bisect import bisect_left
+from decimal import Decimal, ROUND_HALF_UP
+
+from au_cents import from_cents, to_cents
+from au_tax import (
+    DEFAULT_FY, calculate_summary, calculate_summary_exact, get_rate_table, summary_cents,
+)
+
+CENT = Decimal('0.01')
+
+
+def currency(value: Decimal) -> Decimal:
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def decimal_summary(taxable_income: Decimal, fringe: Decimal, super_cc: Decimal,
+                    has_hospital_cover: bool, has_help_debt: bool, fy: str = DEFAULT_FY) -> tuple:
+    """Reference: calculate_summary() rules in Decimal, each component rounded half-up."""
+    table = get_rate_table(fy)
+    d = lambda v: Decimal(str(v))
+
+    i = max(bisect_left(table.tax_thresholds, taxable_income) - 1, 0)
+    rate = d(table.tax_rates[i])
+    income_tax = currency(d(table.tax_bases[i]) + (taxable_income - d(table.tax_thresholds[i])) * rate) if rate else 0
+
+    lower, upper = (d(v) for v in table.medicare_thresholds['standard'].values())
+    if taxable_income <= lower:
+        medicare = 0
+    elif taxable_income <= upper:
+        medicare = currency((taxable_income - lower) * d(table.medicare_reduction_rate))
+    else:
+        medicare = currency(taxable_income * d(table.medicare_rate))
+
+    mls_income = taxable_income + fringe
+    mls = 0
+    if not has_hospital_cover:
+        thresholds, rates = table.mls_single
+        mls = currency(mls_income * d(rates[bisect_left(thresholds, mls_income)]))
+
+    help_repayment = 0
+    if has_help_debt:
+        thresholds, rates = table.help
+        help_repayment = currency(mls_income * d(rates[bisect_left(thresholds, mls_income)]))
+
+    div293 = 0
+    total_with_super = mls_income + super_cc
+    if total_with_super > d(table.div293_threshold):
+        div293 = currency(min(total_with_super - d(table.div293_threshold), super_cc) * d(table.div293_rate))
+
+    total = income_tax + medicare + mls + help_repayment + div293
+    return income_tax, medicare, mls, help_repayment, div293, total
+
+
+def synthetic_households(rows: int, seed: int = 2425) -> list:
+    """(income, fringe, super, has_cover, has_help) as 2-place strings and flags."""
+    rng = random.Random(seed)
+    households = []
+    for _ in range(rows):
+        income = f"{rng.lognormvariate(11.4, 0.7):.2f}"
+        fringe = rng.choice(['0.00', '0.00', '4321.09'])
+        super_cc = rng.choice(['0.00', '27500.00'])
+        households.append((income, fringe, super_cc, rng.random() < 0.7, rng.random() < 0.4))
+    return households
+
+
+def time_path(name: str, fn, inputs: list) -> tuple:
+    start = time.perf_counter()
+    results = [fn(*args) for args in inputs]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark float vs Decimal vs integer-cents summaries')
+    parser.add_argument('--rows', type=float, default=2e5, help='Households to compute')
+    args = parser.parse_args()
+
+    households = synthetic_households(int(args.rows))
+    float_in = [(float(i), float(f), 0, float(s), c, h) for i, f, s, c, h in households]
+    decimal_in = [(Decimal(i), Decimal(f), Decimal(s), c, h) for i, f, s, c, h in households]
+    cents_in = [(to_cents(i), to_cents(f), 0, to_cents(s), c, h) for i, f, s, c, h in households]
+
+    float_s, float_out = time_path('float', calculate_summary, float_in)
+    decimal_s, decimal_out = time_path('decimal', decimal_summary, decimal_in)
+    cents_s, cents_out = time_path('cents', summary_cents, cents_in)
+    exact_s, _ = time_path('exact', calculate_summary_exact,
+                           [(i, f, 0, s, c, h) for i, f, s, c, h in households])
+
+    # Exactness: cents must equal Decimal on every component; float may be a cent out
+    mismatches = sum(
+        tuple(from_cents(c) for c in cents) != tuple(Decimal(v).quantize(CENT) for v in dec)
+        for cents, dec in zip(cents_out, decimal_out)
+    )
+    float_off = sum(
+        to_cents(f.total_tax) != cents[-1] for f, cents in zip(float_out, cents_out)
+    )
+
+    rows = len(households)
+    print(f"Households: {rows:,}")
+    print(f"Cents vs Decimal mismatches: {mismatches}")
+    print(f"Float total_tax differing from exact: {float_off} ({float_off / rows:.3%})")
+    print(f"\n{'Path':<34} {'Seconds':>9} {'us/row':>8} {'vs Decimal':>11}")
+    print("-" * 65)
+    for name, seconds in (("float calculate_summary", float_s),
+                          ("Decimal ROUND_HALF_UP", decimal_s),
+                          ("int cents summary_cents", cents_s),
+                          ("calculate_summary_exact (I/O)", exact_s)):
+        print(f"{name:<34} {seconds:>9.3f} {seconds / rows * 1e6:>8.2f} {decimal_s / seconds:>10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
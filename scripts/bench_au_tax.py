@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the au_tax batch (vectorised) API.
+
+Compares calculate_income_tax() called in a Python loop against
+calculate_income_tax_batch() over synthetic incomes, and checks that every
+element is bit-for-bit identical to the scalar result.
+
+Usage:
+    python scripts/bench_au_tax.py                    # 1e6 and 1e8 rows
+    python scripts/bench_au_tax.py --rows 1e5 1e6     # Custom sizes
+    python scripts/bench_au_tax.py --chunk 5e6        # Lower peak memory
+    python scripts/bench_au_tax.py --tiers            # HELP/MLS tier micro-benchmark
+    python scripts/bench_au_tax.py --curve            # Tax curve vs calculate_summary at breakpoints
+
+The scalar loop is timed on at most --scalar-sample rows and extrapolated,
+since looping 1e8 times in Python takes minutes.
+"""
+
+import argparse
+import math
+import time
+import timeit
+
+import numpy as np
+
+from au_tax import (
+    DEFAULT_FY, HELP_THRESHOLDS_2024_25, MLS_FAMILY_CHILD_INCREMENT,
+    MLS_THRESHOLDS_FAMILY_2024_25, MLS_THRESHOLDS_SINGLE_2024_25, HELPResult, MLSResult,
+    _family_mls_tiers, build_tax_curve, calculate_help_repayment, calculate_income_tax,
+    calculate_income_tax_batch, calculate_mls, calculate_summary, get_rate_table,
+)
+
+# Curve values skip per-component cent rounding; anything further off is a wrong tier
+CURVE_TOLERANCE = 0.05
+
+
+def synthetic_incomes(rows: int, seed: int = 2425) -> np.ndarray:
+    """Whole-cent incomes spread across every bracket (lognormal around $90k)."""
+    rng = np.random.default_rng(seed)
+    incomes = rng.lognormal(mean=np.log(90_000), sigma=0.7, size=rows)
+    return np.round(incomes, 2)
+
+
+def time_scalar(incomes: np.ndarray) -> float:
+    """Seconds per row for the scalar function."""
+    values = incomes.tolist()
+    start = time.perf_counter()
+    for income in values:
+        calculate_income_tax(income)
+    return (time.perf_counter() - start) / len(values)
+
+
+def time_batch(rows: int, chunk: int) -> float:
+    """Total seconds for the batch function over `rows` incomes, in chunks."""
+    elapsed = 0.0
+    done = 0
+    while done < rows:
+        n = min(chunk, rows - done)
+        incomes = synthetic_incomes(n, seed=done)
+        start = time.perf_counter()
+        calculate_income_tax_batch(incomes)
+        elapsed += time.perf_counter() - start
+        done += n
+    return elapsed
+
+
+def verify(incomes: np.ndarray) -> int:
+    """Count elements where batch and scalar results differ."""
+    batch = calculate_income_tax_batch(incomes)
+    mismatches = 0
+    for row, income in zip(batch.tolist(), incomes.tolist()):
+        scalar = calculate_income_tax(income)
+        if row != (scalar.taxable_income, scalar.tax_payable,
+                   scalar.marginal_rate, scalar.effective_rate):
+            mismatches += 1
+    return mismatches
+
+
+# Linear-scan implementations as they were before the compiled TierTable,
+# kept here as the micro-benchmark baseline.
+
+def loop_help_repayment(repayment_income: float) -> HELPResult:
+    for threshold, rate in HELP_THRESHOLDS_2024_25:
+        if repayment_income <= threshold:
+            return HELPResult(
+                repayment_income=repayment_income,
+                repayment_rate=rate,
+                repayment_amount=round(repayment_income * rate, 2),
+                notes=f"{rate*100:.1f}% of total repayment income" if rate > 0 else "Below repayment threshold"
+            )
+
+
+def loop_mls(income_for_mls: float, family: bool = False, dependent_children: int = 0) -> MLSResult:
+    thresholds = MLS_THRESHOLDS_FAMILY_2024_25 if family else MLS_THRESHOLDS_SINGLE_2024_25
+    if family and dependent_children > 1:
+        increment = (dependent_children - 1) * MLS_FAMILY_CHILD_INCREMENT
+        thresholds = [(t + increment if t != float('inf') else t, r) for t, r in thresholds]
+    for i, (threshold, rate) in enumerate(thresholds):
+        if income_for_mls <= threshold:
+            tier_name = f"Tier {i}" if i else "Base tier (no MLS)"
+            return MLSResult(income_for_mls, round(income_for_mls * rate, 2), rate, tier_name, False)
+
+
+def loop_rate(tiers, income: float) -> float:
+    for threshold, rate in tiers:
+        if income <= threshold:
+            return rate
+
+
+def _ns_per_call(fn, incomes, calls: int) -> float:
+    repeats = max(calls // len(incomes), 1)
+    seconds = min(timeit.repeat(lambda: [fn(x) for x in incomes], number=repeats, repeat=5))
+    return seconds / (repeats * len(incomes)) * 1e9
+
+
+def bench_tiers(calls: int) -> None:
+    """Time loop vs compiled-table HELP and MLS lookups on the same incomes."""
+    incomes = synthetic_incomes(1_000).tolist()
+    table = get_rate_table()
+    family_3 = _family_mls_tiers(DEFAULT_FY, 3)
+    family_3_rows = [(t + 2 * MLS_FAMILY_CHILD_INCREMENT, r) for t, r in MLS_THRESHOLDS_FAMILY_2024_25]
+    cases = [
+        # Tier lookup alone: linear scan vs one bisect on the compiled table
+        ("HELP rate lookup", lambda x: loop_rate(HELP_THRESHOLDS_2024_25, x),
+         lambda x: table.help.rates[table.help.tier(x)]),
+        ("MLS family-3 lookup", lambda x: loop_rate(
+            [(t + 2 * MLS_FAMILY_CHILD_INCREMENT, r) for t, r in MLS_THRESHOLDS_FAMILY_2024_25], 2 * x),
+         lambda x: family_3.rates[family_3.tier(2 * x)]),
+        # Full calls, including result construction and rounding
+        ("calculate_help_repayment", loop_help_repayment, calculate_help_repayment),
+        ("calculate_mls single", loop_mls, calculate_mls),
+        ("calculate_mls family-3", lambda x: loop_mls(2 * x, True, 3),
+         lambda x: calculate_mls(2 * x, True, 3)),
+    ]
+    assert family_3_rows == list(zip(*family_3))
+
+    print(f"\n{'Operation':<26} {'Loop (ns)':>10} {'Table (ns)':>11} {'Speedup':>9}")
+    print("-" * 59)
+    for name, loop_fn, table_fn in cases:
+        for x in incomes:
+            assert loop_fn(x) == table_fn(x), (name, x)
+        loop_ns = _ns_per_call(loop_fn, incomes, calls)
+        table_ns = _ns_per_call(table_fn, incomes, calls)
+        print(f"{name:<26} {loop_ns:>10.0f} {table_ns:>11.0f} {loop_ns / table_ns:>8.2f}x")
+
+
+def random_profile(rng: np.random.Generator) -> dict:
+    """build_tax_curve() keyword arguments, mixing zero and whole-cent amounts."""
+    def amount():
+        return round(float(rng.uniform(0, 30_000)), 2) if rng.random() < 0.5 else 0.0
+    return {
+        'reportable_fringe_benefits': amount(),
+        'net_investment_loss': amount(),
+        'concessional_super': amount(),
+        'has_hospital_cover': bool(rng.random() < 0.5),
+        'has_help_debt': bool(rng.random() < 0.5),
+        'sapto_eligible': bool(rng.random() < 0.2),
+        'family': bool(rng.random() < 0.3),
+        'dependent_children': int(rng.integers(0, 4)),
+    }
+
+
+def verify_curve(profiles: int, seed: int = 2425) -> None:
+    """
+    Compare TaxCurve.total_tax() with calculate_summary().total_tax at every
+    breakpoint of random profiles, and just above each (where a jump lands).
+    """
+    rng = np.random.default_rng(seed)
+    points = mismatches = 0
+    worst = 0.0
+    for _ in range(profiles):
+        profile = random_profile(rng)
+        curve = build_tax_curve(**profile)
+        for breakpoint in curve.breakpoints:
+            for income in (breakpoint, math.nextafter(breakpoint, math.inf)):
+                diff = abs(curve.total_tax(income) - calculate_summary(income, **profile).total_tax)
+                points += 1
+                worst = max(worst, diff)
+                if diff > CURVE_TOLERANCE:
+                    mismatches += 1
+                    print(f"  {income!r} {profile}: off by {diff:,.2f}")
+    print(f"Curve check: {profiles:,} profiles, {points:,} breakpoint incomes, "
+          f"{mismatches} mismatches (worst {worst:.4f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark au_tax batch income tax')
+    parser.add_argument('--rows', type=float, nargs='+', default=[1e6, 1e8],
+                        help='Row counts to benchmark')
+    parser.add_argument('--chunk', type=float, default=1e7,
+                        help='Rows per batch call (bounds peak memory)')
+    parser.add_argument('--scalar-sample', type=float, default=1e6,
+                        help='Max rows to time the scalar loop on')
+    parser.add_argument('--verify-sample', type=float, default=2e5,
+                        help='Rows to check for exact equality')
+    parser.add_argument('--tiers', action='store_true',
+                        help='Run the HELP/MLS tier lookup micro-benchmark instead')
+    parser.add_argument('--curve', action='store_true',
+                        help='Check build_tax_curve() against calculate_summary() at breakpoints instead')
+    args = parser.parse_args()
+
+    if args.tiers:
+        bench_tiers(calls=200_000)
+        return
+    if args.curve:
+        verify_curve(profiles=2_000)
+        return
+
+    sample = synthetic_incomes(int(args.verify_sample))
+    mismatches = verify(sample)
+    print(f"Exactness check: {len(sample):,} rows, {mismatches} mismatches")
+
+    per_row_scalar = time_scalar(synthetic_incomes(int(args.scalar_sample)))
+
+    print(f"\n{'Rows':>14} {'Scalar (s)':>12} {'Batch (s)':>12} {'Speedup':>10}")
+    print("-" * 52)
+    for rows in (int(r) for r in args.rows):
+        scalar_s = per_row_scalar * rows
+        estimated = "*" if rows > args.scalar_sample else " "
+        batch_s = time_batch(rows, int(args.chunk))
+        print(f"{rows:>14,} {scalar_s:>11.2f}{estimated} {batch_s:>12.3f} {scalar_s / batch_s:>9.0f}x")
+    print("\n* extrapolated from the scalar sample")
+
+
+if __name__ == '__main__':
+    main()
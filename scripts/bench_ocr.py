@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the ocr_processor document pipeline.
+
+Runs process_documents() over every supported document in the tree (files
+already in YYMMdd format are re-processed, so the whole corpus exercises
+text extraction and OCR) at several worker counts. Reports wall time and
+throughput, and checks every run against the serial results.
+
+Usage:
+    python scripts/bench_ocr.py                         # 1, 2, 4 and one per CPU
+    python scripts/bench_ocr.py --workers 1 8 --timeout 120
+    python scripts/bench_ocr.py --folder "5. Bank Statements"
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+
+from ocr_processor import find_documents, process_documents
+
+
+def outcome(result) -> tuple:
+    """Fields that must not depend on the worker count."""
+    return (result.original_path, result.status, result.extracted_date,
+            result.confidence, tuple(result.dates_found))
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description='Benchmark serial vs parallel OCR processing')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, cpus}), help='Worker counts to run')
+    parser.add_argument('--folder', type=str, help='Benchmark one folder only')
+    parser.add_argument('--timeout', type=float, help='Per-document time limit in seconds')
+    args = parser.parse_args()
+
+    root_path = Path(__file__).parent.parent
+    documents = find_documents(root_path, args.folder)
+    pdfs = sum(p.suffix.lower() == '.pdf' for p in documents)
+    print(f"Documents: {len(documents)} ({pdfs} PDFs), CPUs: {cpus}")
+
+    baseline = None
+    serial_s = None
+    print(f"\n{'Workers':>8} {'Seconds':>9} {'Docs/s':>8} {'Speedup':>8} {'Failed':>7} {'Match':>6}")
+    print("-" * 52)
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = list(process_documents(documents, workers, args.timeout, force=True))
+        seconds = time.perf_counter() - start
+
+        outcomes = [outcome(r) for r in results]
+        if baseline is None:
+            baseline, serial_s = outcomes, seconds
+        failed = sum(r.status.value == 'ocr_failed' for r in results)
+        match = "yes" if outcomes == baseline else "NO"
+        print(f"{workers:>8} {seconds:>9.2f} {len(documents) / seconds:>8.1f} "
+              f"{serial_s / seconds:>7.2f}x {failed:>7} {match:>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark for OCR render settings: speed and date-detection accuracy.
+
+Runs the date scan of every benchmarked document under several render
+settings, with the text cache off so each page is really rendered and
+OCR'd:
+    fixed-gray        gray at a fixed 144 DPI (the old 2x zoom)
+    adaptive-gray     choose_dpi() resolution, gray (the default)
+    adaptive-mono     choose_dpi() resolution, 1-bit (--ocr-render mono)
+    gray+header       adaptive gray, top 25% of each page OCR'd first
+    mono+header       adaptive mono, top 25% of each page OCR'd first
+and reports OCR seconds per page rendered (header crops included) and how
+often the best date matches the ground truth.
+
+Ground truth is document_manifest.json: entries are matched to files by
+relative path, then by sha256, then by original or suggested filename;
+entries without an extracted date are skipped. With --truth filename, the
+YYMMdd prefix of already-named files is used instead. Either way dates
+are detected from the document content only, not its name.
+
+By default only documents that need OCR (images, PDFs with a page
+without a text layer) are benchmarked; --all includes the rest.
+
+Usage:
+    python scripts/bench_ocr_accuracy.py
+    python scripts/bench_ocr_accuracy.py --truth filename --all
+"""
+
+import argparse
+import json
+import time
+from contextlib import closing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import ocr_processor
+from ocr_processor import (
+    ALREADY_NAMED_PATTERN, find_documents, iter_image_pages, iter_pdf_pages, manifest_key,
+    scan_pages_for_dates, select_best_date, set_ocr_render,
+)
+from text_cache import TEXT_LAYER_MIN_CHARS, disable_cache, file_digest, pdf_page_chars
+
+# (name, render mode, header crop, fixed DPI or None for choose_dpi())
+SETTINGS = [
+    ('fixed-gray', 'gray', 0.0, 144),
+    ('adaptive-gray', 'gray', 0.0, None),
+    ('adaptive-mono', 'mono', 0.0, None),
+    ('gray+header', 'gray', 0.25, None),
+    ('mono+header', 'mono', 0.25, None),
+]
+
+
+def manifest_truth(root_path: Path, documents: List[Path]) -> Dict[Path, date]:
+    """Extracted dates from document_manifest.json, by document path."""
+    with open(root_path / "document_manifest.json") as f:
+        entries = [e for e in json.load(f)["results"] if e.get("extracted_date")]
+    by_path = {e["path"]: e for e in entries if "path" in e}
+    by_hash = {e["sha256"]: e for e in entries if "sha256" in e}
+    by_name = {}
+    for e in entries:
+        for name in (Path(e["original_path"]).name, e.get("suggested_name")):
+            if name:
+                by_name.setdefault(name, e)
+
+    truth = {}
+    for file_path in documents:
+        entry = by_path.get(manifest_key(root_path, file_path))
+        if entry is None and by_hash:
+            entry = by_hash.get(file_digest(file_path))
+        if entry is None:
+            entry = by_name.get(file_path.name)
+        if entry is not None:
+            truth[file_path] = date.fromisoformat(entry["extracted_date"])
+    return truth
+
+
+def filename_truth(documents: List[Path]) -> Dict[Path, date]:
+    """Dates from the YYMMdd prefix of already-named files."""
+    truth = {}
+    for file_path in documents:
+        if ALREADY_NAMED_PATTERN.match(file_path.name):
+            try:
+                truth[file_path] = datetime.strptime(file_path.name[:6], "%y%m%d").date()
+            except ValueError:
+                continue
+    return truth
+
+
+def needs_ocr(file_path: Path) -> bool:
+    if file_path.suffix.lower() != '.pdf':
+        return True
+    try:
+        return min(pdf_page_chars(file_path), default=0) < TEXT_LAYER_MIN_CHARS
+    except Exception:
+        return False
+
+
+def detect_date(file_path: Path, header_crop: float) -> Optional[date]:
+    """Best date from a document's content, as process_document scans it; raises if OCR failed."""
+    if file_path.suffix.lower() == '.pdf':
+        pages = iter_pdf_pages(file_path, header_crop=header_crop)
+    else:
+        pages = iter_image_pages(file_path)
+    with closing(pages):
+        text, dates = scan_pages_for_dates(text for _, text in pages)
+    if text.startswith("Error:"):
+        raise RuntimeError(text)
+    return select_best_date(dates)[0]
+
+
+def run_setting(truth: Dict[Path, date], mode: str, header_crop: float, fixed_dpi: Optional[float]) -> dict:
+    set_ocr_render(mode, header_crop)
+    choose_dpi = ocr_processor.choose_dpi
+    ocr_pixmap = ocr_processor.ocr_pixmap
+    ocr_image = ocr_processor.ocr_image
+    stats = {'pages': 0, 'ocr_seconds': 0.0, 'correct': 0, 'failed': 0}
+
+    def timed(fn):
+        def wrapper(*args):
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                stats['pages'] += 1
+                stats['ocr_seconds'] += time.perf_counter() - start
+        return wrapper
+
+    if fixed_dpi:
+        ocr_processor.choose_dpi = lambda page, density=None: fixed_dpi
+    ocr_processor.ocr_pixmap = timed(ocr_pixmap)
+    ocr_processor.ocr_image = timed(ocr_image)
+    start = time.perf_counter()
+    try:
+        for file_path, expected in truth.items():
+            try:
+                found = detect_date(file_path, header_crop)
+            except Exception:
+                stats['failed'] += 1
+                continue
+            stats['correct'] += found == expected
+    finally:
+        ocr_processor.choose_dpi = choose_dpi
+        ocr_processor.ocr_pixmap = ocr_pixmap
+        ocr_processor.ocr_image = ocr_image
+    stats['seconds'] = time.perf_counter() - start
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark OCR render settings for speed and date accuracy')
+    parser.add_argument('--truth', choices=['manifest', 'filename'], default='manifest',
+                        help='Ground truth: document_manifest.json or YYMMdd filename prefixes (default: manifest)')
+    parser.add_argument('--all', action='store_true', help='Include documents with a full text layer')
+    parser.add_argument('--folder', type=str, help='Benchmark a specific folder only')
+    args = parser.parse_args()
+
+    root_path = Path(__file__).parent.parent
+    documents = find_documents(root_path, args.folder)
+
+    truth = manifest_truth(root_path, documents) if args.truth == 'manifest' else filename_truth(documents)
+    if not args.all:
+        truth = {p: d for p, d in truth.items() if needs_ocr(p)}
+    print(f"Documents: {len(documents)}, with {args.truth} ground truth"
+          f"{'' if args.all else ' and needing OCR'}: {len(truth)}")
+    if not truth:
+        return
+
+    disable_cache()
+    print(f"\n{'Setting':<14} {'Pages':>6} {'OCR s':>8} {'s/page':>7} {'Seconds':>8} "
+          f"{'Correct':>8} {'Accuracy':>9} {'Failed':>7}")
+    print("-" * 74)
+    for name, mode, header_crop, fixed_dpi in SETTINGS:
+        row = run_setting(truth, mode, header_crop, fixed_dpi)
+        per_page = row['ocr_seconds'] / row['pages'] if row['pages'] else 0.0
+        print(f"{name:<14} {row['pages']:>6} {row['ocr_seconds']:>8.2f} {per_page:>7.3f} {row['seconds']:>8.2f} "
+              f"{row['correct']:>8} {row['correct'] / len(truth):>8.0%} {row['failed']:>7}")
+
+
+if __name__ == '__main__':
+    main()
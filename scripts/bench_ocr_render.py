@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark for handing rendered PDF pages to the OCR engine.
+
+Renders every page of the PDFs in the tree and builds the image the OCR
+backend receives, five ways:
+    png    RGB pixmap at 2x -> PNG bytes -> Image.open (the original path)
+    rgb    RGB pixmap at 2x -> Image.frombytes (one copy, no compression)
+    gray   gray pixmap at choose_dpi(), wrapped by pixmap_image() (no copy)
+    bytes  gray pixmap at choose_dpi(), samples copied to bytes first (what
+           tesserocr's SetImageBytes is handed), so gray vs bytes is the copy
+    mono   gray pixmap at choose_dpi(), binarised to 1-bit (--ocr-render mono)
+Each mode runs in its own process so peak RSS is measured separately;
+growth is the peak above the RSS after imports.
+With --ocr the selected backend also OCRs each image (needs tesseract).
+
+Usage:
+    python scripts/bench_ocr_render.py                  # every PDF page
+    python scripts/bench_ocr_render.py --pages 50 --ocr
+"""
+
+import argparse
+import io
+import json
+import resource
+import subprocess
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from ocr_processor import binarise, get_ocr_backend, pixmap_image, pixmap_mode, render_page
+
+MODES = ('png', 'rgb', 'gray', 'bytes', 'mono')
+
+# The fixed zoom pages were rendered at before adaptive resolution
+BASELINE_ZOOM = 2
+
+
+def page_images(pages, mode: str):
+    """Yield the image the OCR backend would receive for each page."""
+    mat = fitz.Matrix(BASELINE_ZOOM, BASELINE_ZOOM)
+    for page in pages:
+        if mode == 'png':
+            pix = page.get_pixmap(matrix=mat)
+            img = Image.open(io.BytesIO(pix.tobytes("png")))
+            img.load()
+            yield img
+        elif mode == 'rgb':
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+            yield Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        elif mode == 'mono':
+            pix = render_page(page)
+            yield Image.frombytes('1', (pix.width, pix.height), binarise(pix))
+        elif mode == 'bytes':
+            pix = render_page(page)
+            gray = pixmap_mode(pix)
+            yield Image.frombuffer(gray, (pix.width, pix.height), bytes(pix.samples_mv), "raw", gray, pix.stride, 1)
+        else:
+            pix = render_page(page)
+            with pixmap_image(pix) as img:
+                yield img
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KB on Linux
+
+
+def run_mode(mode: str, max_pages: int, ocr: bool) -> dict:
+    root_path = Path(__file__).parent.parent
+    backend = get_ocr_backend() if ocr else None
+    baseline_mb = peak_rss_mb()
+
+    def pages():
+        """Every page, one document open at a time."""
+        for pdf in sorted(root_path.rglob('*.pdf')):
+            with fitz.open(pdf) as doc:
+                yield from doc
+
+    start = time.perf_counter()
+    count = pixels = 0
+    for img in page_images(islice(pages(), max_pages or None), mode):
+        count += 1
+        pixels += img.width * img.height
+        if backend:
+            backend.image_to_string(img)
+    seconds = time.perf_counter() - start
+    return {'mode': mode, 'pages': count, 'seconds': seconds, 'mpixels': pixels / 1e6,
+            'peak_rss_mb': peak_rss_mb(), 'rss_growth_mb': peak_rss_mb() - baseline_mb}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pixmap-to-OCR image handoff')
+    parser.add_argument('--pages', type=int, default=0, help='Limit the number of pages (default: all)')
+    parser.add_argument('--ocr', action='store_true', help='Also OCR each page with the selected backend')
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)  # Child process: run one mode
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.pages, args.ocr)))
+        return
+
+    rows = []
+    for mode in MODES:
+        cmd = [sys.executable, __file__, '--mode', mode, '--pages', str(args.pages)] + (['--ocr'] if args.ocr else [])
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        rows.append(json.loads(out.strip().splitlines()[-1]))
+
+    base = rows[0]['seconds']
+    print(f"Pages: {rows[0]['pages']}, OCR: {'yes' if args.ocr else 'no'}")
+    print(f"\n{'Mode':<6} {'Seconds':>9} {'Pages/s':>9} {'Speedup':>8} {'MPixels':>8} {'Peak RSS MB':>12} {'Growth MB':>10}")
+    print("-" * 68)
+    for row in rows:
+        print(f"{row['mode']:<6} {row['seconds']:>9.2f} {row['pages'] / row['seconds']:>9.1f} "
+              f"{base / row['seconds']:>7.2f}x {row['mpixels']:>8.0f} {row['peak_rss_mb']:>12.1f} {row['rss_growth_mb']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
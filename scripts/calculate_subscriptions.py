@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 """Calculate Isabelle's subscription totals for tax deductions."""
 
-import fitz
+import argparse
 import os
 import re
 
+from text_cache import disable_cache, pdf_page_texts
+
+parser = argparse.ArgumentParser(description="Calculate Isabelle's subscription totals")
+parser.add_argument('--no-cache', action='store_true', help='Re-extract all text, ignoring the text cache')
+if parser.parse_args().no_cache:
+    disable_cache()
+
 isabelle_dir = "Isabelle"
 totals = {
     'Paramount Plus': 0,
@@ -20,9 +27,7 @@ for f in sorted(os.listdir(isabelle_dir)):
     path = os.path.join(isabelle_dir, f)
     if f.endswith('.pdf'):
         try:
-            doc = fitz.open(path)
-            text = doc[0].get_text()
-            doc.close()
+            text = pdf_page_texts(path)[0]
             
             # Extract amount - look for TOTAL: AUDx.xx pattern first, then fall back
             total_match = re.search(r'TOTAL[:\s]*(?:AUD|\$)(\d+\.?\d*)', text, re.IGNORECASE)
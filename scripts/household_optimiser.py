@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Household Deduction Optimiser - FY2024-25
+
+Decides which partner should claim the shared deductible pool (items with
+default_owner 'shared' from run_deduction_analysis) to minimise combined tax.
+
+Each partner's total tax is a piecewise-linear curve in taxable income
+(au_tax.build_tax_curve), so combined tax over the split is piecewise
+linear too. The minimum is always at a split where one partner lands exactly
+on a breakpoint, or at either end of the pool. Only those few dozen splits
+are evaluated, rather than every dollar of the pool.
+
+Usage:
+    household_optimiser.py 180000 95000                 # Pool from bank analysis
+    household_optimiser.py 180000 95000 --pool 6500     # Explicit pool
+    household_optimiser.py 180000 95000 --help-debt-b --no-hospital-cover
+
+Incomes are each partner's taxable income after their own deductions, before
+the shared pool is claimed.
+"""
+
+import argparse
+import sys
+from typing import List, NamedTuple, Tuple
+
+from au_tax import (
+    DEFAULT_FY, RATE_TABLES, TaxCurve, build_tax_curve, calculate_summary,
+    check_ccs_threshold, format_currency, format_percentage,
+)
+
+# Owner names as used by tax_categories default_owner
+PARTNER_NAMES = ('Thomas', 'Isabelle')
+
+# Splits whose combined tax is within a cent of the minimum count as optimal
+_TIE_TOLERANCE = 0.01
+
+
+class AllocationResult(NamedTuple):
+    """Optimal allocation of the shared pool between two partners."""
+    pool: float
+    claim_a: float              # Pool claimed by partner A at the chosen split
+    optimal_range: Tuple[float, float]  # Every claim_a in this range is optimal
+    combined_tax: float
+    tax_a: float
+    tax_b: float
+    baseline_tax: float         # Combined tax with the pool split 50/50 (where possible)
+    splits_evaluated: int
+
+
+def shared_deduction_pool(results: dict) -> float:
+    """Total deductible amount of 'shared' items from analyse_transactions()."""
+    deductible = results['deductible']
+    return deductible.sum('deductible_amount', deductible.group('default_owner').get('shared', []))
+
+
+def candidate_splits(curve_a: TaxCurve, curve_b: TaxCurve,
+                     income_a: float, income_b: float, pool: float) -> List[float]:
+    """
+    Pool amounts claimed by A at which combined tax can be minimal.
+
+    A claiming d leaves A on income_a - d and B on income_b - pool + d; each
+    breakpoint maps to the d that puts that partner exactly on it. d is
+    bounded so that neither income goes below zero.
+    """
+    low, high = max(pool - income_b, 0.0), min(pool, income_a)
+    points = {low, high}
+    points.update(income_a - p for p in curve_a.breakpoints)
+    points.update(p - income_b + pool for p in curve_b.breakpoints)
+    return sorted(d for d in points if low <= d <= high)
+
+
+def optimise_allocation(
+    income_a: float,
+    income_b: float,
+    pool: float,
+    profile_a: dict,
+    profile_b: dict,
+    fy: str = DEFAULT_FY
+) -> AllocationResult:
+    """
+    Split a shared deduction pool between two partners to minimise combined tax.
+
+    Args:
+        income_a: Partner A taxable income before the shared pool
+        income_b: Partner B taxable income before the shared pool
+        pool: Shared deductible amount to allocate
+        profile_a: build_tax_curve() keyword arguments for partner A
+        profile_b: build_tax_curve() keyword arguments for partner B
+        fy: Financial year, e.g. '2024-25'
+
+    Returns:
+        AllocationResult for the lowest-tax split
+    """
+    if pool < 0:
+        raise ValueError("Deduction pool cannot be negative")
+    if income_a < 0 or income_b < 0:
+        raise ValueError("Taxable income cannot be negative")
+    # Neither partner's income can be pushed below zero
+    pool = min(pool, income_a + income_b)
+
+    curve_a = build_tax_curve(**profile_a, fy=fy)
+    curve_b = build_tax_curve(**profile_b, fy=fy)
+
+    def combined(claim_a: float) -> float:
+        return (curve_a.total_tax(max(income_a - claim_a, 0.0))
+                + curve_b.total_tax(max(income_b - pool + claim_a, 0.0)))
+
+    splits = candidate_splits(curve_a, curve_b, income_a, income_b, pool)
+    totals = [combined(d) for d in splits]
+    best = min(totals)
+
+    # Widen the first optimal split into the run of splits that tie with it
+    # (combined tax is linear between neighbouring splits)
+    first = totals.index(best)
+    last = first
+    while (last + 1 < len(splits) and totals[last + 1] <= best + _TIE_TOLERANCE
+           and combined((splits[last] + splits[last + 1]) / 2) <= best + _TIE_TOLERANCE):
+        last += 1
+
+    claim_a = splits[first]
+    return AllocationResult(
+        pool=pool,
+        claim_a=claim_a,
+        optimal_range=(splits[first], splits[last]),
+        combined_tax=best,
+        tax_a=curve_a.total_tax(income_a - claim_a),
+        tax_b=curve_b.total_tax(income_b - pool + claim_a),
+        baseline_tax=combined(min(max(pool / 2, splits[0]), splits[-1])),
+        splits_evaluated=len(splits),
+    )
+
+
+def load_shared_pool() -> float:
+    """Run the bank statement analysis and total its shared deductions."""
+    from run_deduction_analysis import (
+        analyse_transactions, load_anz_transactions, load_bank_australia_transactions,
+    )
+    transactions = load_anz_transactions().concat(load_bank_australia_transactions())
+    results, _ = analyse_transactions(transactions)
+    return shared_deduction_pool(results)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Allocate shared deductions between two partners to minimise combined tax'
+    )
+    parser.add_argument('income_a', type=float,
+                        help=f'{PARTNER_NAMES[0]} taxable income before shared deductions')
+    parser.add_argument('income_b', type=float,
+                        help=f'{PARTNER_NAMES[1]} taxable income before shared deductions')
+    parser.add_argument('--pool', type=float,
+                        help='Shared deductible pool (default: from bank statement analysis)')
+    parser.add_argument('--fy', default=DEFAULT_FY, choices=sorted(RATE_TABLES),
+                        help=f'Financial year (default: {DEFAULT_FY})')
+    parser.add_argument('--no-hospital-cover', action='store_true',
+                        help='No private hospital cover (adds MLS)')
+    parser.add_argument('--children', type=int, default=0,
+                        help='Dependent children (MLS thresholds and CCS)')
+    parser.add_argument('--help-debt-a', action='store_true',
+                        help=f'{PARTNER_NAMES[0]} has HELP/HECS debt')
+    parser.add_argument('--help-debt-b', action='store_true',
+                        help=f'{PARTNER_NAMES[1]} has HELP/HECS debt')
+    parser.add_argument('--super-a', type=float, default=0,
+                        help=f'{PARTNER_NAMES[0]} concessional super contributions')
+    parser.add_argument('--super-b', type=float, default=0,
+                        help=f'{PARTNER_NAMES[1]} concessional super contributions')
+    args = parser.parse_args()
+
+    pool = args.pool if args.pool is not None else load_shared_pool()
+
+    shared = dict(has_hospital_cover=not args.no_hospital_cover, family=True,
+                  dependent_children=args.children)
+    profile_a = dict(shared, has_help_debt=args.help_debt_a, concessional_super=args.super_a)
+    profile_b = dict(shared, has_help_debt=args.help_debt_b, concessional_super=args.super_b)
+
+    try:
+        result = optimise_allocation(args.income_a, args.income_b, pool, profile_a, profile_b, args.fy)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    name_a, name_b = PARTNER_NAMES
+    claim_b = result.pool - result.claim_a
+    summary_a = calculate_summary(args.income_a - result.claim_a, **profile_a, fy=args.fy)
+    summary_b = calculate_summary(args.income_b - claim_b, **profile_b, fy=args.fy)
+
+    print(f"\n{'='*60}")
+    print(f"HOUSEHOLD DEDUCTION ALLOCATION - FY{args.fy}")
+    print(f"{'='*60}")
+    print(f"Shared Deduction Pool:       {format_currency(result.pool):>15}")
+    print(f"{'─'*60}")
+    print(f"{name_a + ' claims:':<29}{format_currency(result.claim_a):>15}")
+    print(f"{name_b + ' claims:':<29}{format_currency(claim_b):>15}")
+    low, high = result.optimal_range
+    if high > low:
+        print(f"  (any {name_a} claim from {format_currency(low)} to {format_currency(high)} is equally good)")
+    print(f"{'─'*60}")
+    for name, profile, summary in ((name_a, profile_a, summary_a), (name_b, profile_b, summary_b)):
+        marginal = build_tax_curve(**profile, fy=args.fy).marginal_rate(summary.taxable_income)
+        print(f"{name + ' total tax:':<29}{format_currency(summary.total_tax):>15}"
+              f"  (marginal {format_percentage(marginal)})")
+    print(f"COMBINED TAX:                {format_currency(summary_a.total_tax + summary_b.total_tax):>15}")
+    print(f"Saving vs 50/50 split:       {format_currency(result.baseline_tax - result.combined_tax):>15}")
+    print(f"Splits evaluated:            {result.splits_evaluated:>15}")
+
+    # CCS uses combined income, which the split does not change
+    combined_income = args.income_a + args.income_b - result.pool
+    ccs = check_ccs_threshold(combined_income, max(args.children, 1))
+    print(f"{'─'*60}")
+    print(f"Combined Income (for CCS):   {format_currency(combined_income):>15}")
+    print(f"CCS:                         {ccs.estimated_subsidy_rate:>15}")
+    print(f"Notes:                       {ccs.notes}")
+    print(f"{'='*60}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
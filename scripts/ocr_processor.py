@@ -9,19 +9,29 @@ Usage:
     python scripts/ocr_processor.py --dry-run          # Preview changes
     python scripts/ocr_processor.py --execute          # Apply changes
     python scripts/ocr_processor.py --folder "1. Income/Thomas"  # Process specific folder
+    python scripts/ocr_processor.py --dry-run --workers 4 --timeout 120  # Parallel OCR
+    python scripts/ocr_processor.py --dry-run --page-workers 4  # Parallel pages of long scans
+    python scripts/ocr_processor.py --dry-run --incremental     # Only new or changed files
+    python scripts/ocr_processor.py --dry-run --ocr-render mono --header-crop 0.25  # Faster scans
 """
 
 import os
 import re
 import sys
 import json
+import multiprocessing
 import shutil
+import signal
 import subprocess
 import argparse
+from collections import deque
+from contextlib import closing, contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, date
 from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Tuple
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 from enum import Enum
 import time
 
@@ -29,7 +39,17 @@ import time
 import fitz  # PyMuPDF
 import pytesseract
 from PIL import Image
-import io
+
+try:
+    import tesserocr
+except ImportError:  # optional: faster resident engine, else pytesseract is used
+    tesserocr = None
+
+from date_extract import FY_END, FY_START, OCR_EXTRACTOR
+from text_cache import (
+    TEXT_LAYER_MIN_CHARS, cache_enabled, cached_pages, disable_cache, file_digest, get_page,
+    pdf_page_chars, pdf_page_texts, put_page,
+)
 
 
 class ProcessingStatus(Enum):
@@ -43,6 +63,18 @@ class ProcessingStatus(Enum):
     SKIPPED = "skipped"
 
 
+# Statuses that depend only on a file's contents, so --incremental can reuse
+# them; OCR_FAILED (errors, timeouts, crashed workers) is always retried
+REUSABLE_STATUSES = {
+    ProcessingStatus.SUCCESS,
+    ProcessingStatus.ALREADY_NAMED,
+    ProcessingStatus.NO_DATE,
+    ProcessingStatus.AMBIGUOUS_DATE,
+    ProcessingStatus.OUTSIDE_FY,
+    ProcessingStatus.UNSUPPORTED_TYPE,
+}
+
+
 @dataclass
 class ProcessingResult:
     """Result of processing a single document."""
@@ -56,9 +88,43 @@ class ProcessingResult:
     dates_found: List[str] = field(default_factory=list)
 
 
-# FY24-25 date range
-FY_START = date(2024, 7, 1)
-FY_END = date(2025, 6, 30)
+# Text cache keys for OCR output are '<backend cache_key>-<kind>-<render mode>'
+# (kind 'page', 'image', or 'header<percent>'); bump a backend's version when
+# its settings or the page rendering change
+OCR_PAGE_KIND = 'page'
+OCR_IMAGE_KIND = 'image'
+OCR_HEADER_KIND = 'header'
+
+# Selected OCR backend name; an environment variable so pool workers inherit it
+OCR_BACKEND_ENV = 'TAX_OCR_BACKEND'
+
+# Page rendering for OCR, also inherited by pool workers: 'gray' (8-bit) or
+# 'mono' (1-bit, Otsu threshold), and the top fraction of each scanned page
+# to OCR first for dates (0 = off)
+OCR_RENDER_ENV = 'TAX_OCR_RENDER'
+OCR_HEADER_ENV = 'TAX_OCR_HEADER_CROP'
+
+# Per-document time limit in seconds, set inside the worker for the OCR
+# backends that can enforce it themselves (pytesseract kills tesseract)
+OCR_TIMEOUT_ENV = 'TAX_OCR_TIMEOUT'
+OCR_RENDER_MODES = ('gray', 'mono')
+OCR_COLORSPACE = fitz.csGRAY
+
+# Adaptive render resolution. Pages render at OCR_TARGET_DPI, or
+# OCR_DENSE_DPI when the document's text layer shows small, dense text;
+# never above a scan's own resolution, and lowered for large pages so a
+# render stays under OCR_MAX_PIXELS. (The old fixed 2x zoom was 144 DPI.)
+OCR_TARGET_DPI = 150
+OCR_DENSE_DPI = 300
+OCR_MIN_DPI = 100
+OCR_MAX_PIXELS = 4_000_000
+
+# Text-layer characters per square inch at which text counts as dense
+# (a full A4 page of 10pt text is roughly 40)
+DENSE_TEXT_CHARS_PER_SQIN = 30
+
+# Date scanning stops at the first page with an FY date this confident
+EARLY_STOP_CONFIDENCE = 1.0
 
 # File extensions to process
 SUPPORTED_EXTENSIONS = {'.pdf', '.png', '.jpg', '.jpeg', '.gif', '.tiff', '.tif', '.PNG', '.PDF', '.JPG', '.JPEG'}
@@ -69,132 +135,396 @@ SKIP_FOLDERS = {'.git', '.github', '.venv', '.beads', 'scripts', 'NEEDS MANUAL P
 # Pattern for files already named in YYMMdd format
 ALREADY_NAMED_PATTERN = re.compile(r'^\d{6}\s*-\s*.+')
 
-# Date patterns to search for (in order of preference)
-DATE_PATTERNS = [
-    # ISO format: 2024-08-15
-    (r'(\d{4})-(\d{1,2})-(\d{1,2})', 'ymd'),
-    # Australian format: 15/08/2024 or 15-08-2024 or 15.08.2024
-    (r'(\d{1,2})[/\-.](\d{1,2})[/\-.](\d{4})', 'dmy'),
-    # Written: 15 August 2024, August 15, 2024
-    (r'(\d{1,2})\s+(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{4})', 'dMy'),
-    (r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2}),?\s+(\d{4})', 'Mdy'),
-    # Short format: 15/08/24 or 15.08.24
-    (r'(\d{1,2})[/\-.](\d{1,2})[/\-.](\d{2})\b', 'dmy_short'),
-    # YYYYMMDD format: 20241230
-    (r'\b(20[234]\d)(\d{2})(\d{2})\b', 'yyyymmdd'),
-    # YYMMDD in filename: 241230
-    (r'\b(2[45])(\d{2})(\d{2})\b', 'yymmdd'),
-    # Spaced date: 2024 08 30 or 10 August 2024
-    (r'(\d{4})\s+(\d{2})\s+(\d{2})', 'ymd_spaced'),
-    (r'(\d{1,2})\s+(\d{2})\s+(\d{4})', 'dmy_spaced'),
-]
-
-MONTH_MAP = {
-    'jan': 1, 'january': 1,
-    'feb': 2, 'february': 2,
-    'mar': 3, 'march': 3,
-    'apr': 4, 'april': 4,
-    'may': 5,
-    'jun': 6, 'june': 6,
-    'jul': 7, 'july': 7,
-    'aug': 8, 'august': 8,
-    'sep': 9, 'september': 9,
-    'oct': 10, 'october': 10,
-    'nov': 11, 'november': 11,
-    'dec': 12, 'december': 12,
-}
+
+# =============================================================================
+# OCR BACKENDS
+# =============================================================================
+
+# Bytes per pixel by PIL mode, as tesseract counts them (0 = packed 1-bit rows)
+_BYTES_PER_PIXEL = {'1': 0, 'L': 1, 'RGB': 3}
+
+
+def row_bytes(mode: str, width: int) -> int:
+    """Bytes in one unpadded row of pixels."""
+    return (width + 7) // 8 if mode == '1' else width * _BYTES_PER_PIXEL[mode]
+
+
+class OcrBackend:
+    """An OCR engine. One instance is created per process and reused for every image."""
+    name = ''
+    cache_key = ''
+    
+    def image_to_string(self, img: Image.Image) -> str:
+        raise NotImplementedError
+    
+    def pixels_to_string(self, samples, size: Tuple[int, int], mode: str, stride: int = 0) -> str:
+        """OCR raw pixel rows ('1' packed, 'L' or 'RGB') without compressing them."""
+        img = Image.frombuffer(mode, size, samples, "raw", mode, stride, 1)
+        try:
+            return self.image_to_string(img)
+        finally:
+            img.close()  # Release the buffer before its owner goes away
+
+
+class TesserocrBackend(OcrBackend):
+    """tesserocr API bindings: the tesseract model is loaded once, images are passed in memory."""
+    name = 'tesserocr'
+    cache_key = 'tesserocr/3'
+    
+    def __init__(self):
+        self.api = tesserocr.PyTessBaseAPI()
+    
+    def image_to_string(self, img: Image.Image) -> str:
+        self.api.SetImage(img)
+        return self.api.GetUTF8Text()
+    
+    def pixels_to_string(self, samples, size: Tuple[int, int], mode: str, stride: int = 0) -> str:
+        # Raw rows straight into the engine; SetImage would re-encode the image.
+        # SetImageBytes only accepts bytes, so a memoryview is copied once here.
+        width, height = size
+        self.api.SetImageBytes(bytes(samples), width, height, _BYTES_PER_PIXEL[mode],
+                               stride or row_bytes(mode, width))
+        return self.api.GetUTF8Text()
+
+
+class PytesseractBackend(OcrBackend):
+    """pytesseract: runs the tesseract command per image (fallback when tesserocr is missing)."""
+    name = 'pytesseract'
+    cache_key = 'tesseract/3'
+    
+    def image_to_string(self, img: Image.Image) -> str:
+        # A timed-out tesseract is killed and raises RuntimeError, failing the page
+        return pytesseract.image_to_string(img, timeout=float(os.environ.get(OCR_TIMEOUT_ENV) or 0))
+
+
+OCR_BACKENDS = {backend.name: backend for backend in (TesserocrBackend, PytesseractBackend)}
+
+_ocr_backend: Optional[OcrBackend] = None
+_ocr_backend_pid = 0
+
+
+def set_ocr_backend(name: str):
+    """Choose the OCR backend ('auto', 'tesserocr' or 'pytesseract') for this process and its workers."""
+    if name != 'auto' and name not in OCR_BACKENDS:
+        raise ValueError(f"Unknown OCR backend: {name}")
+    if name == 'tesserocr' and tesserocr is None:
+        raise ValueError("OCR backend 'tesserocr' requested but tesserocr is not installed")
+    os.environ[OCR_BACKEND_ENV] = name
+    global _ocr_backend
+    _ocr_backend = None
+
+
+def ocr_backend_name() -> str:
+    """Name of the selected OCR backend, resolving 'auto' (tesserocr when available)."""
+    name = os.environ.get(OCR_BACKEND_ENV, 'auto')
+    if name == 'auto':
+        name = 'tesserocr' if tesserocr is not None else 'pytesseract'
+    return name
+
+
+def get_ocr_backend() -> OcrBackend:
+    """The process's OCR engine, created on first use and kept for the process's life."""
+    global _ocr_backend, _ocr_backend_pid
+    if _ocr_backend is None or _ocr_backend_pid != os.getpid():
+        _ocr_backend = OCR_BACKENDS[ocr_backend_name()]()
+        _ocr_backend_pid = os.getpid()
+    return _ocr_backend
+
+
+def ocr_cache_key(kind: str) -> str:
+    """Text cache extractor key for OCR output of the selected backend and render mode."""
+    return f"{OCR_BACKENDS[ocr_backend_name()].cache_key}-{kind}-{ocr_render_mode()}"
+
+
+# =============================================================================
+# PAGE RENDERING
+# =============================================================================
+
+def set_ocr_render(mode: str = 'gray', header_crop: float = 0.0):
+    """Choose the render mode and header crop for this process and its workers."""
+    if mode not in OCR_RENDER_MODES:
+        raise ValueError(f"Unknown OCR render mode: {mode}")
+    if not 0 <= header_crop < 1:
+        raise ValueError(f"Header crop must be a fraction of the page in [0, 1): {header_crop}")
+    os.environ[OCR_RENDER_ENV] = mode
+    os.environ[OCR_HEADER_ENV] = str(header_crop)
+
+
+def ocr_render_mode() -> str:
+    return os.environ.get(OCR_RENDER_ENV, 'gray')
+
+
+def ocr_header_crop() -> float:
+    return float(os.environ.get(OCR_HEADER_ENV) or 0)
+
+
+def text_density(chars: int, area_sqin: float) -> Optional[float]:
+    """Text-layer characters per square inch, or None without any text."""
+    return chars / area_sqin if chars and area_sqin else None
 
 
-def parse_date_match(match: re.Match, format_type: str) -> Optional[date]:
-    """Parse a regex match into a date object."""
+def scan_dpi(page: fitz.Page) -> Optional[float]:
+    """Resolution of the largest image drawn on a page (a scan), if any."""
+    best = None
+    for info in page.get_image_info():  # One pass over the page, unlike get_image_rects()
+        rect = fitz.Rect(info['bbox'])
+        if rect.width > 0 and (best is None or rect.width * rect.height > best[0]):
+            best = (rect.width * rect.height, info['width'] * 72 / rect.width)
+    return best[1] if best else None
+
+
+def choose_dpi(page: fitz.Page, density: Optional[float] = None) -> float:
+    """
+    Render resolution for OCR of a page.
+    
+    OCR_DENSE_DPI when density (text-layer characters per square inch
+    elsewhere in the document) marks small text, else OCR_TARGET_DPI;
+    capped at the resolution of a scanned image, since rendering above it
+    adds pixels but no detail, and at whatever keeps the render within
+    OCR_MAX_PIXELS. Never below OCR_MIN_DPI.
+    """
+    dpi = OCR_DENSE_DPI if density and density >= DENSE_TEXT_CHARS_PER_SQIN else OCR_TARGET_DPI
+    native = scan_dpi(page)
+    if native:
+        dpi = min(dpi, native)
+    area_sqin = page.rect.width * page.rect.height / (72 * 72)
+    if area_sqin:
+        dpi = min(dpi, (OCR_MAX_PIXELS / area_sqin) ** 0.5)
+    return max(dpi, OCR_MIN_DPI)
+
+
+def render_page(page: fitz.Page, density: Optional[float] = None,
+                clip: Optional[fitz.Rect] = None) -> fitz.Pixmap:
+    """Render a page (or the clip region of it) for OCR at choose_dpi() in OCR_COLORSPACE, without alpha."""
+    zoom = choose_dpi(page, density) / 72
+    return page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=OCR_COLORSPACE, alpha=False, clip=clip)
+
+
+def header_clip(page: fitz.Page, fraction: float) -> fitz.Rect:
+    """The top fraction of a page, where invoices and statements put their dates."""
+    rect = page.rect
+    return fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + rect.height * fraction)
+
+
+def otsu_threshold(histogram: List[int]) -> int:
+    """Gray level that best separates ink from paper (Otsu's method on a 256-bin histogram)."""
+    total = sum(histogram)
+    weighted_total = sum(level * count for level, count in enumerate(histogram))
+    best_level, best_variance = 127, -1.0
+    below = weighted_below = 0
+    for level, count in enumerate(histogram):
+        below += count
+        weighted_below += level * count
+        above = total - below
+        if not below or not above:
+            continue
+        mean_below = weighted_below / below
+        mean_above = (weighted_total - weighted_below) / above
+        variance = below * above * (mean_below - mean_above) ** 2
+        if variance > best_variance:
+            best_level, best_variance = level, variance
+    return best_level
+
+
+def pixmap_mode(pix: fitz.Pixmap) -> str:
+    """PIL mode of a pixmap rendered without alpha."""
+    return "L" if pix.n == 1 else "RGB"
+
+
+@contextmanager
+def pixmap_image(pix: fitz.Pixmap) -> Iterator[Image.Image]:
+    """
+    A PIL image sharing a pixmap's samples: no copy and no compression.
+    
+    The image is closed on exit, which releases its view of the samples
+    before the pixmap can be freed.
+    """
+    mode = pixmap_mode(pix)
+    img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1)
     try:
-        groups = match.groups()
-        
-        if format_type == 'ymd':
-            year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-        elif format_type == 'ymd_spaced':
-            year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-        elif format_type == 'dmy':
-            day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-        elif format_type == 'dmy_spaced':
-            day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-        elif format_type == 'dmy_short':
-            day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-            year = 2000 + year if year < 50 else 1900 + year
-        elif format_type == 'dMy':
-            day = int(groups[0])
-            month = MONTH_MAP.get(groups[1].lower()[:3], 0)
-            year = int(groups[2])
-        elif format_type == 'Mdy':
-            month = MONTH_MAP.get(groups[0].lower()[:3], 0)
-            day = int(groups[1])
-            year = int(groups[2])
-        elif format_type == 'yymmdd':
-            year = 2000 + int(groups[0])
-            month = int(groups[1])
-            day = int(groups[2])
-        elif format_type == 'yyyymmdd':
-            year = int(groups[0])
-            month = int(groups[1])
-            day = int(groups[2])
-        else:
-            return None
-        
-        if 1 <= month <= 12 and 1 <= day <= 31:
-            return date(year, month, day)
-    except (ValueError, IndexError):
-        pass
-    return None
+        yield img
+    finally:
+        img.close()
+
+
+def binarise(pix: fitz.Pixmap) -> bytes:
+    """A gray pixmap as packed 1-bit rows (PIL mode '1'), thresholded per page."""
+    with pixmap_image(pix) as img:
+        threshold = otsu_threshold(img.histogram())
+        mono = img.point([255 if level > threshold else 0 for level in range(256)], '1')
+    return mono.tobytes()
 
 
-def extract_text_from_pdf(pdf_path: Path) -> Tuple[str, bool]:
+def pixmap_pixels(pix: fitz.Pixmap) -> Tuple[str, Tuple[int, int], bytes, int]:
+    """(mode, size, samples, stride) of a rendered page in the render mode; picklable for page workers."""
+    size = (pix.width, pix.height)
+    if ocr_render_mode() == 'mono':
+        return '1', size, binarise(pix), 0
+    return pixmap_mode(pix), size, pix.samples, pix.stride
+
+
+def ocr_pixmap(pix: fitz.Pixmap) -> str:
+    """
+    OCR a rendered page in the render mode.
+    
+    Gray samples are passed as a view of the pixmap: pytesseract wraps them
+    without a copy, tesserocr copies them once into the bytes it requires.
+    """
+    if ocr_render_mode() == 'mono':
+        return ocr_page_pixels(*pixmap_pixels(pix))
+    return get_ocr_backend().pixels_to_string(pix.samples_mv, (pix.width, pix.height), pixmap_mode(pix), pix.stride)
+
+
+def ocr_page_pixels(mode: str, size: Tuple[int, int], samples: bytes, stride: int = 0) -> str:
+    """OCR one rendered page from its raw pixels. Module-level so page workers can run it."""
+    return get_ocr_backend().pixels_to_string(samples, size, mode, stride)
+
+
+# Shared pool for page-level OCR, created on first use and reused across documents
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_workers = 0
+
+
+def get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the page OCR pool, (re)creating it if the worker count changed."""
+    global _page_pool, _page_pool_workers
+    if _page_pool is None or _page_pool_workers != workers:
+        if _page_pool is not None:
+            _page_pool.shutdown(cancel_futures=True)
+        _page_pool = ProcessPoolExecutor(max_workers=workers)
+        _page_pool_workers = workers
+    return _page_pool
+
+
+def iter_ocr_pages(doc: fitz.Document, page_numbers: Iterable[int], page_workers: int = 1,
+                   density: Optional[float] = None) -> Iterator[Tuple[int, str]]:
+    """
+    OCR the given pages of a PDF lazily, yielding (page_num, text) in order.
+    
+    density is the document's text-layer density, for choose_dpi().
+    Pages are rendered here and, with page_workers > 1, OCR'd in a process
+    pool with at most page_workers * IN_FLIGHT_PER_WORKER pages rendered
+    ahead. Pages are only rendered as the caller consumes them, so a
+    caller that stops early never pays for the rest; closing the generator
+    cancels pages not yet started.
+    """
+    def render(page_num: int) -> Tuple[str, Tuple[int, int], bytes, int]:
+        # Raw samples (one copy, so they pickle) for a page worker
+        return pixmap_pixels(render_page(doc[page_num], density))
+    
+    if page_workers <= 1:
+        for page_num in page_numbers:
+            yield page_num, ocr_pixmap(render_page(doc[page_num], density)) + "\n"
+        return
+    
+    pool = get_page_pool(page_workers)
+    pages = iter(page_numbers)
+    pending = deque((n, pool.submit(ocr_page_pixels, *render(n)))
+                    for n in islice(pages, page_workers * IN_FLIGHT_PER_WORKER))
+    try:
+        while pending:
+            page_num, future = pending.popleft()
+            page_text = future.result()
+            next_page = next(pages, None)
+            if next_page is not None:
+                pending.append((next_page, pool.submit(ocr_page_pixels, *render(next_page))))
+            yield page_num, page_text + "\n"
+    finally:
+        # Early stop or timeout: drop pages not yet started
+        for _, future in pending:
+            future.cancel()
+
+
+def iter_pdf_pages(pdf_path: Path, page_workers: int = 1,
+                   header_crop: float = 0.0) -> Iterator[Tuple[int, str]]:
     """
-    Extract text from PDF. Returns (text, is_ocr_needed).
-    First tries direct text extraction, then falls back to OCR.
+    Stream (page_num, text) for a PDF, cheapest pages first.
+    
+    Pages with a text layer come first, in page order, then the remaining
+    pages are OCR'd one by one, each served from the text cache when it was
+    OCR'd before. With the cache, the text-layer index skips extraction
+    for files with no text at all; without it, pages are read lazily. Nothing
+    past the page the caller stops at is rasterised or OCR'd.
+    
+    With header_crop, each OCR page is preceded by the OCR of its top
+    header_crop of the page under the same page number, so a date scan can
+    stop before the full page is rendered. For date detection only: the
+    header text repeats in the full page.
     """
+    doc = None
     try:
-        doc = fitz.open(pdf_path)
-        text = ""
+        if cache_enabled():
+            page_chars = pdf_page_chars(pdf_path)
+            if max(page_chars, default=0) >= TEXT_LAYER_MIN_CHARS:
+                layer = enumerate(pdf_page_texts(pdf_path))
+            else:
+                layer = enumerate([""] * len(page_chars))
+        else:
+            doc = fitz.open(pdf_path)
+            layer = ((n, page.get_text()) for n, page in enumerate(doc))
         
-        # Try direct text extraction first
-        for page in doc:
-            text += page.get_text()
+        missing = []
+        text_pages = []
+        text_chars = 0
+        for page_num, page_text in layer:
+            chars = len(page_text.strip())
+            if chars >= TEXT_LAYER_MIN_CHARS:
+                text_pages.append(page_num)
+                text_chars += chars
+                yield page_num, page_text
+            else:
+                missing.append(page_num)
+        if not missing:
+            return
         
-        # If we got meaningful text, return it
-        if len(text.strip()) > 50:
+        digest = file_digest(pdf_path) if cache_enabled() else None
+        cache_key = ocr_cache_key(OCR_PAGE_KIND)
+        header_key = ocr_cache_key(f"{OCR_HEADER_KIND}{round(header_crop * 100)}")
+        cached = {n: get_page(digest, cache_key, n) for n in missing} if digest else {}
+        doc = doc or fitz.open(pdf_path)
+        text_area = sum(doc[n].rect.width * doc[n].rect.height for n in text_pages) / (72 * 72)
+        density = text_density(text_chars, text_area)
+        fresh = iter_ocr_pages(doc, [n for n in missing if cached.get(n) is None], page_workers, density)
+        with closing(fresh):
+            for page_num in missing:
+                if cached.get(page_num) is not None:
+                    yield page_num, cached[page_num]
+                    continue
+                if header_crop:
+                    header_text = get_page(digest, header_key, page_num) if digest else None
+                    if header_text is None:
+                        page = doc[page_num]
+                        header_text = ocr_pixmap(render_page(page, density, header_clip(page, header_crop))) + "\n"
+                        if digest:
+                            put_page(digest, header_key, page_num, header_text)
+                    yield page_num, header_text
+                _, page_text = next(fresh)
+                if digest:
+                    put_page(digest, cache_key, page_num, page_text)
+                yield page_num, page_text
+    finally:
+        if doc is not None:
             doc.close()
-            return text, False
-        
-        # Fall back to OCR for scanned PDFs
-        ocr_text = ""
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            # Render page to image
-            mat = fitz.Matrix(2, 2)  # 2x zoom for better OCR
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-            
-            # OCR the image
-            page_text = pytesseract.image_to_string(img)
-            ocr_text += page_text + "\n"
-        
-        doc.close()
-        return ocr_text, True
-        
-    except Exception as e:
-        return f"Error: {str(e)}", True
+
+
+def ocr_image(image_path: Path) -> List[str]:
+    """OCR an image file as a single page."""
+    img = Image.open(image_path)
+    # Convert to RGB if necessary
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return [get_ocr_backend().image_to_string(img)]
+
+
+def iter_image_pages(image_path: Path) -> Iterator[Tuple[int, str]]:
+    """An image as a one-page stream, like iter_pdf_pages."""
+    yield 0, extract_text_from_image(image_path)
 
 
 def extract_text_from_image(image_path: Path) -> str:
     """Extract text from image using OCR."""
     try:
-        img = Image.open(image_path)
-        # Convert to RGB if necessary
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        text = pytesseract.image_to_string(img)
-        return text
+        return cached_pages(image_path, ocr_cache_key(OCR_IMAGE_KIND), ocr_image)[0]
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -202,39 +532,38 @@ def extract_text_from_image(image_path: Path) -> str:
 def extract_dates_from_text(text: str, filename: str = "") -> List[Tuple[date, float, str]]:
     """
     Extract all dates from text and filename.
-    Returns list of (date, confidence, source) tuples.
+    Returns list of (date, confidence, source) tuples, one per distinct date.
     """
-    dates_found = []
-    
     # Also check the filename
     combined_text = f"{filename}\n{text}"
+    return [(hit.date, hit.confidence, hit.text) for hit in OCR_EXTRACTOR.best_hits(combined_text)]
+
+
+def scan_pages_for_dates(page_texts: Iterable[str], filename: str = "") -> Tuple[str, List[Tuple[date, float, str]]]:
+    """
+    Extract dates page by page from a lazy stream of page texts.
+    
+    Stops consuming the stream after the first page that holds an FY24-25
+    date at EARLY_STOP_CONFIDENCE, so later pages are never extracted or
+    OCR'd. Returns (text read, dates) with dates as extract_dates_from_text.
+    """
+    unique = {}
+    
+    def add(hits):
+        for hit in hits:
+            if hit.date not in unique or hit.confidence > unique[hit.date][0]:
+                unique[hit.date] = (hit.confidence, hit.text)
     
-    for pattern, format_type in DATE_PATTERNS:
-        for match in re.finditer(pattern, combined_text, re.IGNORECASE):
-            parsed_date = parse_date_match(match, format_type)
-            if parsed_date:
-                # Higher confidence for dates in FY range
-                confidence = 0.8
-                if FY_START <= parsed_date <= FY_END:
-                    confidence = 1.0
-                elif parsed_date.year in (2024, 2025):
-                    confidence = 0.9
-                
-                # Higher confidence for certain patterns
-                if format_type in ('ymd', 'dmy'):
-                    confidence *= 1.0
-                elif format_type == 'yymmdd':
-                    confidence *= 0.7  # Filename dates are less reliable
-                
-                dates_found.append((parsed_date, confidence, match.group()))
-    
-    # Remove duplicates, keeping highest confidence
-    unique_dates = {}
-    for d, conf, source in dates_found:
-        if d not in unique_dates or conf > unique_dates[d][0]:
-            unique_dates[d] = (conf, source)
-    
-    return [(d, conf, src) for d, (conf, src) in unique_dates.items()]
+    # Also check the filename
+    add(OCR_EXTRACTOR.hits(filename))
+    text = ""
+    for page_text in page_texts:
+        text += page_text
+        hits = OCR_EXTRACTOR.hits(page_text)
+        add(hits)
+        if any(hit.confidence >= EARLY_STOP_CONFIDENCE and FY_START <= hit.date <= FY_END for hit in hits):
+            break
+    return text, [(d, conf, src) for d, (conf, src) in unique.items()]
 
 
 def select_best_date(dates: List[Tuple[date, float, str]]) -> Tuple[Optional[date], float, List[str]]:
@@ -290,12 +619,17 @@ def generate_new_filename(original_path: Path, extracted_date: date) -> str:
     return f"{date_prefix} - {stem}{ext}"
 
 
-def process_document(file_path: Path) -> ProcessingResult:
-    """Process a single document and return the result."""
+def process_document(file_path: Path, force: bool = False, page_workers: int = 1) -> ProcessingResult:
+    """Process a single document and return the result.
+    
+    With force=True, files already in YYMMdd format are processed too.
+    page_workers > 1 OCRs the pages of a scanned PDF in parallel. Scanned
+    pages are rendered per set_ocr_render(), header crop included.
+    """
     result = ProcessingResult(original_path=str(file_path), status=ProcessingStatus.SKIPPED)
     
     # Check if already named correctly
-    if ALREADY_NAMED_PATTERN.match(file_path.name):
+    if not force and ALREADY_NAMED_PATTERN.match(file_path.name):
         result.status = ProcessingStatus.ALREADY_NAMED
         return result
     
@@ -305,13 +639,15 @@ def process_document(file_path: Path) -> ProcessingResult:
         result.error_message = f"Unsupported file type: {file_path.suffix}"
         return result
     
-    # Extract text based on file type
+    # Extract text based on file type, scanning pages for dates as they arrive
     try:
         if file_path.suffix.lower() == '.pdf':
-            text, used_ocr = extract_text_from_pdf(file_path)
+            pages = iter_pdf_pages(file_path, page_workers, ocr_header_crop())
         else:
-            text = extract_text_from_image(file_path)
-            used_ocr = True
+            pages = iter_image_pages(file_path)
+        
+        with closing(pages):
+            text, dates = scan_pages_for_dates((text for _, text in pages), file_path.name)
         
         if text.startswith("Error:"):
             result.status = ProcessingStatus.OCR_FAILED
@@ -322,11 +658,10 @@ def process_document(file_path: Path) -> ProcessingResult:
         
     except Exception as e:
         result.status = ProcessingStatus.OCR_FAILED
-        result.error_message = str(e)
+        result.error_message = f"Error: {e}" if file_path.suffix.lower() == '.pdf' else str(e)
         return result
     
-    # Extract dates
-    dates = extract_dates_from_text(text, file_path.name)
+    # Pick the best date
     best_date, confidence, all_dates = select_best_date(dates)
     
     result.dates_found = all_dates
@@ -367,6 +702,150 @@ def process_document(file_path: Path) -> ProcessingResult:
     return result
 
 
+# Submitted-but-unfinished documents per worker; bounds memory held by
+# queued results while still keeping every worker busy
+IN_FLIGHT_PER_WORKER = 2
+
+# Seconds past a document's timeout before the parent gives up on its worker:
+# SIGALRM cannot interrupt C code (PyMuPDF rendering, tesserocr), so a worker
+# stuck there is terminated from outside
+TIMEOUT_GRACE = 10.0
+
+
+class DocumentTimeout(BaseException):
+    """Raised when a document exceeds its time budget.
+    
+    A BaseException so the extractors' `except Exception` handlers don't
+    swallow it.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise DocumentTimeout()
+
+
+def process_document_with_timeout(file_path: Path, timeout: Optional[float] = None,
+                                  force: bool = False, page_workers: int = 1) -> ProcessingResult:
+    """
+    process_document() with a wall-clock limit (SIGALRM; no limit if timeout is None).
+    
+    The alarm only fires between Python bytecodes; process_documents()
+    also enforces the limit from the parent, for code stuck in C.
+    """
+    os.environ[OCR_TIMEOUT_ENV] = str(timeout or 0)
+    if not timeout or not hasattr(signal, 'SIGALRM'):
+        return process_document(file_path, force, page_workers)
+    
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return process_document(file_path, force, page_workers)
+    except DocumentTimeout:
+        return ProcessingResult(
+            original_path=str(file_path),
+            status=ProcessingStatus.OCR_FAILED,
+            error_message=f"Timed out after {timeout:g}s"
+        )
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _record_worker_pid(pids):
+    """Document pool initializer: report this worker's pid to the parent."""
+    pids.put(os.getpid())
+
+
+def _start_document_pool(workers: int) -> Tuple[ProcessPoolExecutor, multiprocessing.SimpleQueue]:
+    """A document pool and the queue its workers report their pids on."""
+    pids = multiprocessing.SimpleQueue()
+    return ProcessPoolExecutor(max_workers=workers, initializer=_record_worker_pid, initargs=(pids,)), pids
+
+
+def _terminate_workers(pool: ProcessPoolExecutor, pids: multiprocessing.SimpleQueue):
+    """Kill a pool's worker processes, e.g. one stuck in C code past its timeout."""
+    while not pids.empty():
+        try:
+            os.kill(pids.get(), signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def process_documents(documents: Iterable[Path], workers: int = 1, timeout: Optional[float] = None,
+                      force: bool = False, page_workers: int = 1) -> Iterator[ProcessingResult]:
+    """
+    Process documents, yielding results in input order as they complete.
+    
+    With workers > 1, documents fan out over a process pool. At most
+    workers * IN_FLIGHT_PER_WORKER are submitted at once, so memory stays
+    bounded however many documents there are. Each document gets its own
+    timeout inside the worker.
+    
+    With a timeout, documents always run in a pool (of one worker for a
+    serial run) so the parent can enforce it: a result not back within
+    timeout + TIMEOUT_GRACE of the parent waiting for it becomes an
+    OCR_FAILED result, the pool's workers are terminated, and the other
+    unfinished documents are resubmitted to a fresh pool.
+    
+    page_workers > 1 instead parallelises within each scanned PDF, which
+    suits a few long scans better than document-level workers; it applies
+    to serial runs without a timeout only, so a document worker never
+    starts a page pool of its own (whose processes a terminated worker
+    would leave behind).
+    """
+    if workers <= 1 and not timeout:
+        for file_path in documents:
+            yield process_document_with_timeout(file_path, timeout, force, page_workers)
+        return
+    page_workers = 1
+    workers = max(workers, 1)
+    deadline = timeout + TIMEOUT_GRACE if timeout else None
+    
+    def submit(file_path: Path) -> Future:
+        try:
+            return pool.submit(process_document_with_timeout, file_path, timeout, force, page_workers)
+        except Exception as e:  # e.g. BrokenProcessPool after a worker was killed
+            future = Future()
+            future.set_exception(e)
+            return future
+    
+    paths = iter(documents)
+    pool, pids = _start_document_pool(workers)
+    try:
+        pending = deque((p, submit(p)) for p in islice(paths, workers * IN_FLIGHT_PER_WORKER))
+        while pending:
+            file_path, future = pending.popleft()
+            try:
+                result = future.result(timeout=deadline)
+            except FutureTimeout:
+                result = ProcessingResult(
+                    original_path=str(file_path),
+                    status=ProcessingStatus.OCR_FAILED,
+                    error_message=f"Timed out after {timeout:g}s (worker terminated)"
+                )
+                # Keep finished results; everything else starts again on a fresh pool
+                _terminate_workers(pool, pids)
+                pool, pids = _start_document_pool(workers)
+                pending = deque(
+                    (p, f if f.done() and not f.cancelled() and f.exception() is None else submit(p))
+                    for p, f in pending
+                )
+            except Exception as e:
+                result = ProcessingResult(
+                    original_path=str(file_path),
+                    status=ProcessingStatus.OCR_FAILED,
+                    error_message=f"Worker failed: {e}"
+                )
+            # Refill before handing the result back, so workers never idle
+            next_path = next(paths, None)
+            if next_path is not None:
+                pending.append((next_path, submit(next_path)))
+            yield result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def find_documents(root_path: Path, specific_folder: Optional[str] = None) -> List[Path]:
     """Find all documents to process."""
     documents = []
@@ -539,9 +1018,89 @@ def execute_renames(root_path: Path, results: List[ProcessingResult], use_git: b
     return renamed
 
 
-def save_manifest(root_path: Path, results: List[ProcessingResult]):
-    """Save processing results to a manifest file."""
+def manifest_key(root_path: Path, file_path: Path) -> str:
+    """Manifest lookup key: the file's path relative to the tax folder."""
+    return Path(os.path.relpath(file_path, root_path)).as_posix()
+
+
+def load_manifest(root_path: Path) -> Dict[str, dict]:
+    """Entries of the previous manifest by manifest_key (empty if none or unreadable)."""
+    manifest_path = root_path / "document_manifest.json"
+    try:
+        with open(manifest_path) as f:
+            entries = json.load(f)["results"]
+    except (OSError, ValueError, KeyError):
+        return {}
+    return {entry["path"]: entry for entry in entries if "path" in entry}
+
+
+def file_signature(file_path: Path, previous: Optional[dict] = None) -> dict:
+    """
+    Size, mtime and sha256 of a file for change detection.
+    
+    The hash is only computed when size or mtime differ from `previous`, so
+    an unchanged tree is checked with a stat per file.
+    """
+    stat = file_path.stat()
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if previous and all(previous.get(k) == v for k, v in signature.items()) and previous.get("sha256"):
+        signature["sha256"] = previous["sha256"]
+    else:
+        signature["sha256"] = file_digest(file_path)
+    return signature
+
+
+def result_from_entry(file_path: Path, entry: dict) -> ProcessingResult:
+    """Rebuild a ProcessingResult from a manifest entry."""
+    extracted = entry.get("extracted_date")
+    return ProcessingResult(
+        original_path=str(file_path),
+        status=ProcessingStatus(entry["status"]),
+        extracted_date=date.fromisoformat(extracted) if extracted else None,
+        suggested_name=entry.get("suggested_name"),
+        confidence=entry.get("confidence", 0.0),
+        error_message=entry.get("error_message", ""),
+        dates_found=list(entry.get("dates_found", []))
+    )
+
+
+def unchanged_results(root_path: Path, documents: List[Path],
+                      previous: Dict[str, dict]) -> Dict[Path, ProcessingResult]:
+    """
+    Previous results for documents whose size/mtime (or, failing that,
+    content hash) still match the manifest. Only REUSABLE_STATUSES are
+    reused; failed documents are processed again.
+    """
+    reused = {}
+    for file_path in documents:
+        entry = previous.get(manifest_key(root_path, file_path))
+        if not entry or "sha256" not in entry:
+            continue
+        try:
+            if ProcessingStatus(entry.get("status")) not in REUSABLE_STATUSES:
+                continue
+        except ValueError:
+            continue
+        try:
+            signature = file_signature(file_path, entry)
+        except OSError:
+            continue
+        if signature["sha256"] == entry["sha256"]:
+            reused[file_path] = result_from_entry(file_path, entry)
+    return reused
+
+
+def save_manifest(root_path: Path, results: List[ProcessingResult],
+                  previous: Optional[Dict[str, dict]] = None):
+    """Save processing results to a manifest file.
+    
+    Each entry records the file's size, mtime and sha256 for --incremental
+    runs; hashes are carried over from `previous` for unchanged files.
+    Entries of `previous` for files outside this run (e.g. other folders
+    than --folder) are kept while the file still exists.
+    """
     manifest_path = root_path / "document_manifest.json"
+    previous = previous or {}
     
     manifest = {
         "generated": datetime.now().isoformat(),
@@ -551,7 +1110,10 @@ def save_manifest(root_path: Path, results: List[ProcessingResult]):
     }
     
     for r in results:
+        file_path = Path(r.original_path)
+        key = manifest_key(root_path, file_path)
         entry = {
+            "path": key,
             "original_path": r.original_path,
             "status": r.status.value,
             "extracted_date": r.extracted_date.isoformat() if r.extracted_date else None,
@@ -560,8 +1122,17 @@ def save_manifest(root_path: Path, results: List[ProcessingResult]):
             "dates_found": r.dates_found,
             "error_message": r.error_message
         }
+        try:
+            entry.update(file_signature(file_path, previous.get(key)))
+        except OSError:
+            pass  # Moved or deleted since processing
         manifest["results"].append(entry)
     
+    processed = {entry["path"] for entry in manifest["results"]}
+    for key, entry in previous.items():
+        if key not in processed and (root_path / key).exists():
+            manifest["results"].append(entry)
+    
     with open(manifest_path, 'w') as f:
         json.dump(manifest, f, indent=2)
     
@@ -575,8 +1146,32 @@ def main():
     parser.add_argument('--folder', type=str, help='Process specific folder only')
     parser.add_argument('--no-git', action='store_true', help='Do not use git mv for renames')
     parser.add_argument('--move-failed', action='store_true', help='Move failed documents to NEEDS MANUAL PROCESSING')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for OCR (0 = one per CPU, default: 1)')
+    parser.add_argument('--page-workers', type=int, default=1,
+                        help='Worker processes for the pages of a scanned PDF when --workers is 1 '
+                             'and there is no --timeout (0 = one per CPU, default: 1)')
+    parser.add_argument('--timeout', type=float,
+                        help='Per-document time limit in seconds (default: no limit)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-extract all text, ignoring the text cache')
+    parser.add_argument('--ocr-backend', choices=['auto', *OCR_BACKENDS], default='auto',
+                        help='OCR engine (default: auto = tesserocr if installed, else pytesseract)')
+    parser.add_argument('--ocr-render', choices=OCR_RENDER_MODES, default='gray',
+                        help='Render scanned pages as 8-bit gray or 1-bit mono for OCR (default: gray)')
+    parser.add_argument('--header-crop', type=float, default=0.0, metavar='FRACTION',
+                        help='OCR the top FRACTION of each scanned page first, stopping there '
+                             'if it holds an FY date (e.g. 0.25; default: off)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse manifest results for files whose size/mtime/hash are unchanged')
     
     args = parser.parse_args()
+    if args.no_cache:
+        disable_cache()
+    try:
+        set_ocr_backend(args.ocr_backend)
+        set_ocr_render(args.ocr_render, args.header_crop)
+    except ValueError as e:
+        parser.error(str(e))
     
     # Determine root path
     root_path = Path(__file__).parent.parent
@@ -591,12 +1186,28 @@ def main():
         print("No documents found to process.")
         return
     
+    # Reuse results for unchanged files
+    previous = load_manifest(root_path)
+    reused = unchanged_results(root_path, documents, previous) if args.incremental else {}
+    if args.incremental:
+        print(f"   {len(reused)} unchanged since last manifest, {len(documents) - len(reused)} to process")
+    
     # Process each document
-    print(f"\n⚙️  Processing documents...")
+    workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+    page_workers = args.page_workers if args.page_workers > 0 else os.cpu_count() or 1
+    if workers > 1:
+        mode = f" ({workers} workers)..."
+    elif page_workers > 1 and not args.timeout:
+        mode = f" ({page_workers} page workers)..."
+    else:
+        mode = "..."
+    print(f"\n⚙️  Processing documents{mode}")
     results = []
+    changed = [p for p in documents if p not in reused]
+    stream = process_documents(changed, workers, args.timeout, page_workers=page_workers)
     for i, doc_path in enumerate(documents, 1):
         print(f"   [{i}/{len(documents)}] {doc_path.name[:50]}...", end=" ", flush=True)
-        result = process_document(doc_path)
+        result = reused[doc_path] if doc_path in reused else next(stream)
         results.append(result)
         
         status_emoji = {
@@ -613,7 +1224,7 @@ def main():
     print_results_table(results)
     
     # Save manifest
-    save_manifest(root_path, results)
+    save_manifest(root_path, results, previous)
     
     # Handle execution
     if args.dry_run:
@@ -3,11 +3,11 @@ Receipt Cross-Reference for Bank Statement Transactions
 Matches deductible transactions to existing receipts in 2. Deductions folder
 """
 
-import csv
 import re
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict
+from transaction_table import Row, TransactionTable, load_table
 
 # Paths
 DEDUCTIONS_DIR = Path("2. Deductions")
@@ -18,6 +18,18 @@ DEDUCTIBLE_CSV = ANALYSIS_DIR / "deductible_transactions.csv"
 DATE_TOLERANCE_DAYS = 7  # Allow receipts within ±7 days
 AMOUNT_TOLERANCE_PERCENT = 5  # Allow 5% variance in amount
 
+# Columns read from DEDUCTIBLE_CSV, or the Parquet copy beside it (see
+# transaction_table.py); the rest are ignored
+DEDUCTIBLE_COLUMNS = {
+    "date_transaction": "code",
+    "description": "code",
+    "amount": "money",
+    "owner": "code",
+    "category": "code",
+    "work_use_percent": "int",
+    "category_owner": "code",
+}
+
 
 def extract_date_from_filename(filename: str) -> datetime | None:
     """Extract date from YYMMDD prefix format."""
@@ -66,15 +78,12 @@ def load_receipts() -> dict[str, list[dict]]:
     return receipts
 
 
-def load_transactions() -> list[dict]:
-    """Load deductible transactions from CSV."""
-    transactions = []
-    with open(DEDUCTIBLE_CSV, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            row["amount"] = float(row["amount"])
-            row["date_obj"] = datetime.strptime(row["date_transaction"], "%d/%m/%Y")
-            transactions.append(row)
+def load_transactions() -> TransactionTable:
+    """Load deductible transactions, with a date_obj column (each distinct date parsed once)."""
+    transactions = load_table(DEDUCTIBLE_CSV, DEDUCTIBLE_COLUMNS)
+    transactions.add_column("date_obj", "date", transactions.derive(
+        "date_transaction", lambda date: datetime.strptime(date, "%d/%m/%Y")
+    ))
     return transactions
 
 
@@ -112,7 +121,7 @@ def normalize_merchant(description: str) -> list[str]:
     return keywords
 
 
-def find_matching_receipt(tx: dict, receipts: list[dict]) -> dict | None:
+def find_matching_receipt(tx: Row, receipts: list[dict]) -> dict | None:
     """Find a matching receipt for a transaction."""
     tx_date = tx["date_obj"]
     tx_amount = tx["amount"]
@@ -146,8 +155,8 @@ def find_matching_receipt(tx: dict, receipts: list[dict]) -> dict | None:
     return None
 
 
-def cross_reference_transactions() -> list[dict]:
-    """Main cross-reference function."""
+def cross_reference_transactions() -> TransactionTable:
+    """Main cross-reference function; adds receipt_match and receipt_filename columns."""
     print("Loading receipts...")
     receipts = load_receipts()
     print(f"  Thomas: {len(receipts['Thomas'])} files")
@@ -158,7 +167,7 @@ def cross_reference_transactions() -> list[dict]:
     print(f"  Total deductible: {len(transactions)}")
     
     print("\nMatching...")
-    results = []
+    matches = []
     
     for tx in transactions:
         owner = tx.get("category_owner", tx.get("owner", "Unknown"))
@@ -176,22 +185,20 @@ def cross_reference_transactions() -> list[dict]:
         if not receipt and owner == "Isabelle":
             receipt = find_matching_receipt(tx, receipts.get("Thomas", []))
         
-        result = {
-            **tx,
-            "receipt_match": receipt["path"] if receipt else None,
-            "receipt_filename": receipt["filename"] if receipt else "No receipt"
-        }
-        results.append(result)
+        matches.append(receipt)
     
-    return results
+    transactions.add_column("receipt_match", "code", (r["path"] if r else None for r in matches))
+    transactions.add_column("receipt_filename", "code", (r["filename"] if r else "No receipt" for r in matches))
+    return transactions
 
 
-def generate_report(results: list[dict]):
+def generate_report(results: TransactionTable):
     """Generate markdown report."""
     ANALYSIS_DIR.mkdir(parents=True, exist_ok=True)
     
-    matched = [r for r in results if r["receipt_match"]]
-    unmatched = [r for r in results if not r["receipt_match"]]
+    has_receipt = [bool(match) for match in results.column("receipt_match")]
+    matched = results.where(has_receipt)
+    unmatched = results.where(not found for found in has_receipt)
     
     report = f"""# Bank Statement Transaction Cross-Reference
 
@@ -211,7 +218,7 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}
 |------|-------------|--------|-------|---------|
 """
     
-    for r in sorted(matched, key=lambda x: x["date_obj"]):
+    for r in matched.sort("date_obj"):
         report += f"| {r['date_transaction']} | {r['description'][:35]}... | ${r['amount']:.2f} | {r['category_owner']} | [{r['receipt_filename']}]({r['receipt_match']}) |\n"
     
     report += f"""
@@ -224,7 +231,7 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}
 |------|-------------|--------|-------|----------|
 """
     
-    for r in sorted(unmatched, key=lambda x: x["date_obj"]):
+    for r in unmatched.sort("date_obj"):
         report += f"| {r['date_transaction']} | {r['description'][:35]}... | ${r['amount']:.2f} | {r['category_owner']} | {r['category']} |\n"
     
     report += f"""
@@ -257,17 +264,14 @@ def main():
     
     # Also save as CSV
     csv_path = ANALYSIS_DIR / "transaction_crossref.csv"
-    with open(csv_path, 'w', newline='') as f:
-        fieldnames = ["date_transaction", "description", "amount", "category_owner", 
-                      "category", "work_use_percent", "receipt_filename", "receipt_match"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(results)
+    fieldnames = ["date_transaction", "description", "amount", "category_owner", 
+                  "category", "work_use_percent", "receipt_filename", "receipt_match"]
+    results.to_csv(csv_path, fieldnames)
     
     print(f"CSV saved to: {csv_path}")
     
     # Summary stats
-    matched = len([r for r in results if r["receipt_match"]])
+    matched = sum(1 for match in results.column("receipt_match") if match)
     print(f"\n✓ Matched: {matched}/{len(results)} transactions")
     print(f"✗ Need receipts: {len(results) - matched} transactions")
 
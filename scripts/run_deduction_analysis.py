@@ -3,118 +3,152 @@ Comprehensive Deduction Analysis for FY24-25
 Processes ANZ and Bank Australia transactions with updated tax_categories.py
 """
 
-import csv
+from itertools import islice
 from pathlib import Path
-from collections import defaultdict
 from tax_categories import TAX_CATEGORIES, categorise_transaction
+from transaction_table import TransactionTable, load_table
 
 BASE_PATH = Path(__file__).parent.parent
 ANALYSIS_PATH = BASE_PATH / '5. Bank Statements' / 'Analysis'
 
+# Columns read from the ANZ and Bank Australia exports (see transaction_table.py)
+ANZ_EXPORT_COLUMNS = {
+    'date_transaction': 'code',
+    'description': 'code',
+    'amount': 'money',
+}
+BANK_AUSTRALIA_EXPORT_COLUMNS = {
+    'date': 'code',
+    'description': 'code',
+    'amount': 'money',
+    'account': 'code',
+}
+
+# Column kinds of the loaded transactions, and of the category fields
+# analyse_transactions() adds
+LOADED_COLUMNS = {
+    'date': 'code',
+    'description': 'code',
+    'amount': 'money',
+    'source': 'code',
+}
+ANALYSIS_COLUMNS = {
+    'category': 'code',
+    'category_description': 'code',
+    'default_owner': 'code',
+    'work_use_percent': 'int',
+    'is_income': 'bool',
+    'is_deductible': 'bool',
+    'notes': 'code',
+    'matched_keyword': 'code',
+}
+
+
+def parse_csv_amount(text):
+    """An ANZ export amount; blank or malformed cells count as 0."""
+    try:
+        return float(text) if text else 0
+    except ValueError:
+        return 0
+
 
 def load_anz_transactions():
-    """Load ANZ credit card transactions from all_transactions.csv"""
-    transactions = []
+    """Load ANZ credit card transactions from all_transactions.csv (or its Parquet copy)"""
     csv_path = ANALYSIS_PATH / 'all_transactions.csv'
     
     if not csv_path.exists():
         print(f"Warning: {csv_path} not found")
-        return transactions
-    
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # ANZ format: date_transaction, description, amount, ...
-            desc = row.get('description', '')
-            amt_str = row.get('amount', '0')
-            try:
-                amt = float(amt_str) if amt_str else 0
-            except ValueError:
-                amt = 0
-            
-            # ANZ amounts in CSV are positive for purchases - make negative for expenses
-            transactions.append({
-                'date': row.get('date_transaction', ''),
-                'description': desc,
-                'amount': -abs(amt),  # Expenses as negative
-                'source': 'ANZ Credit Card'
-            })
-    
-    return transactions
+        return TransactionTable(LOADED_COLUMNS)
+    
+    # ANZ format: date_transaction, description, amount, ...
+    # Missing columns and short rows read as blank cells (amount 0)
+    anz = load_table(csv_path, ANZ_EXPORT_COLUMNS, converters={'amount': parse_csv_amount},
+                     defaults={name: '' for name in ANZ_EXPORT_COLUMNS})
+    
+    # ANZ amounts in CSV are positive for purchases - make negative for expenses
+    return TransactionTable.from_columns(LOADED_COLUMNS, {
+        'date': anz.column('date_transaction'),
+        'description': anz.column('description'),
+        'amount': (-abs(amount) for amount in anz.column('amount')),  # Expenses as negative
+        'source': ['ANZ Credit Card'] * len(anz),
+    })
 
 
 def load_bank_australia_transactions():
-    """Load Bank Australia transactions"""
-    transactions = []
+    """Load Bank Australia transactions (from the CSV or its Parquet copy)"""
     csv_path = ANALYSIS_PATH / 'bank_australia_transactions.csv'
     
     if not csv_path.exists():
         print(f"Warning: {csv_path} not found")
-        return transactions
+        return TransactionTable(LOADED_COLUMNS)
     
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            transactions.append({
-                'date': row['date'],
-                'description': row['description'],
-                'amount': float(row['amount']),
-                'source': f"Bank Australia ({row['account']})"
-            })
-    
-    return transactions
+    bank = load_table(csv_path, BANK_AUSTRALIA_EXPORT_COLUMNS)
+    return TransactionTable.from_columns(LOADED_COLUMNS, {
+        'date': bank.column('date'),
+        'description': bank.column('description'),
+        'amount': bank.column('amount'),
+        'source': bank.derive('account', lambda account: f"Bank Australia ({account})"),
+    })
 
 
 def analyse_transactions(transactions):
-    """Categorise all transactions and identify deductibles."""
-    results = {
+    """
+    Categorise all transactions and identify deductibles.
+    
+    Adds ANALYSIS_COLUMNS to the table and returns (results, category_totals):
+    results holds a sub-table per outcome, the deductible one with
+    gross_amount and deductible_amount columns.
+    """
+    columns = {name: [] for name in ANALYSIS_COLUMNS}
+    groups = {
         'deductible': [],
         'income': [],
         'excluded': [],
         'unclassified': []
     }
+    gross_amounts = []
+    deductible_amounts = []
     
-    category_totals = defaultdict(lambda: {'count': 0, 'gross': 0, 'deductible': 0})
-    
-    for txn in transactions:
-        cat_result = categorise_transaction(txn['description'], txn['amount'])
-        
-        # Create record with original transaction description preserved
-        record = {
-            'date': txn['date'],
-            'transaction_description': txn['description'],  # Original description
-            'amount': txn['amount'],
-            'source': txn['source'],
-            'category': cat_result['category'],
-            'category_description': cat_result['description'],  # Category description
-            'default_owner': cat_result['default_owner'],
-            'work_use_percent': cat_result['work_use_percent'],
-            'is_income': cat_result['is_income'],
-            'is_deductible': cat_result['is_deductible'],
-            'notes': cat_result['notes'],
-            'matched_keyword': cat_result['matched_keyword']
-        }
+    for i, (description, amount) in enumerate(zip(transactions.column('description'),
+                                                   transactions.column('amount'))):
+        cat_result = categorise_transaction(description, amount)
+        columns['category'].append(cat_result['category'])
+        columns['category_description'].append(cat_result['description'])
+        columns['default_owner'].append(cat_result['default_owner'])
+        columns['work_use_percent'].append(cat_result['work_use_percent'])
+        columns['is_income'].append(cat_result['is_income'])
+        columns['is_deductible'].append(cat_result['is_deductible'])
+        columns['notes'].append(cat_result['notes'])
+        columns['matched_keyword'].append(cat_result['matched_keyword'])
         
         # Calculate deductible amount
-        if cat_result['is_deductible'] and txn['amount'] < 0:  # Expenses are negative
-            gross = abs(txn['amount'])
-            deductible = gross * (cat_result['work_use_percent'] / 100)
-            record['gross_amount'] = gross
-            record['deductible_amount'] = deductible
-            results['deductible'].append(record)
-            
-            cat = cat_result['category']
-            category_totals[cat]['count'] += 1
-            category_totals[cat]['gross'] += gross
-            category_totals[cat]['deductible'] += deductible
-            
-        elif cat_result['is_income'] and txn['amount'] > 0:
-            results['income'].append(record)
+        if cat_result['is_deductible'] and amount < 0:  # Expenses are negative
+            gross = abs(amount)
+            gross_amounts.append(gross)
+            deductible_amounts.append(gross * (cat_result['work_use_percent'] / 100))
+            groups['deductible'].append(i)
+        elif cat_result['is_income'] and amount > 0:
+            groups['income'].append(i)
         elif cat_result['category'] in ['personal_not_deductible', 'childcare_family', 'health_insurance']:
-            results['excluded'].append(record)
+            groups['excluded'].append(i)
         elif cat_result['category'] == 'unclassified':
-            results['unclassified'].append(record)
+            groups['unclassified'].append(i)
+    
+    for name, kind in ANALYSIS_COLUMNS.items():
+        transactions.add_column(name, kind, columns[name])
+    results = {name: transactions.take(rows) for name, rows in groups.items()}
+    deductible = results['deductible']
+    deductible.add_column('gross_amount', 'float', gross_amounts)
+    deductible.add_column('deductible_amount', 'float', deductible_amounts)
     
+    category_totals = {
+        cat: {
+            'count': len(rows),
+            'gross': deductible.sum('gross_amount', rows),
+            'deductible': deductible.sum('deductible_amount', rows),
+        }
+        for cat, rows in deductible.group('category').items()
+    }
     return results, category_totals
 
 
@@ -128,7 +162,7 @@ def main():
     anz_txns = load_anz_transactions()
     ba_txns = load_bank_australia_transactions()
     
-    all_txns = anz_txns + ba_txns
+    all_txns = anz_txns.concat(ba_txns)
     print(f"  ANZ Credit Card: {len(anz_txns)} transactions")
     print(f"  Bank Australia:  {len(ba_txns)} transactions")
     print(f"  Total:           {len(all_txns)} transactions")
@@ -163,35 +197,21 @@ def main():
     print("DEDUCTIONS BY OWNER")
     print("=" * 70)
     
-    owner_totals = defaultdict(lambda: {'gross': 0, 'deductible': 0})
-    for txn in results['deductible']:
-        owner = txn['default_owner']
-        owner_totals[owner]['gross'] += txn['gross_amount']
-        owner_totals[owner]['deductible'] += txn['deductible_amount']
+    deductible = results['deductible']
+    owner_totals = {
+        owner: {'gross': deductible.sum('gross_amount', rows), 'deductible': deductible.sum('deductible_amount', rows)}
+        for owner, rows in deductible.group('default_owner').items()
+    }
     
     for owner, totals in sorted(owner_totals.items()):
         print(f"  {owner}: ${totals['deductible']:.2f} (from ${totals['gross']:.2f} gross)")
     
     # Save detailed deductions to CSV
     output_file = ANALYSIS_PATH / 'deductible_transactions_v2.csv'
-    with open(output_file, 'w', newline='') as f:
-        fieldnames = ['date', 'transaction_description', 'source', 'category', 'default_owner', 
-                      'work_use_percent', 'gross_amount', 'deductible_amount', 'notes']
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for txn in sorted(results['deductible'], key=lambda x: x['date']):
-            row = {
-                'date': txn['date'],
-                'transaction_description': txn['transaction_description'],  # Original transaction description
-                'source': txn['source'],
-                'category': txn['category'],
-                'default_owner': txn['default_owner'],
-                'work_use_percent': txn['work_use_percent'],
-                'gross_amount': txn['gross_amount'],
-                'deductible_amount': txn['deductible_amount'],
-                'notes': txn['notes']
-            }
-            writer.writerow(row)
+    fieldnames = ['date', 'description', 'source', 'category', 'default_owner',
+                  'work_use_percent', 'gross_amount', 'deductible_amount', 'notes']
+    header = ['date', 'transaction_description'] + fieldnames[2:]  # Original transaction description
+    deductible.sort('date').to_csv(output_file, fieldnames, header)
     
     print(f"\nDetailed deductions saved to: {output_file}")
     
@@ -200,9 +220,9 @@ def main():
     print("HIGH-VALUE DEDUCTIONS (>$100) - VERIFY RECEIPTS")
     print("=" * 70)
     
-    high_value = [t for t in results['deductible'] if t['gross_amount'] >= 100]
-    for txn in sorted(high_value, key=lambda x: -x['gross_amount']):
-        print(f"  {txn['date']} | ${txn['gross_amount']:.2f} | {txn['transaction_description'][:40]} | {txn['category']}")
+    high_value = deductible.where(gross >= 100 for gross in deductible.column('gross_amount'))
+    for txn in high_value.sort('gross_amount', reverse=True):
+        print(f"  {txn['date']} | ${txn['gross_amount']:.2f} | {txn['description'][:40]} | {txn['category']}")
     
     # Print unclassified for review
     if results['unclassified']:
@@ -212,9 +232,10 @@ def main():
         print("=" * 70)
         
         # Only show expenses over $50
-        notable = [t for t in results['unclassified'] if t['amount'] < -50]
-        for txn in sorted(notable, key=lambda x: x['amount'])[:20]:
-            print(f"  {txn['date']} | ${abs(txn['amount']):.2f} | {txn['transaction_description'][:50]}")
+        unclassified = results['unclassified']
+        notable = unclassified.where(amount < -50 for amount in unclassified.column('amount'))
+        for txn in islice(notable.sort('amount'), 20):
+            print(f"  {txn['date']} | ${abs(txn['amount']):.2f} | {txn['description'][:50]}")
     
     # Final summary
     print("\n" + "=" * 70)
@@ -1,13 +1,11 @@
 """
 Scan Bank Australia transactions for deductible items
 """
-import csv
+from transaction_table import load_table
 
-# Load transactions
-transactions = []
-with open('5. Bank Statements/Analysis/bank_australia_transactions.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    transactions = list(reader)
+# Load transactions (from the CSV, or its Parquet copy when that is current)
+transactions = load_table('5. Bank Statements/Analysis/bank_australia_transactions.csv',
+                          {'date': 'code', 'description': 'code', 'amount': 'money'})
 
 # Keywords to look for (from tax_categories.py)
 keywords = [
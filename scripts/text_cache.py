@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of extracted document text.
+
+Text is stored per page in a SQLite database, keyed by the sha256 of the
+file's bytes plus the extractor name and version. A renamed or moved file
+is still a hit, an edited file is a miss, and bumping an extractor's
+version invalidates only that extractor's entries. Once the stored text
+exceeds the size limit, the least recently used documents are evicted,
+along with the text-layer index entry of a file with nothing left cached.
+
+The same database holds a per-page text-layer index (characters of text
+per page), so callers can rasterise only the pages without a text layer.
+It is filled from PyMuPDF on first sight of a file, or seeded from
+ocr_pdf_text_layer_audit.csv with --import-audit.
+
+Used by ocr_processor.py, verify_pdf_dates.py, anz_parser.py and
+calculate_subscriptions.py. Each takes --no-cache to bypass it.
+
+Usage:
+    python scripts/text_cache.py --stats            # Entries, size, extractors
+    python scripts/text_cache.py --evict --max-mb 64
+    python scripts/text_cache.py --clear
+    python scripts/text_cache.py --import-audit     # Seed the text-layer index
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import fitz  # PyMuPDF
+
+CACHE_PATH = Path(__file__).parent.parent / '.text_cache.sqlite'
+AUDIT_CSV_PATH = Path(__file__).parent.parent / 'ocr_pdf_text_layer_audit.csv'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Set (and inherited by worker processes) when the cache is bypassed
+DISABLE_ENV = 'TAX_TEXT_CACHE_DISABLED'
+
+# Extractor keys; bump the version when an extractor's output changes
+PDF_TEXT_EXTRACTOR = 'fitz-text/1'
+
+# A page with fewer characters of text than this has no usable text layer
+TEXT_LAYER_MIN_CHARS = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    digest TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (digest, extractor)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    digest TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (digest, extractor, page)
+);
+CREATE TABLE IF NOT EXISTS text_layer (
+    digest TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    page_chars TEXT NOT NULL
+);
+"""
+
+_connection: Optional[sqlite3.Connection] = None
+_connection_pid = 0
+
+# file_digest() results by (path, size, mtime_ns), so one run hashes each file once
+_digests = {}
+
+
+def disable_cache():
+    """Bypass the cache in this process and any workers it starts."""
+    os.environ[DISABLE_ENV] = '1'
+
+
+def cache_enabled() -> bool:
+    return not os.environ.get(DISABLE_ENV)
+
+
+def file_digest(path: Path) -> str:
+    """sha256 hex digest of a file's contents."""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _digests:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        _digests[key] = digest.hexdigest()
+    return _digests[key]
+
+
+def connect(path: Path = CACHE_PATH) -> sqlite3.Connection:
+    """Open the cache database; one connection per process (never shared across fork)."""
+    global _connection, _connection_pid
+    if _connection is None or _connection_pid != os.getpid():
+        _connection = sqlite3.connect(path, timeout=30)
+        _connection.execute('PRAGMA journal_mode=WAL')
+        _connection.executescript(_SCHEMA)
+        _connection_pid = os.getpid()
+    return _connection
+
+
+def get_pages(digest: str, extractor: str) -> Optional[List[str]]:
+    """Cached page texts for a document, or None on a miss."""
+    db = connect()
+    with db:
+        touched = db.execute(
+            'UPDATE documents SET last_used = ? WHERE digest = ? AND extractor = ?',
+            (time.time(), digest, extractor)
+        ).rowcount
+    if not touched:
+        return None
+    rows = db.execute(
+        'SELECT text FROM pages WHERE digest = ? AND extractor = ? ORDER BY page',
+        (digest, extractor)
+    )
+    return [text for text, in rows]
+
+
+def put_pages(digest: str, extractor: str, pages: List[str], max_bytes: int = DEFAULT_MAX_BYTES):
+    """Store page texts for a document, then evict down to max_bytes."""
+    db = connect()
+    size = sum(len(text.encode('utf-8')) for text in pages)
+    with db:
+        db.execute('DELETE FROM pages WHERE digest = ? AND extractor = ?', (digest, extractor))
+        db.execute('INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)',
+                   (digest, extractor, size, time.time()))
+        db.executemany('INSERT INTO pages VALUES (?, ?, ?, ?)',
+                       [(digest, extractor, i, text) for i, text in enumerate(pages)])
+    evict(max_bytes)
+
+
+def get_page(digest: str, extractor: str, page: int) -> Optional[str]:
+    """One cached page, for extractors that fill a document page by page."""
+    row = connect().execute(
+        'SELECT text FROM pages WHERE digest = ? AND extractor = ? AND page = ?',
+        (digest, extractor, page)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def put_page(digest: str, extractor: str, page: int, text: str, max_bytes: int = DEFAULT_MAX_BYTES):
+    """Store one page, recounting the document's size, then evict down to max_bytes."""
+    db = connect()
+    with db:
+        db.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)', (digest, extractor, page, text))
+        # Recounted rather than added to, so rewriting a page does not count it twice
+        size = db.execute(
+            'SELECT SUM(LENGTH(CAST(text AS BLOB))) FROM pages WHERE digest = ? AND extractor = ?',
+            (digest, extractor)
+        ).fetchone()[0]
+        db.execute('INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)',
+                   (digest, extractor, size, time.time()))
+    evict(max_bytes)
+
+
+def evict(max_bytes: int = DEFAULT_MAX_BYTES) -> int:
+    """
+    Drop least recently used documents until the stored text fits; returns the count.
+
+    A file's text-layer index entry goes once none of its documents are
+    left, so the index stays bounded by the files still cached.
+    """
+    db = connect()
+    total = db.execute('SELECT COALESCE(SUM(size), 0) FROM documents').fetchone()[0]
+    if total <= max_bytes:
+        return 0
+    evicted = 0
+    with db:
+        rows = db.execute('SELECT digest, extractor, size FROM documents ORDER BY last_used').fetchall()
+        for digest, extractor, size in rows:
+            if total <= max_bytes:
+                break
+            db.execute('DELETE FROM pages WHERE digest = ? AND extractor = ?', (digest, extractor))
+            db.execute('DELETE FROM documents WHERE digest = ? AND extractor = ?', (digest, extractor))
+            db.execute('DELETE FROM text_layer WHERE digest = ? AND NOT EXISTS '
+                       '(SELECT 1 FROM documents WHERE digest = ?)', (digest, digest))
+            total -= size
+            evicted += 1
+    return evicted
+
+
+def cached_pages(path: Path, extractor: str, extract: Callable[[Path], List[str]]) -> List[str]:
+    """
+    Page texts of a file from the cache, running extract(path) on a miss.
+
+    extract() raising is never cached, so failed reads are retried next run.
+    """
+    if not cache_enabled():
+        return extract(path)
+    digest = file_digest(path)
+    pages = get_pages(digest, extractor)
+    if pages is None:
+        pages = extract(path)
+        put_pages(digest, extractor, pages)
+    return pages
+
+
+def extract_pdf_text(path: Path) -> List[str]:
+    """Text layer of every page, via PyMuPDF."""
+    with fitz.open(path) as doc:
+        return [page.get_text() for page in doc]
+
+
+def pdf_page_texts(path: Path) -> List[str]:
+    """Text layer of every page of a PDF, served from the cache when unchanged."""
+    return cached_pages(Path(path), PDF_TEXT_EXTRACTOR, extract_pdf_text)
+
+
+# =============================================================================
+# TEXT-LAYER INDEX
+# =============================================================================
+
+def count_page_chars(pages: List[str]) -> List[int]:
+    """Length of each page's text, ignoring surrounding whitespace."""
+    return [len(text.strip()) for text in pages]
+
+
+def pdf_page_chars(path: Path) -> List[int]:
+    """
+    Characters of text-layer text on each page of a PDF, from the index.
+
+    A file not yet indexed is read with PyMuPDF (through the text cache)
+    and recorded, so later runs never need the text to decide what to OCR.
+    """
+    path = Path(path)
+    if not cache_enabled():
+        return count_page_chars(extract_pdf_text(path))
+    digest = file_digest(path)
+    db = connect()
+    row = db.execute('SELECT page_chars FROM text_layer WHERE digest = ?', (digest,)).fetchone()
+    if row:
+        return json.loads(row[0])
+    page_chars = count_page_chars(cached_pages(path, PDF_TEXT_EXTRACTOR, extract_pdf_text))
+    with db:
+        db.execute('INSERT OR REPLACE INTO text_layer VALUES (?, ?, ?)',
+                   (digest, 'fitz', json.dumps(page_chars)))
+    return page_chars
+
+
+def import_text_layer_audit(csv_path: Path = AUDIT_CSV_PATH, root: Optional[Path] = None) -> int:
+    """
+    Seed the index from a text-layer audit CSV (path,status,... rows).
+
+    The audit is per file: files it marks as having no text layer are
+    indexed with every page empty, so their text is never extracted.
+    Files with a text layer are indexed per page from PyMuPDF. Returns the
+    number of files indexed; rows for missing files are skipped.
+    """
+    root = Path(root) if root else csv_path.parent
+    indexed = 0
+    with open(csv_path, newline='') as f:
+        for row in csv.DictReader(f):
+            path = root / row['path']
+            if not path.is_file():
+                continue
+            if row['status'] == 'has_text_layer':
+                pdf_page_chars(path)
+            else:
+                with fitz.open(path) as doc:
+                    page_chars = [0] * len(doc)
+                db = connect()
+                with db:
+                    db.execute('INSERT OR REPLACE INTO text_layer VALUES (?, ?, ?)',
+                               (file_digest(path), 'audit', json.dumps(page_chars)))
+            indexed += 1
+    return indexed
+
+
+def print_stats():
+    db = connect()
+    rows = db.execute(
+        'SELECT extractor, COUNT(*), SUM(size) FROM documents GROUP BY extractor ORDER BY extractor'
+    ).fetchall()
+    print(f"Cache: {CACHE_PATH}")
+    print(f"{'Extractor':<24} {'Documents':>10} {'KB':>10}")
+    print("-" * 46)
+    for extractor, count, size in rows:
+        print(f"{extractor:<24} {count:>10} {size / 1024:>10.1f}")
+    total = sum(size for _, _, size in rows)
+    print(f"{'Total':<24} {sum(count for _, count, _ in rows):>10} {total / 1024:>10.1f}")
+
+    indexed = db.execute('SELECT page_chars FROM text_layer').fetchall()
+    page_chars = [chars for row in indexed for chars in json.loads(row[0])]
+    missing = sum(chars < TEXT_LAYER_MIN_CHARS for chars in page_chars)
+    print(f"\nText-layer index: {len(indexed)} files, {len(page_chars)} pages, "
+          f"{missing} without a text layer")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or trim the extracted-text cache')
+    parser.add_argument('--stats', action='store_true', help='Show cache contents by extractor')
+    parser.add_argument('--evict', action='store_true', help='Evict least recently used documents')
+    parser.add_argument('--max-mb', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help='Size limit for --evict in MB (default: %(default)g)')
+    parser.add_argument('--clear', action='store_true', help='Delete every cached document')
+    parser.add_argument('--import-audit', nargs='?', const=AUDIT_CSV_PATH, type=Path, metavar='CSV',
+                        help='Seed the text-layer index from an audit CSV (default: %(const)s)')
+    args = parser.parse_args()
+
+    if args.clear:
+        db = connect()
+        with db:
+            db.execute('DELETE FROM pages')
+            db.execute('DELETE FROM documents')
+            db.execute('DELETE FROM text_layer')
+        db.execute('VACUUM')
+        print("Cache cleared")
+    elif args.import_audit:
+        indexed = import_text_layer_audit(args.import_audit)
+        print(f"Indexed {indexed} files from {args.import_audit}")
+    elif args.evict:
+        evicted = evict(int(args.max_mb * 1024 * 1024))
+        print(f"Evicted {evicted} documents")
+    else:
+        print_stats()
+
+
+if __name__ == '__main__':
+    main()
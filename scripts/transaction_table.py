@@ -0,0 +1,635 @@
+"""
+Columnar table of bank and card transactions.
+
+anz_parser.py, bank_australia_parser.py, run_deduction_analysis.py and
+receipt_matcher.py pass transactions between stages as a TransactionTable
+instead of a list of dicts. Each field is one column:
+    text    list of values, for fields that rarely repeat
+    code    array of small ints into the column's list of distinct values
+            (interned), for repetitive fields: dates, cards, owners,
+            categories, notes, source files, and descriptions (recurring
+            merchants). None is a value like any other.
+    money   array('d') of dollar amounts with cents, e.g. amount and balance
+    float   array('d'), any other float
+    int     array('l'), e.g. work_use_percent
+    bool    array('b')
+    date    array('l') of proleptic ordinals, read back as datetime
+A transaction costs a few bytes per code column and eight per float,
+against a dict of 20+ keys and a boxed value per key.
+
+table[i] is a Row, a read-only view that supports tx["field"] and
+tx.get("field"), so per-transaction code reads the same as with dicts.
+Aggregations work on whole columns: where() and take() select rows,
+sort() reorders them, group() and sum() summarise them.
+
+Stages hand tables to each other through the CSVs in the Analysis folder.
+With pyarrow installed, save_table() also writes a Parquet file beside
+each CSV, with typed columns (code -> dictionary of strings, money ->
+decimal128(15, 2) when it is all whole cents, dates -> date32), and
+load_table() reads that instead of the CSV while it is at least as new
+and holds the requested columns: no per-row parsing, and the file is
+memory-mapped. The CSVs stay the human-facing export. Set
+TAX_PARQUET_DISABLED (or call disable_parquet()) to use CSV only.
+
+Usage:
+    table = TransactionTable({'date': 'code', 'description': 'code', 'amount': 'float'})
+    table.append({'date': '2024-07-01', 'description': 'OFFICEWORKS', 'amount': -12.5})
+    debits = table.where([amount < 0 for amount in table.column('amount')])
+    table.to_csv(path, ['date', 'description', 'amount'])
+    save_table(table, csv_path, ['date', 'description', 'amount'], date_formats={'date': '%Y-%m-%d'})
+    table = load_table(csv_path, {'date': 'code', 'description': 'code', 'amount': 'money'})
+"""
+
+import csv
+import json
+import os
+import sys
+from array import array
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # optional: Parquet interchange files, else CSV only
+    pa = pc = pq = None
+
+# Column kind -> array typecode; text and code columns are handled separately
+_TYPECODES = {'money': 'd', 'float': 'd', 'int': 'l', 'bool': 'b', 'date': 'l'}
+
+# Set (and inherited by child processes) to read and write CSV only
+PARQUET_DISABLE_ENV = 'TAX_PARQUET_DISABLED'
+
+# Parquet schema metadata key holding the column kinds and date formats
+_PARQUET_METADATA_KEY = b'transaction_table'
+
+# Arrow type of money columns: dollars to the cent
+MONEY_DECIMAL_PRECISION = 15
+
+# date32 counts days from 1970-01-01; date columns hold proleptic ordinals
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Typecode of a code column; widened to 'l' if a column ever has more distinct values
+_CODE_TYPECODE = 'H'
+_CODE_LIMIT = 1 << 16
+
+COLUMN_KINDS = ('text', 'code') + tuple(_TYPECODES)
+
+
+class CodeColumn:
+    """Distinct values of a column, and each row's index into them."""
+    __slots__ = ('values', 'index', 'codes')
+
+    def __init__(self):
+        self.values = []
+        self.index = {}
+        self.codes = array(_CODE_TYPECODE)
+
+    def encode(self, value) -> int:
+        code = self.index.get(value)
+        if code is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+            if code == _CODE_LIMIT and self.codes.typecode == _CODE_TYPECODE:
+                self.codes = array('l', self.codes)
+        return code
+
+    def append(self, value):
+        self.codes.append(self.encode(value))
+
+    def __getitem__(self, i):
+        return self.values[self.codes[i]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self) -> list:
+        values = self.values
+        return [values[code] for code in self.codes]
+
+    def take(self, indices: Iterable[int]) -> 'CodeColumn':
+        """The rows at indices, sharing this column's distinct values."""
+        column = CodeColumn()
+        column.values = self.values
+        column.index = self.index
+        codes = self.codes
+        column.codes = array(codes.typecode, [codes[i] for i in indices])
+        return column
+
+    def __getstate__(self):
+        return self.values, self.codes
+
+    def __setstate__(self, state):
+        self.values, self.codes = state
+        self.index = {value: code for code, value in enumerate(self.values)}
+
+
+class Row:
+    """One transaction of a TransactionTable, read like a dict."""
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table: 'TransactionTable', index: int):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, name: str):
+        return self.table.value(name, self.index)
+
+    def get(self, name: str, default=None):
+        if name not in self.table.kinds:
+            return default
+        return self.table.value(name, self.index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.table.kinds
+
+    def keys(self) -> List[str]:
+        return list(self.table.kinds)
+
+    def as_dict(self) -> dict:
+        return {name: self[name] for name in self.table.kinds}
+
+    def __repr__(self) -> str:
+        return f"Row({self.as_dict()!r})"
+
+
+class TransactionTable:
+    """
+    Transactions stored column by column.
+
+    kinds maps each field name to its column kind (see COLUMN_KINDS), in
+    column order. Rows are appended from mappings (dicts or Rows) holding
+    every field.
+    """
+
+    def __init__(self, kinds: Mapping[str, str]):
+        for name, kind in kinds.items():
+            if kind not in COLUMN_KINDS:
+                raise ValueError(f"Unknown kind {kind!r} for column {name!r}")
+        self.kinds = dict(kinds)
+        self.columns = {name: self._new_column(kind) for name, kind in self.kinds.items()}
+        self.length = 0
+
+    @staticmethod
+    def _new_column(kind: str):
+        if kind == 'text':
+            return []
+        if kind == 'code':
+            return CodeColumn()
+        return array(_TYPECODES[kind])
+
+    @classmethod
+    def from_columns(cls, kinds: Mapping[str, str], columns: Mapping[str, Iterable]) -> 'TransactionTable':
+        """A table from one iterable of values per column (all the same length)."""
+        values = {name: list(columns[name]) for name in kinds}
+        table = cls({})
+        table.length = len(next(iter(values.values()), []))
+        for name, kind in kinds.items():
+            table.add_column(name, kind, values[name])
+        return table
+
+    @classmethod
+    def from_rows(cls, kinds: Mapping[str, str], rows: Iterable[Mapping]) -> 'TransactionTable':
+        table = cls(kinds)
+        table.extend(rows)
+        return table
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, i: int) -> Row:
+        if not -self.length <= i < self.length:
+            raise IndexError('TransactionTable index out of range')
+        return Row(self, i % self.length)
+
+    def __iter__(self) -> Iterator[Row]:
+        return (Row(self, i) for i in range(self.length))
+
+    def value(self, name: str, i: int):
+        """One field of row i, as a Python value."""
+        kind = self.kinds[name]
+        value = self.columns[name][i]
+        if kind == 'bool':
+            return bool(value)
+        if kind == 'date':
+            return datetime.fromordinal(value) if value else None
+        return value
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    def _append_value(self, name: str, value):
+        kind = self.kinds[name]
+        if kind == 'date':
+            value = value.toordinal() if value is not None else 0
+        self.columns[name].append(value)
+
+    def append(self, row: Mapping):
+        """Append one transaction; row must hold every column."""
+        for name in self.kinds:
+            self._append_value(name, row[name])
+        self.length += 1
+
+    def extend(self, rows: Iterable[Mapping]):
+        for row in rows:
+            self.append(row)
+
+    def add_column(self, name: str, kind: str, values: Iterable):
+        """Add (or replace) a column from one value per row."""
+        if kind not in COLUMN_KINDS:
+            raise ValueError(f"Unknown kind {kind!r} for column {name!r}")
+        self.kinds[name] = kind
+        self.columns[name] = self._new_column(kind)
+        for value in values:
+            self._append_value(name, value)
+        if len(self.columns[name]) != self.length:
+            raise ValueError(f"Column {name!r} has {len(self.columns[name])} values for {self.length} rows")
+
+    def concat(self, other: 'TransactionTable') -> 'TransactionTable':
+        """A new table with other's rows after this table's (same columns)."""
+        table = TransactionTable(self.kinds)
+        table.extend(self)
+        table.extend(other)
+        return table
+
+    # -------------------------------------------------------------------------
+    # Column operations
+    # -------------------------------------------------------------------------
+
+    def column(self, name: str) -> Sequence:
+        """A column's values in row order (arrays are returned as-is, not copied)."""
+        kind = self.kinds[name]
+        column = self.columns[name]
+        if kind == 'code':
+            return column.decode()
+        if kind == 'bool':
+            return [bool(value) for value in column]
+        if kind == 'date':
+            return [datetime.fromordinal(value) if value else None for value in column]
+        return column
+
+    def take(self, indices: Iterable[int]) -> 'TransactionTable':
+        """A new table of the rows at indices, in that order."""
+        indices = list(indices)
+        table = TransactionTable(self.kinds)
+        for name, column in self.columns.items():
+            if isinstance(column, CodeColumn):
+                table.columns[name] = column.take(indices)
+            elif isinstance(column, array):
+                table.columns[name] = array(column.typecode, [column[i] for i in indices])
+            else:
+                table.columns[name] = [column[i] for i in indices]
+        table.length = len(indices)
+        return table
+
+    def where(self, mask: Iterable) -> 'TransactionTable':
+        """A new table of the rows whose mask entry is true."""
+        return self.take(i for i, keep in enumerate(mask) if keep)
+
+    def sort(self, name: str, reverse: bool = False) -> 'TransactionTable':
+        """A new table sorted on one column; stable, like sorted()."""
+        values = self.column(name)
+        return self.take(sorted(range(self.length), key=values.__getitem__, reverse=reverse))
+
+    def group(self, name: str) -> Dict[Any, List[int]]:
+        """Row indices by a column's value, each group in row order."""
+        groups = {}
+        for i, value in enumerate(self.column(name)):
+            groups.setdefault(value, []).append(i)
+        return groups
+
+    def derive(self, name: str, fn: Callable) -> list:
+        """fn() of a code column's value for every row, calling fn once per distinct value."""
+        column = self.columns[name]
+        results = [fn(value) for value in column.values]
+        return [results[code] for code in column.codes]
+
+    def sum(self, name: str, indices: Optional[Iterable[int]] = None) -> float:
+        """Total of a numeric column, over all rows or the rows at indices."""
+        column = self.columns[name]
+        if indices is None:
+            return sum(column, 0.0)
+        return sum((column[i] for i in indices), 0.0)
+
+    # -------------------------------------------------------------------------
+    # CSV
+    # -------------------------------------------------------------------------
+
+    def to_csv(self, path: Path, fieldnames: Sequence[str], header: Optional[Sequence[str]] = None):
+        """
+        Write the named columns to a CSV file, as csv.DictWriter would write
+        the equivalent dicts; header defaults to fieldnames.
+        """
+        columns = [self.column(name) for name in fieldnames]
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header or fieldnames)
+            writer.writerows(zip(*columns))
+
+    @classmethod
+    def read_csv(cls, path: Path, kinds: Mapping[str, str],
+                 converters: Optional[Mapping[str, Callable]] = None,
+                 defaults: Optional[Mapping[str, str]] = None) -> 'TransactionTable':
+        """
+        Load the named columns of a CSV file (other columns are ignored).
+
+        money, float and int cells are converted with float() and int(),
+        text and code cells are kept as the cell's text; converters maps a
+        column name to its own conversion. Other kinds need parsing the
+        caller does (see add_column()).
+
+        Blank lines are skipped, as csv.DictReader does. defaults maps a
+        column name to the cell text used when the file has no such column
+        or a row stops short of it; any other missing column or cell raises
+        ValueError naming the file.
+        """
+        for name, kind in kinds.items():
+            if kind not in ('text', 'code', 'money', 'float', 'int'):
+                raise ValueError(f"Column {name!r}: read_csv() cannot load {kind!r} columns")
+        table = cls(kinds)
+        converters = {**{name: _CSV_CONVERTERS.get(kind) for name, kind in kinds.items()}, **(converters or {})}
+        defaults = defaults or {}
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            positions = []
+            for name in table.kinds:
+                if name in header:
+                    positions.append(header.index(name))
+                elif name in defaults:
+                    positions.append(None)
+                else:
+                    raise ValueError(f"{path}: no {name!r} column")
+            appenders = [(table.columns[name].append, converters[name]) for name in table.kinds]
+            if None in positions:
+                width = None  # Every row needs the defaults
+            else:
+                width = max(positions, default=-1) + 1
+            for row in reader:
+                if not row:
+                    continue
+                if width is not None and len(row) >= width:
+                    for position, (append, convert) in zip(positions, appenders):
+                        value = row[position]
+                        append(convert(value) if convert else value)
+                else:
+                    for name, position, (append, convert) in zip(table.kinds, positions, appenders):
+                        if position is not None and position < len(row):
+                            value = row[position]
+                        elif name in defaults:
+                            value = defaults[name]
+                        else:
+                            raise ValueError(f"{path}, line {reader.line_num}: no {name!r} cell")
+                        append(convert(value) if convert else value)
+                table.length += 1
+        return table
+
+    # -------------------------------------------------------------------------
+    # Parquet (needs pyarrow)
+    # -------------------------------------------------------------------------
+
+    def to_parquet(self, path: Path, fieldnames: Sequence[str],
+                   date_formats: Optional[Mapping[str, str]] = None):
+        """
+        Write the named columns to a Parquet file with typed columns.
+
+        date_formats maps code columns holding date strings to their
+        strptime format; those are written as date32, parsing each distinct
+        value once. The kinds and formats go in the schema metadata, so
+        read_parquet() rebuilds the same table.
+        """
+        if pq is None:
+            raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+        date_formats = {name: fmt for name, fmt in (date_formats or {}).items() if name in fieldnames}
+        arrays = [_to_arrow(self.kinds[name], self.columns[name], self.length, date_formats.get(name))
+                  for name in fieldnames]
+        metadata = json.dumps({'kinds': {name: self.kinds[name] for name in fieldnames},
+                               'date_formats': date_formats})
+        data = pa.Table.from_arrays(arrays, names=list(fieldnames))
+        pq.write_table(data.replace_schema_metadata({_PARQUET_METADATA_KEY: metadata}), path)
+
+    @classmethod
+    def read_parquet(cls, path: Path, kinds: Optional[Mapping[str, str]] = None) -> 'TransactionTable':
+        """
+        Load columns of a Parquet file written by to_parquet(), memory-mapped.
+
+        kinds names the columns to load and their kinds (default: every
+        column, as written). Numeric columns are copied out of Arrow's
+        buffers without conversion per row; date32 columns load as date
+        kind or, as code, as strings in the format they were written from.
+        Null cells load as None (a CSV gives '' for them).
+        """
+        if pq is None:
+            raise RuntimeError("Parquet input needs pyarrow (pip install pyarrow)")
+        parquet = pq.ParquetFile(path, memory_map=True)
+        metadata = json.loads((parquet.schema_arrow.metadata or {}).get(_PARQUET_METADATA_KEY, b'{}'))
+        kinds = dict(kinds or metadata.get('kinds') or {})
+        date_formats = metadata.get('date_formats', {})
+        data = parquet.read(columns=list(kinds))
+        table = cls(kinds)
+        for name, kind in kinds.items():
+            table.columns[name] = _from_arrow(kind, data.column(name).combine_chunks(), date_formats.get(name))
+        table.length = data.num_rows
+        return table
+
+
+_CSV_CONVERTERS = {'money': float, 'float': float, 'int': int}
+
+
+# =============================================================================
+# ARROW CONVERSION
+# Numeric columns cross between array and Arrow through their raw buffers.
+# Money is decimal128 with two places when every amount is whole cents (else
+# float64); it is read back as integer cents / 100, which gives exactly the
+# float that float() of the CSV text would.
+# =============================================================================
+
+def _int_type(typecode: str):
+    """Arrow integer type of an integer array typecode (lower case signed, upper unsigned)."""
+    bits = array(typecode).itemsize * 8
+    return pa.type_for_alias(f"{'int' if typecode.islower() else 'uint'}{bits}")
+
+
+def _arrow_buffer(column: array, arrow_type, length: int):
+    """An Arrow array over an array's buffer (no copy)."""
+    return pa.Array.from_buffers(arrow_type, length, [None, pa.py_buffer(column)])
+
+
+def _array_from_arrow(typecode: str, values) -> array:
+    """An array copied from an Arrow array of the matching type (nulls as 0)."""
+    if values.null_count:
+        values = values.fill_null(0)
+    result = array(typecode)
+    size = result.itemsize
+    result.frombytes(memoryview(values.buffers()[1])[values.offset * size:(values.offset + len(values)) * size])
+    return result
+
+
+def _to_arrow(kind: str, column, length: int, date_format: Optional[str]):
+    if kind == 'text':
+        return pa.array(column, pa.string())
+    if kind == 'code':
+        # Parquet can't store a null dictionary entry: None rows get a null index
+        values = [value for value in column.values if value is not None]
+        remap = [None] * len(column.values)
+        for new, value in enumerate(values):
+            remap[column.index[value]] = new
+        if date_format:
+            dictionary = pa.array([datetime.strptime(v, date_format).date() for v in values], pa.date32())
+        else:
+            dictionary = pa.array(values)
+        codes = _arrow_buffer(column.codes, _int_type(column.codes.typecode), length)
+        indices = pc.take(pa.array(remap, pa.int32()), codes)
+        codes = pa.DictionaryArray.from_arrays(indices, dictionary)
+        return codes.dictionary_decode() if date_format else codes
+    if kind == 'money':
+        return _money_to_arrow(_arrow_buffer(column, pa.float64(), length))
+    if kind == 'float':
+        return _arrow_buffer(column, pa.float64(), length)
+    if kind == 'bool':
+        return _arrow_buffer(column, pa.int8(), length).cast(pa.bool_())
+    values = _arrow_buffer(column, _int_type(column.typecode), length)
+    if kind == 'date':
+        days = pc.subtract(values, _EPOCH_ORDINAL).cast(pa.int32()).cast(pa.date32())
+        return pc.if_else(pc.equal(values, 0), pa.scalar(None, pa.date32()), days)
+    return values
+
+
+def _money_to_arrow(values):
+    """
+    Money as decimal128 when every amount is whole cents that fit its
+    precision, so nothing is rounded; otherwise (e.g. 12.345) as float64.
+    """
+    cents = pc.round(pc.multiply(values, 100.0))
+    limit = 10.0 ** MONEY_DECIMAL_PRECISION
+    if (pc.all(pc.equal(pc.divide(cents, 100.0), values)).as_py() is not False
+            and pc.all(pc.less(pc.abs(cents), limit)).as_py() is not False):
+        return values.cast(pa.decimal128(MONEY_DECIMAL_PRECISION, 2))
+    return values
+
+
+def _from_arrow(kind: str, values, date_format: Optional[str]):
+    if kind == 'text':
+        return values.to_pylist()
+    if kind == 'code':
+        return _code_column_from_arrow(values, date_format)
+    if kind == 'money':
+        if pa.types.is_decimal(values.type):
+            cents = pc.multiply(values, pa.scalar(Decimal(100))).cast(pa.int64())
+            values = pc.divide(cents.cast(pa.float64()), 100.0)
+        return _array_from_arrow('d', values.cast(pa.float64()))
+    if kind == 'float':
+        return _array_from_arrow('d', values.cast(pa.float64()))
+    if kind == 'bool':
+        return _array_from_arrow('b', values.cast(pa.int8()))
+    if kind == 'date':
+        values = pc.add(values.cast(pa.int32()).cast(pa.int64()), _EPOCH_ORDINAL)
+    return _array_from_arrow('l', values.cast(_int_type('l')))
+
+
+def _code_column_from_arrow(values, date_format: Optional[str]) -> CodeColumn:
+    """A CodeColumn from an Arrow column, dictionary-encoded or not."""
+    if not pa.types.is_dictionary(values.type):
+        values = values.dictionary_encode()
+    distinct = values.dictionary.to_pylist()
+    if pa.types.is_date(values.dictionary.type):
+        distinct = [d.strftime(date_format) if date_format else d.isoformat() if d is not None else None
+                    for d in distinct]
+    indices = values.indices
+    if indices.null_count:
+        indices = indices.fill_null(len(distinct))
+        distinct.append(None)
+    column = CodeColumn()
+    for value in distinct:
+        column.values.append(sys.intern(value) if isinstance(value, str) else value)
+    column.index = {value: code for code, value in enumerate(column.values)}
+    typecode = column.codes.typecode if len(distinct) <= _CODE_LIMIT else 'l'
+    column.codes = _array_from_arrow(typecode, indices.cast(_int_type(typecode)))
+    return column
+
+
+# =============================================================================
+# INTERCHANGE FILES
+# =============================================================================
+
+def disable_parquet():
+    """Read and write CSV only, in this process and any it starts."""
+    os.environ[PARQUET_DISABLE_ENV] = '1'
+
+
+def parquet_enabled() -> bool:
+    return pq is not None and not os.environ.get(PARQUET_DISABLE_ENV)
+
+
+def parquet_path(csv_path: Path) -> Path:
+    """The Parquet file written beside a CSV export."""
+    return Path(csv_path).with_suffix('.parquet')
+
+
+def save_table(table: TransactionTable, csv_path: Path, fieldnames: Sequence[str],
+               header: Optional[Sequence[str]] = None,
+               date_formats: Optional[Mapping[str, str]] = None) -> Optional[Path]:
+    """
+    Write a table as a CSV export and, when Parquet is enabled, as the
+    Parquet file beside it. Returns the Parquet path, or None.
+    """
+    table.to_csv(csv_path, fieldnames, header)
+    if not parquet_enabled():
+        return None
+    path = parquet_path(csv_path)
+    table.to_parquet(path, fieldnames, date_formats)
+    return path
+
+
+def parquet_kinds(path: Path) -> Dict[str, str]:
+    """The column kinds a Parquet file was written with (from its metadata only)."""
+    metadata = pq.read_schema(path).metadata or {}
+    return json.loads(metadata.get(_PARQUET_METADATA_KEY, b'{}')).get('kinds', {})
+
+
+def _blank_nulls(table: TransactionTable) -> TransactionTable:
+    """Turn None in text and code columns into '', as a CSV round trip does."""
+    for name, kind in table.kinds.items():
+        column = table.columns[name]
+        if kind == 'text' and None in column:
+            table.columns[name] = ['' if value is None else value for value in column]
+        elif kind == 'code' and None in column.index:
+            if '' in column.index:
+                blanked = CodeColumn()
+                for value in column.decode():
+                    blanked.append('' if value is None else value)
+                table.columns[name] = blanked
+            else:
+                code = column.index.pop(None)
+                column.values[code] = ''
+                column.index[''] = code
+    return table
+
+
+def load_table(csv_path: Path, kinds: Mapping[str, str],
+               converters: Optional[Mapping[str, Callable]] = None,
+               defaults: Optional[Mapping[str, str]] = None) -> TransactionTable:
+    """
+    Load the named columns of an exported table: from the Parquet file
+    beside csv_path if Parquet is enabled and the file is at least as new
+    as the CSV (so a hand-edited CSV wins), else from the CSV.
+
+    The Parquet file is only used when it holds every requested column as
+    the requested kind; otherwise the CSV is read, with converters and
+    defaults (see TransactionTable.read_csv()). Null text and code cells
+    load as '' from either file.
+    """
+    csv_path = Path(csv_path)
+    path = parquet_path(csv_path)
+    if parquet_enabled() and path.exists() and (
+            not csv_path.exists() or path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns):
+        written = parquet_kinds(path)
+        if all(written.get(name) == kind for name, kind in kinds.items()) or not csv_path.exists():
+            return _blank_nulls(TransactionTable.read_parquet(path, kinds))
+    return TransactionTable.read_csv(csv_path, kinds, converters, defaults)
@@ -5,34 +5,15 @@ Verify PDF filename dates match document content dates.
 Checks files with YYMMDD prefix format against dates found in the PDF text.
 """
 
-import fitz
+import argparse
 import os
 import re
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
 
-# Date patterns to search for in PDF content
-DATE_PATTERNS = [
-    # DD/MM/YYYY or DD-MM-YYYY
-    (r'\b(\d{1,2})[/-](\d{1,2})[/-](20\d{2})\b', 'dmy'),
-    # DD/MM/YY or DD-MM-YY
-    (r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{2})\b', 'dmy_short'),
-    # YYYY-MM-DD (ISO)
-    (r'\b(20\d{2})-(\d{1,2})-(\d{1,2})\b', 'ymd'),
-    # DD Month YYYY (e.g., 15 June 2024)
-    (r'\b(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(20\d{2})\b', 'dMy'),
-    # Month DD, YYYY (e.g., June 15, 2024)
-    (r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(20\d{2})\b', 'Mdy'),
-    # DD.MM.YYYY
-    (r'\b(\d{1,2})\.(\d{1,2})\.(20\d{2})\b', 'dmy_dot'),
-]
-
-MONTH_MAP = {
-    'january': 1, 'february': 2, 'march': 3, 'april': 4,
-    'may': 5, 'june': 6, 'july': 7, 'august': 8,
-    'september': 9, 'october': 10, 'november': 11, 'december': 12
-}
+from date_extract import VERIFY_EXTRACTOR
+from text_cache import cache_enabled, disable_cache, pdf_page_chars, pdf_page_texts
 
 
 def parse_filename_date(filename):
@@ -57,48 +38,14 @@ def parse_filename_date(filename):
 
 def extract_dates_from_text(text):
     """Find all dates in PDF text content."""
-    dates = []
-    
-    for pattern, fmt in DATE_PATTERNS:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            try:
-                if fmt == 'dmy':
-                    d, m, y = int(match.group(1)), int(match.group(2)), int(match.group(3))
-                elif fmt == 'dmy_short':
-                    d, m, y = int(match.group(1)), int(match.group(2)), 2000 + int(match.group(3))
-                elif fmt == 'dmy_dot':
-                    d, m, y = int(match.group(1)), int(match.group(2)), int(match.group(3))
-                elif fmt == 'ymd':
-                    y, m, d = int(match.group(1)), int(match.group(2)), int(match.group(3))
-                elif fmt == 'dMy':
-                    d = int(match.group(1))
-                    m = MONTH_MAP[match.group(2).lower()]
-                    y = int(match.group(3))
-                elif fmt == 'Mdy':
-                    m = MONTH_MAP[match.group(1).lower()]
-                    d = int(match.group(2))
-                    y = int(match.group(3))
-                else:
-                    continue
-                
-                # Validate and create date
-                if 1 <= m <= 12 and 1 <= d <= 31 and 2020 <= y <= 2030:
-                    dates.append(datetime(y, m, d))
-            except (ValueError, KeyError):
-                continue
-    
-    return list(set(dates))  # Remove duplicates
+    return list({datetime(hit.date.year, hit.date.month, hit.date.day)
+                 for hit in VERIFY_EXTRACTOR.hits(text)})
 
 
 def get_pdf_text(pdf_path):
     """Extract text from PDF."""
     try:
-        doc = fitz.open(pdf_path)
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        doc.close()
-        return text
+        return "".join(pdf_page_texts(pdf_path))
     except Exception as e:
         return None
 
@@ -155,8 +102,15 @@ def verify_pdfs(root_dir, tolerance_days=7):
                 results['skipped'].append((rel_path, 'No date prefix'))
                 continue
             
-            # Extract PDF text
-            text = get_pdf_text(filepath)
+            # Extract PDF text, unless the text-layer index shows there is none.
+            # Without the cache the index would extract too, so just extract once.
+            has_text = True
+            if cache_enabled():
+                try:
+                    has_text = sum(pdf_page_chars(filepath)) >= 10
+                except Exception:
+                    has_text = False
+            text = get_pdf_text(filepath) if has_text else None
             if not text or len(text.strip()) < 10:
                 results['no_text'].append((rel_path, filename_date))
                 continue
@@ -242,11 +196,17 @@ def print_report(results):
 
 
 if __name__ == '__main__':
-    import sys
+    parser = argparse.ArgumentParser(description='Verify PDF filename dates match document content')
+    parser.add_argument('root_dir', nargs='?', default='.', help='Folder to scan (default: .)')
+    parser.add_argument('tolerance', nargs='?', type=int, default=7, help='Days of slack (default: 7)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-extract all text, ignoring the text cache')
+    args = parser.parse_args()
+    if args.no_cache:
+        disable_cache()
     
     # Default to current directory or accept path argument
-    root_dir = sys.argv[1] if len(sys.argv) > 1 else '.'
-    tolerance = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+    root_dir = args.root_dir
+    tolerance = args.tolerance
     
     print(f"Scanning: {os.path.abspath(root_dir)}")
     print(f"Tolerance: ±{tolerance} days\n")
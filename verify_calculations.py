@@ -2,273 +2,498 @@
 """
 Tax FY24-25 Calculation Verification Script
 ATO Compliance Check - All calculations done deterministically
+
+Amounts are held as int cents and rates as basis points (scripts/au_cents.py),
+so every figure is exact and rounded half-up to the cent.
+
+Household inputs live in verify_calculations.json. Each report section is a
+node in a dependency graph (NODES) that reads some input keys and the outputs
+of earlier nodes. Node outputs are cached in .verify_cache.json under a
+fingerprint of the node's code (with the helpers and au_cents functions it
+calls), inputs and dependency outputs, so a re-run only recomputes the
+nodes whose code or inputs actually changed.
+
+Usage:
+    python verify_calculations.py                 # Print the verification report
+    python verify_calculations.py --explain       # Also list recomputed/cached nodes
+    python verify_calculations.py --no-cache      # Recompute everything
+    python verify_calculations.py --data other.json
+
+From Python:
+    from verify_calculations import load_inputs, run, render
+    results, recomputed = run(load_inputs())
 """
-from decimal import Decimal, ROUND_HALF_UP
+import argparse
+import hashlib
+import inspect
+import json
+import sys
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
-def currency(value):
-    """Format as currency with 2 decimal places"""
-    return Decimal(str(value)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+sys.path.insert(0, str(Path(__file__).parent / 'scripts'))
+from au_cents import apply_rate, apply_ratio, from_cents as dollars, rate_to_bp, to_cents
 
-print("=" * 70)
-print("TAX FY24-25 CALCULATION VERIFICATION")
-print("ATO Rules: WFH Fixed Rate 70c/hr, Division 293 threshold $250k")
-print("=" * 70)
+ROOT = Path(__file__).resolve().parent
+DATA_PATH = Path(__file__).with_name('verify_calculations.json')
+CACHE_PATH = Path(__file__).with_name('.verify_cache.json')
 
-# ============================================================================
-# INCOME
-# ============================================================================
-print("\n--- INCOME ---")
+# Bump to invalidate every cached node (code changes are fingerprinted already)
+ENGINE_VERSION = 1
 
-thomas_atlassian = Decimal('86255.70')
-thomas_seek = Decimal('90000.00')
-thomas_payg = thomas_atlassian + thomas_seek
-thomas_ess = Decimal('62270.51')
-thomas_cgt = Decimal('7974.12')
-thomas_div = Decimal('34.46')
-thomas_income = thomas_payg + thomas_ess + thomas_cgt + thomas_div
 
-print(f"Thomas PAYG:     {thomas_atlassian} + {thomas_seek} = ${thomas_payg:,.2f}")
-print(f"Thomas ESS:      ${thomas_ess:,.2f}")
-print(f"Thomas CGT:      ${thomas_cgt:,.2f}")
-print(f"Thomas Div:      ${thomas_div:,.2f}")
-print(f"THOMAS TOTAL:    ${thomas_income:,.2f}")
+class Node(NamedTuple):
+    """One section of the verification: inputs + dependencies -> outputs."""
+    name: str
+    inputs: Tuple[str, ...]     # Top-level keys of the data file it reads
+    deps: Tuple[str, ...]       # Earlier nodes whose outputs it reads
+    compute: Callable[[dict, dict], dict]
 
-isabelle_income = Decimal('111470.05')
-print(f"\nISABELLE TOTAL:  ${isabelle_income:,.2f}")
 
-bank_interest = Decimal('34.96')
-print(f"Bank Interest:   ${bank_interest:,.2f}")
+def _percent(bp: int) -> str:
+    """Basis points as a percentage without trailing zeros (6500 -> '65')."""
+    return f"{bp / 100:g}"
 
-combined_income = thomas_income + isabelle_income + bank_interest
-print(f"\nCOMBINED INCOME: ${combined_income:,.2f}")
 
 # ============================================================================
-# WFH DEDUCTIONS
+# INCOME
 # ============================================================================
-print("\n--- WFH FIXED RATE (70c/hr for FY24-25) ---")
-
-WFH_RATE = Decimal('0.70')
-
-# Thomas: 20 weeks Atlassian (2 days/wk, 12 hrs/wk) + 24 weeks SEEK (2 days/wk, 10 hrs/wk)
-thomas_atlassian_wfh = 20 * 12  # 20 weeks × 12 hrs/wk
-thomas_seek_wfh = 24 * 10       # 24 weeks × 10 hrs/wk
-thomas_wfh_hrs = thomas_atlassian_wfh + thomas_seek_wfh
-thomas_wfh = currency(Decimal(thomas_wfh_hrs) * WFH_RATE)
+def compute_income(inputs: dict, deps: dict) -> dict:
+    thomas = {k: to_cents(v) for k, v in inputs['income']['thomas'].items()}
+    thomas_payg = thomas['atlassian'] + thomas['seek']
+    thomas_income = thomas_payg + thomas['ess'] + thomas['cgt'] + thomas['dividends']
+    isabelle_income = to_cents(inputs['income']['isabelle'])
+    bank_interest = to_cents(inputs['income']['bank_interest'])
+    return {
+        **{f'thomas_{k}': v for k, v in thomas.items()},
+        'thomas_payg': thomas_payg,
+        'thomas_income': thomas_income,
+        'isabelle_income': isabelle_income,
+        'bank_interest': bank_interest,
+        'combined_income': thomas_income + isabelle_income + bank_interest,
+    }
 
-print(f"Thomas Atlassian: 20 weeks × 12 hrs/wk = {thomas_atlassian_wfh} hrs")
-print(f"Thomas SEEK:      24 weeks × 10 hrs/wk = {thomas_seek_wfh} hrs")
-print(f"Thomas TOTAL:     {thomas_wfh_hrs} hrs × $0.70 = ${thomas_wfh:,.2f}")
-
-# Isabelle: 48 weeks × 3 days/wk × 7.6 hrs/day = 1095 hrs (rounded)
-isabelle_wfh_hrs = 48 * 3 * Decimal('7.6')  # = 1094.4, rounded to 1095
-isabelle_wfh_hrs_int = 1095  # As documented
-isabelle_wfh = currency(Decimal(isabelle_wfh_hrs_int) * WFH_RATE)
-
-print(f"\nIsabelle: 48 wks × 3 days × 7.6 hrs = {isabelle_wfh_hrs} hrs → rounded {isabelle_wfh_hrs_int}")
-print(f"Isabelle TOTAL:   {isabelle_wfh_hrs_int} hrs × $0.70 = ${isabelle_wfh:,.2f}")
 
 # ============================================================================
-# THOMAS EQUIPMENT
+# WFH DEDUCTIONS
 # ============================================================================
-print("\n--- THOMAS EQUIPMENT (100% work use) ---")
-
-equipment = [
-    ('iPad Pro M4 13"', Decimal('2148.99')),
-    ('iPhone 16 Pro', Decimal('1528.00')),
-    ('Apple Pencil Pro', Decimal('177.00')),
-    ('PAX Wardrobe (IKEA)', Decimal('2619.50')),
-    ('Nebula Capsule Projector', Decimal('879.99')),
-    ('LG Portable Monitor', Decimal('502.63')),
-    ('Projector Screen', Decimal('37.99')),
-    ('Clock', Decimal('19.99')),
-    ('Printing supplies', Decimal('52.48')),
-    ('Accessibility tools (Minimal Desk)', Decimal('76.93')),
-    ('WACOM drawing tablet', Decimal('168.99')),
-]
+def compute_wfh(inputs: dict, deps: dict) -> dict:
+    wfh_rate = to_cents(inputs['rates']['wfh_rate'])  # Cents per hour
+
+    # Thomas: hours per employer = weeks × hrs/wk
+    thomas_periods = [
+        [p['employer'], p['weeks'], p['hours_per_week'], p['weeks'] * p['hours_per_week']]
+        for p in inputs['wfh']['thomas']
+    ]
+    thomas_wfh_hrs = sum(hours for *_, hours in thomas_periods)
+
+    # Isabelle: weeks × days/wk × hrs/day, claimed as a documented whole number of hours
+    isabelle = inputs['wfh']['isabelle']
+    isabelle_wfh_hrs = isabelle['weeks'] * isabelle['days_per_week'] * Decimal(isabelle['hours_per_day'])
+    return {
+        'wfh_rate': wfh_rate,
+        'thomas_periods': thomas_periods,
+        'thomas_wfh_hrs': thomas_wfh_hrs,
+        'thomas_wfh': thomas_wfh_hrs * wfh_rate,
+        'isabelle': isabelle,
+        'isabelle_wfh_hrs': str(isabelle_wfh_hrs),
+        'isabelle_wfh': isabelle['hours_claimed'] * wfh_rate,
+    }
 
-equipment_total = sum(amt for _, amt in equipment)
-for name, amt in equipment:
-    print(f"  {name}: ${amt:,.2f}")
-print(f"  EQUIPMENT TOTAL: ${equipment_total:,.2f}")
 
 # ============================================================================
-# THOMAS SOFTWARE
+# THOMAS EQUIPMENT AND SOFTWARE
 # ============================================================================
-print("\n--- THOMAS SOFTWARE (100% work use) ---")
-
-software = [
-    ('Replit (3 charges)', Decimal('185.35')),
-    ('ChatGPT Plus (3)', Decimal('89.03')),
-    ('OpenArt AI', Decimal('134.48')),
-    ('BeforeSunset AI', Decimal('131.08')),
-    ('1Password', Decimal('49.95')),
-]
+def _itemised(items: List[list]) -> dict:
+    items = [[name, to_cents(amount)] for name, amount in items]
+    return {'items': items, 'total': sum(amount for _, amount in items)}
 
-software_total = sum(amt for _, amt in software)
-for name, amt in software:
-    print(f"  {name}: ${amt:,.2f}")
-print(f"  SOFTWARE TOTAL: ${software_total:,.2f}")
 
-# ============================================================================
-# OTHER THOMAS DEDUCTIONS
-# ============================================================================
-print("\n--- OTHER THOMAS DEDUCTIONS ---")
+def compute_equipment(inputs: dict, deps: dict) -> dict:
+    return _itemised(inputs['thomas_equipment'])
 
-thomas_internet = Decimal('945.00')
-thomas_productivity = Decimal('48.43')
-thomas_audible = Decimal('98.70')  # 6 × $16.45
-thomas_donations = Decimal('500.00')  # UNICEF $250 + Bravehearts $250
 
-# Home office cleaning
-cleaning_total = 5 * Decimal('132.13')
-home_office_pct = Decimal('20') / Decimal('130')
-thomas_cleaning = currency(cleaning_total * home_office_pct)
+def compute_software(inputs: dict, deps: dict) -> dict:
+    return _itemised(inputs['thomas_software'])
 
-print(f"Internet (GROSS):     ${thomas_internet:,.2f}")
-print(f"Productivity Tools:   ${thomas_productivity:,.2f}")
-print(f"Audible (6 × $16.45): ${thomas_audible:,.2f}")
-print(f"Donations:            ${thomas_donations:,.2f}")
-print(f"Cleaning: 5 × $132.13 = ${cleaning_total:,.2f}")
-print(f"  × {home_office_pct:.4f} (20m²/130m²) = ${thomas_cleaning:,.2f}")
 
 # ============================================================================
-# THOMAS TOTAL DEDUCTIONS
+# OTHER THOMAS DEDUCTIONS
 # ============================================================================
-thomas_deductions = (
-    thomas_wfh +
-    equipment_total +
-    software_total +
-    thomas_internet +
-    thomas_productivity +
-    thomas_audible +
-    thomas_donations +
-    thomas_cleaning
-)
-
-print(f"\n{'='*50}")
-print(f"THOMAS DEDUCTIONS (GROSS): ${thomas_deductions:,.2f}")
-print(f"{'='*50}")
+def compute_thomas_other(inputs: dict, deps: dict) -> dict:
+    other = inputs['thomas_other']
+    cleaning = other['cleaning']
+
+    # Home office cleaning: office floor area share of each clean
+    cleaning_total = cleaning['visits'] * to_cents(cleaning['cost'])
+    return {
+        'internet': to_cents(other['internet']),
+        'productivity': to_cents(other['productivity']),
+        'audible': to_cents(other['audible']),
+        'donations': to_cents(other['donations']),
+        'cleaning': cleaning,
+        'cleaning_total': cleaning_total,
+        'thomas_cleaning': apply_ratio(cleaning_total, cleaning['office_m2'], cleaning['home_m2']),
+    }
 
-# ============================================================================
-# ISABELLE DEDUCTIONS
-# ============================================================================
-print("\n--- ISABELLE DEDUCTIONS ---")
-
-isabelle_streaming = Decimal('819.18')
-isabelle_conferences = Decimal('81.00')
-isabelle_reading = Decimal('55.61')
-isabelle_donations = Decimal('20.37')
-
-print(f"WFH Fixed Rate:       ${isabelle_wfh:,.2f}")
-print(f"Streaming (GROSS):    ${isabelle_streaming:,.2f}")
-print(f"Conferences:          ${isabelle_conferences:,.2f}")
-print(f"Prof Reading (GROSS): ${isabelle_reading:,.2f}")
-print(f"Donations:            ${isabelle_donations:,.2f}")
-
-isabelle_deductions = (
-    isabelle_wfh +
-    isabelle_streaming +
-    isabelle_conferences +
-    isabelle_reading +
-    isabelle_donations
-)
-
-print(f"\n{'='*50}")
-print(f"ISABELLE DEDUCTIONS (GROSS): ${isabelle_deductions:,.2f}")
-print(f"{'='*50}")
 
 # ============================================================================
-# COMBINED
+# DEDUCTION TOTALS
 # ============================================================================
-combined_deductions = thomas_deductions + isabelle_deductions
+def compute_thomas_deductions(inputs: dict, deps: dict) -> dict:
+    other = deps['thomas_other']
+    return {'total': (
+        deps['wfh']['thomas_wfh'] +
+        deps['equipment']['total'] +
+        deps['software']['total'] +
+        other['internet'] +
+        other['productivity'] +
+        other['audible'] +
+        other['donations'] +
+        other['thomas_cleaning']
+    )}
+
+
+def compute_isabelle_deductions(inputs: dict, deps: dict) -> dict:
+    amounts = {k: to_cents(v) for k, v in inputs['isabelle_deductions'].items()}
+    total = deps['wfh']['isabelle_wfh'] + sum(amounts.values())
+    return {**amounts, 'total': total}
+
+
+def compute_combined_deductions(inputs: dict, deps: dict) -> dict:
+    return {'total': deps['thomas_deductions']['total'] + deps['isabelle_deductions']['total']}
 
-print(f"\n{'='*70}")
-print(f"COMBINED DEDUCTIONS (GROSS): ${combined_deductions:,.2f}")
-print(f"{'='*70}")
 
 # ============================================================================
 # CCS THRESHOLD CHECK
 # ============================================================================
-print("\n--- CCS THRESHOLD CHECK ---")
-
-CCS_THRESHOLD = Decimal('367563')
-
-# Apply work-use percentages for taxable income calculation
-thomas_internet_adj = currency(thomas_internet * Decimal('0.65'))
-isabelle_streaming_adj = currency(isabelle_streaming * Decimal('0.30'))
-isabelle_reading_adj = currency(isabelle_reading * Decimal('0.50'))
-
-thomas_deductions_adj = (
-    thomas_wfh +
-    equipment_total +
-    software_total +
-    thomas_internet_adj +
-    thomas_productivity +
-    thomas_audible +
-    thomas_donations +
-    thomas_cleaning
-)
-
-isabelle_deductions_adj = (
-    isabelle_wfh +
-    isabelle_streaming_adj +
-    isabelle_conferences +
-    isabelle_reading_adj +
-    isabelle_donations
-)
-
-thomas_taxable = thomas_income - thomas_deductions_adj
-isabelle_taxable = isabelle_income - isabelle_deductions_adj
-combined_taxable = thomas_taxable + isabelle_taxable
-
-print(f"\nAdjusted deductions (with work-use %):")
-print(f"  Thomas Internet: ${thomas_internet} × 65% = ${thomas_internet_adj}")
-print(f"  Isabelle Streaming: ${isabelle_streaming} × 30% = ${isabelle_streaming_adj}")
-print(f"  Isabelle Reading: ${isabelle_reading} × 50% = ${isabelle_reading_adj}")
-
-print(f"\nThomas adjusted deductions:   ${thomas_deductions_adj:,.2f}")
-print(f"Isabelle adjusted deductions: ${isabelle_deductions_adj:,.2f}")
-
-print(f"\nThomas taxable:   ${thomas_income:,.2f} - ${thomas_deductions_adj:,.2f} = ${thomas_taxable:,.2f}")
-print(f"Isabelle taxable: ${isabelle_income:,.2f} - ${isabelle_deductions_adj:,.2f} = ${isabelle_taxable:,.2f}")
-print(f"Combined taxable: ${combined_taxable:,.2f}")
-
-margin = CCS_THRESHOLD - combined_taxable
-status = "✓ UNDER" if margin > 0 else "✗ OVER"
-print(f"\nCCS Threshold: ${CCS_THRESHOLD:,.2f}")
-print(f"Margin:        ${margin:,.2f} {status}")
+def compute_ccs(inputs: dict, deps: dict) -> dict:
+    work_use = {k: rate_to_bp(v) for k, v in inputs['work_use'].items()}
+    other = deps['thomas_other']
+    isabelle = deps['isabelle_deductions']
+
+    # Apply work-use percentages for taxable income calculation
+    thomas_internet_adj = apply_rate(other['internet'], work_use['thomas_internet'])
+    isabelle_streaming_adj = apply_rate(isabelle['streaming'], work_use['isabelle_streaming'])
+    isabelle_reading_adj = apply_rate(isabelle['reading'], work_use['isabelle_reading'])
+
+    thomas_deductions_adj = (
+        deps['wfh']['thomas_wfh'] +
+        deps['equipment']['total'] +
+        deps['software']['total'] +
+        thomas_internet_adj +
+        other['productivity'] +
+        other['audible'] +
+        other['donations'] +
+        other['thomas_cleaning']
+    )
+
+    isabelle_deductions_adj = (
+        deps['wfh']['isabelle_wfh'] +
+        isabelle_streaming_adj +
+        isabelle['conferences'] +
+        isabelle_reading_adj +
+        isabelle['donations']
+    )
+
+    ccs_threshold = to_cents(inputs['rates']['ccs_threshold'])
+    thomas_taxable = deps['income']['thomas_income'] - thomas_deductions_adj
+    isabelle_taxable = deps['income']['isabelle_income'] - isabelle_deductions_adj
+    combined_taxable = thomas_taxable + isabelle_taxable
+    margin = ccs_threshold - combined_taxable
+    return {
+        'work_use': work_use,
+        'thomas_internet_adj': thomas_internet_adj,
+        'isabelle_streaming_adj': isabelle_streaming_adj,
+        'isabelle_reading_adj': isabelle_reading_adj,
+        'thomas_deductions_adj': thomas_deductions_adj,
+        'isabelle_deductions_adj': isabelle_deductions_adj,
+        'thomas_taxable': thomas_taxable,
+        'isabelle_taxable': isabelle_taxable,
+        'combined_taxable': combined_taxable,
+        'ccs_threshold': ccs_threshold,
+        'margin': margin,
+        'status': "✓ UNDER" if margin > 0 else "✗ OVER",
+    }
+
 
 # ============================================================================
 # DIVISION 293 CHECK
 # ============================================================================
-print("\n--- DIVISION 293 CHECK ---")
-
-DIV293_THRESHOLD = Decimal('250000')
-SUPER_RATE = Decimal('0.115')
+def compute_div293(inputs: dict, deps: dict) -> dict:
+    rates = inputs['rates']
+    div293_threshold = to_cents(rates['div293_threshold'])
+    super_rate = rate_to_bp(rates['super_rate'])
+
+    thomas_taxable = deps['ccs']['thomas_taxable']
+    thomas_super_est = apply_rate(deps['income']['thomas_payg'], super_rate)
+    thomas_div293 = thomas_taxable + thomas_super_est
+
+    excess = div293_tax = None
+    if thomas_div293 > div293_threshold:
+        excess = thomas_div293 - div293_threshold
+        div293_tax = apply_rate(min(excess, thomas_super_est), rate_to_bp(rates['div293_rate']))
+    return {
+        'super_rate': super_rate,
+        'thomas_super_est': thomas_super_est,
+        'thomas_div293': thomas_div293,
+        'div293_threshold': div293_threshold,
+        'excess': excess,
+        'div293_tax': div293_tax,
+    }
+
+
+# Evaluation order: every node appears after the nodes it depends on
+NODES = [
+    Node('income', ('income',), (), compute_income),
+    Node('wfh', ('wfh', 'rates'), (), compute_wfh),
+    Node('equipment', ('thomas_equipment',), (), compute_equipment),
+    Node('software', ('thomas_software',), (), compute_software),
+    Node('thomas_other', ('thomas_other',), (), compute_thomas_other),
+    Node('thomas_deductions', (), ('wfh', 'equipment', 'software', 'thomas_other'),
+         compute_thomas_deductions),
+    Node('isabelle_deductions', ('isabelle_deductions',), ('wfh',), compute_isabelle_deductions),
+    Node('combined_deductions', (), ('thomas_deductions', 'isabelle_deductions'),
+         compute_combined_deductions),
+    Node('ccs', ('work_use', 'rates'),
+         ('income', 'wfh', 'equipment', 'software', 'thomas_other', 'isabelle_deductions'),
+         compute_ccs),
+    Node('div293', ('rates',), ('income', 'ccs'), compute_div293),
+]
 
-thomas_super_est = currency(thomas_payg * SUPER_RATE)
-thomas_div293 = thomas_taxable + thomas_super_est
 
-print(f"Thomas taxable income: ${thomas_taxable:,.2f}")
-print(f"Thomas super (11.5%):  ${thomas_super_est:,.2f}")
-print(f"Thomas DIV293 income:  ${thomas_div293:,.2f}")
-print(f"DIV293 threshold:      ${DIV293_THRESHOLD:,.2f}")
+# ============================================================================
+# ENGINE
+# ============================================================================
+def load_inputs(path: Path = DATA_PATH) -> dict:
+    """Load household inputs from a JSON data file."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def _code_names(code) -> set:
+    """Global names a code object reads, including its nested functions and comprehensions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def _module_files(module) -> List[Path]:
+    """A module's source file and the data files it names as module-level Paths."""
+    files = [Path(inspect.getsourcefile(module))]
+    files += sorted(value for value in vars(module).values() if isinstance(value, Path) and value.is_file())
+    return files
+
+
+@lru_cache(maxsize=None)
+def _code_hash(compute: Callable) -> str:
+    """
+    Hash of a compute function's code and everything it calls.
+
+    Helpers and constants defined here are followed through the names they
+    read; a function or module from elsewhere (au_cents) contributes its
+    whole source file and module-level data files, so a change to the
+    rounding or rate tables invalidates the nodes that use them.
+    """
+    here = sys.modules[__name__]
+    digest = hashlib.sha256()
+    seen = set()
+    files = set()
+    stack = [compute]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        module = obj if inspect.ismodule(obj) else inspect.getmodule(obj)
+        if module is not None and module is not here:
+            source = getattr(module, '__file__', None)
+            if source and Path(source).resolve().is_relative_to(ROOT):
+                files.update(_module_files(module))  # Ours; the standard library is left out
+        elif inspect.isfunction(obj):
+            digest.update(inspect.getsource(obj).encode())
+            stack.extend(vars(here)[name] for name in sorted(_code_names(obj.__code__)) if name in vars(here))
+        elif not (inspect.isclass(obj) or inspect.ismodule(obj)):
+            digest.update(repr(obj).encode())
+    for path in sorted(files):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def fingerprint(node: Node, data: dict, results: dict) -> str:
+    """Hash of everything a node's outputs depend on: code, inputs, dependency outputs."""
+    payload = json.dumps({
+        'engine': ENGINE_VERSION,
+        'code': _code_hash(node.compute),
+        'inputs': {key: data[key] for key in node.inputs},
+        'deps': {dep: results[dep] for dep in node.deps},
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict:
+    """Cached {node: {'fingerprint', 'outputs'}}; empty if missing or unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict, path: Path = CACHE_PATH) -> None:
+    with open(path, 'w') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+
+
+def run(data: dict, cache: Optional[dict] = None) -> Tuple[Dict[str, dict], List[str]]:
+    """
+    Evaluate every node in dependency order.
+
+    Nodes whose fingerprint matches the cache reuse the cached outputs. The
+    cache dict is updated in place with the new fingerprints.
+
+    Returns:
+        (outputs by node name, names of the nodes that were recomputed)
+    """
+    cache = {} if cache is None else cache
+    results: Dict[str, dict] = {}
+    recomputed = []
+    for node in NODES:
+        key = fingerprint(node, data, results)
+        entry = cache.get(node.name)
+        if entry and entry.get('fingerprint') == key:
+            results[node.name] = entry['outputs']
+            continue
+        inputs = {k: data[k] for k in node.inputs}
+        deps = {d: results[d] for d in node.deps}
+        # Round-trip through JSON so fresh and cached outputs are the same types
+        outputs = json.loads(json.dumps(node.compute(inputs, deps)))
+        results[node.name] = outputs
+        cache[node.name] = {'fingerprint': key, 'outputs': outputs}
+        recomputed.append(node.name)
+    return results, recomputed
 
-if thomas_div293 > DIV293_THRESHOLD:
-    excess = thomas_div293 - DIV293_THRESHOLD
-    div293_tax = currency(min(excess, thomas_super_est) * Decimal('0.15'))
-    print(f"⚠️  EXCEEDS by ${excess:,.2f}")
-    print(f"Est DIV293 tax: ${div293_tax:,.2f}")
-else:
-    print(f"✓ Below threshold")
 
 # ============================================================================
-# ISSUE: INTERNET + WFH FIXED RATE
+# REPORT
 # ============================================================================
-print("\n" + "=" * 70)
-print("⚠️  CRITICAL ISSUE: INTERNET + WFH FIXED RATE")
-print("=" * 70)
-print("""
+def render(results: Dict[str, dict]) -> str:
+    """The verification report for a set of node outputs."""
+    income = results['income']
+    wfh = results['wfh']
+    equipment = results['equipment']
+    software = results['software']
+    other = results['thomas_other']
+    thomas_deductions = results['thomas_deductions']['total']
+    isabelle = results['isabelle_deductions']
+    combined_deductions = results['combined_deductions']['total']
+    ccs = results['ccs']
+    div293 = results['div293']
+    out = []
+    p = out.append
+
+    p("=" * 70)
+    p("TAX FY24-25 CALCULATION VERIFICATION")
+    p("ATO Rules: WFH Fixed Rate 70c/hr, Division 293 threshold $250k")
+    p("=" * 70)
+
+    p("\n--- INCOME ---")
+    p(f"Thomas PAYG:     {dollars(income['thomas_atlassian'])} + {dollars(income['thomas_seek'])} = ${dollars(income['thomas_payg']):,.2f}")
+    p(f"Thomas ESS:      ${dollars(income['thomas_ess']):,.2f}")
+    p(f"Thomas CGT:      ${dollars(income['thomas_cgt']):,.2f}")
+    p(f"Thomas Div:      ${dollars(income['thomas_dividends']):,.2f}")
+    p(f"THOMAS TOTAL:    ${dollars(income['thomas_income']):,.2f}")
+    p(f"\nISABELLE TOTAL:  ${dollars(income['isabelle_income']):,.2f}")
+    p(f"Bank Interest:   ${dollars(income['bank_interest']):,.2f}")
+    p(f"\nCOMBINED INCOME: ${dollars(income['combined_income']):,.2f}")
+
+    p("\n--- WFH FIXED RATE (70c/hr for FY24-25) ---")
+    for employer, weeks, per_week, hours in wfh['thomas_periods']:
+        p(f"{'Thomas ' + employer + ':':<18}{weeks} weeks × {per_week} hrs/wk = {hours} hrs")
+    p(f"Thomas TOTAL:     {wfh['thomas_wfh_hrs']} hrs × ${dollars(wfh['wfh_rate'])} = ${dollars(wfh['thomas_wfh']):,.2f}")
+    isabelle_wfh = wfh['isabelle']
+    p(f"\nIsabelle: {isabelle_wfh['weeks']} wks × {isabelle_wfh['days_per_week']} days × "
+      f"{isabelle_wfh['hours_per_day']} hrs = {wfh['isabelle_wfh_hrs']} hrs → rounded {isabelle_wfh['hours_claimed']}")
+    p(f"Isabelle TOTAL:   {isabelle_wfh['hours_claimed']} hrs × ${dollars(wfh['wfh_rate'])} = ${dollars(wfh['isabelle_wfh']):,.2f}")
+
+    p("\n--- THOMAS EQUIPMENT (100% work use) ---")
+    for name, amt in equipment['items']:
+        p(f"  {name}: ${dollars(amt):,.2f}")
+    p(f"  EQUIPMENT TOTAL: ${dollars(equipment['total']):,.2f}")
+
+    p("\n--- THOMAS SOFTWARE (100% work use) ---")
+    for name, amt in software['items']:
+        p(f"  {name}: ${dollars(amt):,.2f}")
+    p(f"  SOFTWARE TOTAL: ${dollars(software['total']):,.2f}")
+
+    p("\n--- OTHER THOMAS DEDUCTIONS ---")
+    cleaning = other['cleaning']
+    home_office_pct = Decimal(cleaning['office_m2']) / Decimal(cleaning['home_m2'])
+    p(f"Internet (GROSS):     ${dollars(other['internet']):,.2f}")
+    p(f"Productivity Tools:   ${dollars(other['productivity']):,.2f}")
+    p(f"Audible (6 × $16.45): ${dollars(other['audible']):,.2f}")
+    p(f"Donations:            ${dollars(other['donations']):,.2f}")
+    p(f"Cleaning: {cleaning['visits']} × ${dollars(to_cents(cleaning['cost']))} = ${dollars(other['cleaning_total']):,.2f}")
+    p(f"  × {home_office_pct:.4f} ({cleaning['office_m2']}m²/{cleaning['home_m2']}m²) = ${dollars(other['thomas_cleaning']):,.2f}")
+
+    p(f"\n{'='*50}")
+    p(f"THOMAS DEDUCTIONS (GROSS): ${dollars(thomas_deductions):,.2f}")
+    p(f"{'='*50}")
+
+    p("\n--- ISABELLE DEDUCTIONS ---")
+    p(f"WFH Fixed Rate:       ${dollars(wfh['isabelle_wfh']):,.2f}")
+    p(f"Streaming (GROSS):    ${dollars(isabelle['streaming']):,.2f}")
+    p(f"Conferences:          ${dollars(isabelle['conferences']):,.2f}")
+    p(f"Prof Reading (GROSS): ${dollars(isabelle['reading']):,.2f}")
+    p(f"Donations:            ${dollars(isabelle['donations']):,.2f}")
+
+    p(f"\n{'='*50}")
+    p(f"ISABELLE DEDUCTIONS (GROSS): ${dollars(isabelle['total']):,.2f}")
+    p(f"{'='*50}")
+
+    p(f"\n{'='*70}")
+    p(f"COMBINED DEDUCTIONS (GROSS): ${dollars(combined_deductions):,.2f}")
+    p(f"{'='*70}")
+
+    p("\n--- CCS THRESHOLD CHECK ---")
+    work_use = ccs['work_use']
+    p(f"\nAdjusted deductions (with work-use %):")
+    p(f"  Thomas Internet: ${dollars(other['internet'])} × {_percent(work_use['thomas_internet'])}% = ${dollars(ccs['thomas_internet_adj'])}")
+    p(f"  Isabelle Streaming: ${dollars(isabelle['streaming'])} × {_percent(work_use['isabelle_streaming'])}% = ${dollars(ccs['isabelle_streaming_adj'])}")
+    p(f"  Isabelle Reading: ${dollars(isabelle['reading'])} × {_percent(work_use['isabelle_reading'])}% = ${dollars(ccs['isabelle_reading_adj'])}")
+
+    p(f"\nThomas adjusted deductions:   ${dollars(ccs['thomas_deductions_adj']):,.2f}")
+    p(f"Isabelle adjusted deductions: ${dollars(ccs['isabelle_deductions_adj']):,.2f}")
+
+    p(f"\nThomas taxable:   ${dollars(income['thomas_income']):,.2f} - ${dollars(ccs['thomas_deductions_adj']):,.2f} = ${dollars(ccs['thomas_taxable']):,.2f}")
+    p(f"Isabelle taxable: ${dollars(income['isabelle_income']):,.2f} - ${dollars(ccs['isabelle_deductions_adj']):,.2f} = ${dollars(ccs['isabelle_taxable']):,.2f}")
+    p(f"Combined taxable: ${dollars(ccs['combined_taxable']):,.2f}")
+
+    p(f"\nCCS Threshold: ${dollars(ccs['ccs_threshold']):,.2f}")
+    p(f"Margin:        ${dollars(ccs['margin']):,.2f} {ccs['status']}")
+
+    p("\n--- DIVISION 293 CHECK ---")
+    p(f"Thomas taxable income: ${dollars(ccs['thomas_taxable']):,.2f}")
+    p(f"Thomas super ({_percent(div293['super_rate'])}%):  ${dollars(div293['thomas_super_est']):,.2f}")
+    p(f"Thomas DIV293 income:  ${dollars(div293['thomas_div293']):,.2f}")
+    p(f"DIV293 threshold:      ${dollars(div293['div293_threshold']):,.2f}")
+    if div293['excess'] is not None:
+        p(f"⚠️  EXCEEDS by ${dollars(div293['excess']):,.2f}")
+        p(f"Est DIV293 tax: ${dollars(div293['div293_tax']):,.2f}")
+    else:
+        p(f"✓ Below threshold")
+
+    # ========================================================================
+    # ISSUE: INTERNET + WFH FIXED RATE
+    # ========================================================================
+    p("\n" + "=" * 70)
+    p("⚠️  CRITICAL ISSUE: INTERNET + WFH FIXED RATE")
+    p("=" * 70)
+    p("""
 ATO RULE: Fixed rate (70c/hr) INCLUDES:
   - Home internet
   - Mobile phone
@@ -288,20 +513,52 @@ OPTIONS FOR ACCOUNTANT:
 NOTE: Equipment CAN still be claimed separately from Fixed Rate
 """)
 
-# ============================================================================
-# FINAL SUMMARY
-# ============================================================================
-print("\n" + "=" * 70)
-print("FINAL VERIFIED FIGURES")
-print("=" * 70)
+    # ========================================================================
+    # FINAL SUMMARY
+    # ========================================================================
+    p("\n" + "=" * 70)
+    p("FINAL VERIFIED FIGURES")
+    p("=" * 70)
 
-print(f"""
+    p(f"""
                         Thomas          Isabelle        Combined
-Income                  ${thomas_income:>12,.2f}  ${isabelle_income:>12,.2f}  ${combined_income:>12,.2f}
-Deductions (GROSS)      ${thomas_deductions:>12,.2f}  ${isabelle_deductions:>12,.2f}  ${combined_deductions:>12,.2f}
-Deductions (ADJUSTED)   ${thomas_deductions_adj:>12,.2f}  ${isabelle_deductions_adj:>12,.2f}  ${thomas_deductions_adj + isabelle_deductions_adj:>12,.2f}
-Est Taxable Income      ${thomas_taxable:>12,.2f}  ${isabelle_taxable:>12,.2f}  ${combined_taxable:>12,.2f}
+Income                  ${dollars(income['thomas_income']):>12,.2f}  ${dollars(income['isabelle_income']):>12,.2f}  ${dollars(income['combined_income']):>12,.2f}
+Deductions (GROSS)      ${dollars(thomas_deductions):>12,.2f}  ${dollars(isabelle['total']):>12,.2f}  ${dollars(combined_deductions):>12,.2f}
+Deductions (ADJUSTED)   ${dollars(ccs['thomas_deductions_adj']):>12,.2f}  ${dollars(ccs['isabelle_deductions_adj']):>12,.2f}  ${dollars(ccs['thomas_deductions_adj'] + ccs['isabelle_deductions_adj']):>12,.2f}
+Est Taxable Income      ${dollars(ccs['thomas_taxable']):>12,.2f}  ${dollars(ccs['isabelle_taxable']):>12,.2f}  ${dollars(ccs['combined_taxable']):>12,.2f}
 
-CCS Threshold: $367,563.00
-CCS Margin:    ${margin:>,.2f} ({status} THRESHOLD)
+CCS Threshold: ${dollars(ccs['ccs_threshold']):,.2f}
+CCS Margin:    ${dollars(ccs['margin']):>,.2f} ({ccs['status']} THRESHOLD)
 """)
+    return "\n".join(out)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Verify FY24-25 household tax calculations')
+    parser.add_argument('--data', type=Path, default=DATA_PATH,
+                        help=f'Household inputs JSON (default: {DATA_PATH.name})')
+    parser.add_argument('--cache', type=Path, default=CACHE_PATH,
+                        help=f'Node cache file (default: {CACHE_PATH.name})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Recompute every node and leave the cache untouched')
+    parser.add_argument('--explain', action='store_true',
+                        help='List recomputed and cached nodes on stderr')
+    args = parser.parse_args()
+
+    data = load_inputs(args.data)
+    cache = None if args.no_cache else load_cache(args.cache)
+    results, recomputed = run(data, cache)
+    if cache is not None and recomputed:
+        save_cache(cache, args.cache)
+
+    print(render(results))
+
+    if args.explain:
+        cached = [node.name for node in NODES if node.name not in recomputed]
+        print(f"Recomputed: {', '.join(recomputed) or 'none'}", file=sys.stderr)
+        print(f"From cache: {', '.join(cached) or 'none'}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())